@@ -0,0 +1,16 @@
+"""Benchmark suite for data and engine hot paths."""
+
+from longarc.bench.cases import SIZE_PRESETS, BenchCase, default_cases, parse_size, parse_sizes
+from longarc.bench.runner import BenchResult, Comparison, compare, run_suite
+
+__all__ = [
+    "SIZE_PRESETS",
+    "BenchCase",
+    "BenchResult",
+    "Comparison",
+    "compare",
+    "default_cases",
+    "parse_size",
+    "parse_sizes",
+    "run_suite",
+]
@@ -0,0 +1,265 @@
+"""Benchmark cases for data-store, provider and CLI hot paths."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+from longarc.core.metrics import MetricsRegistry
+from longarc.data.providers.local_parquet import generate_synthetic_bars
+from longarc.data.providers.polygon import PolygonProvider
+from longarc.data.store import (
+    BAR_SCHEMA,
+    BarCache,
+    mark_raw,
+    read_bars,
+    read_bars_table,
+    write_bars,
+)
+from longarc.engine.robustness import RobustnessSpec, run_robustness
+from longarc.storage.runs import RunArtifacts
+
+POLYGON_FIXTURE = "polygon_aggs_1m.json"
+POLYGON_PAGE_ROWS = 50_000
+METRIC_OPS = 100_000
+ROBUSTNESS_PATHS = 10_000
+ROBUSTNESS_BARS = 5_040  # 20 years of daily bars
+
+_SIZE_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+SIZE_PRESETS: dict[str, tuple[int, ...]] = {
+    "quick": (1_000, 100_000),
+    "full": (1_000, 100_000, 10_000_000),
+}
+
+
+def parse_size(value: str) -> int:
+    """Parse row counts such as ``1000``, ``100k`` or ``10m``."""
+    normalized = value.strip().lower()
+    multiplier = _SIZE_SUFFIXES.get(normalized[-1:], 1)
+    digits = normalized[:-1] if multiplier != 1 else normalized
+    try:
+        rows = int(float(digits) * multiplier)
+    except ValueError as exc:
+        raise ValueError(
+            f"Invalid benchmark size {value!r}. Expected e.g. 1k, 100k, 10m."
+        ) from exc
+    if rows < 1:
+        raise ValueError(f"Benchmark size must be positive, got {value!r}")
+    return rows
+
+
+def parse_sizes(spec: str) -> list[int]:
+    """Parse a preset name (``quick``, ``full``) or comma-separated sizes like ``1k,10m``."""
+    preset = SIZE_PRESETS.get(spec.strip().lower())
+    if preset is not None:
+        return list(preset)
+    return [parse_size(value) for value in spec.split(",") if value.strip()]
+
+
+def size_label(rows: int) -> str:
+    for suffix, multiplier in sorted(_SIZE_SUFFIXES.items(), key=lambda item: -item[1]):
+        if rows >= multiplier and rows % multiplier == 0:
+            return f"{rows // multiplier}{suffix}"
+    return str(rows)
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """A named measurement.
+
+    ``prepare`` runs untimed inside a scratch directory and returns the callable that is
+    timed; ``rows`` is used to report throughput.
+    """
+
+    name: str
+    rows: int
+    prepare: Callable[[Path], Callable[[], object]]
+
+
+def _minute_bars(rows: int) -> list[dict[str, object]]:
+    start = datetime(2020, 1, 1, tzinfo=UTC)
+    close = 100.0 + np.cumsum(np.random.default_rng(rows).normal(0.0, 0.1, rows))
+    return [
+        {
+            "timestamp": start + timedelta(minutes=idx),
+            "open": price - 0.05,
+            "high": price + 0.1,
+            "low": price - 0.1,
+            "close": price,
+            "volume": 1_000.0 + idx % 500,
+        }
+        for idx, price in enumerate(close.tolist())
+    ]
+
+
+def _write_bar_file(base: Path, rows: int) -> None:
+    """Write a ``rows``-bar file directly from arrays (fast setup for read cases)."""
+    start = np.datetime64("2020-01-01T00:00", "us")
+    timestamps = start + np.arange(rows, dtype=np.int64) * np.timedelta64(1, "m")
+    close = 100.0 + np.cumsum(np.random.default_rng(rows).normal(0.0, 0.1, rows))
+    table = pa.table(
+        {
+            "timestamp": pa.array(timestamps, type=BAR_SCHEMA.field("timestamp").type),
+            "open": close - 0.05,
+            "high": close + 0.1,
+            "low": close - 0.1,
+            "close": close,
+            "volume": np.full(rows, 1_000.0),
+        },
+        schema=BAR_SCHEMA,
+    )
+    path = base / "BENCH" / "1m" / "bars.parquet"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(mark_raw(table), path)
+
+
+def _store_cases(rows: int) -> list[BenchCase]:
+    label = size_label(rows)
+
+    def prepare_write(scratch: Path) -> Callable[[], object]:
+        bars = _minute_bars(rows)
+        target = scratch / "written"
+
+        def run() -> object:
+            shutil.rmtree(target, ignore_errors=True)
+            return write_bars(target, "BENCH", "1m", bars)
+
+        return run
+
+    def prepare_read(scratch: Path) -> Callable[[], object]:
+        _write_bar_file(scratch, rows)
+        return lambda: read_bars(scratch, "BENCH", "1m")
+
+    def prepare_read_table(scratch: Path) -> Callable[[], object]:
+        _write_bar_file(scratch, rows)
+        return lambda: read_bars_table(scratch, "BENCH", "1m")
+
+    def prepare_read_cached(scratch: Path) -> Callable[[], object]:
+        _write_bar_file(scratch, rows)
+        cache = BarCache(scratch / "cache")
+        return lambda: read_bars_table(scratch, "BENCH", "1m", cache=cache)
+
+    return [
+        BenchCase(f"store.write_bars[{label}]", rows, prepare_write),
+        BenchCase(f"store.read_bars[{label}]", rows, prepare_read),
+        BenchCase(f"store.read_bars_table[{label}]", rows, prepare_read_table),
+        BenchCase(f"store.bar_cache_read[{label}]", rows, prepare_read_cached),
+    ]
+
+
+def _polygon_case(fixtures: Path) -> BenchCase:
+    def prepare(_: Path) -> Callable[[], object]:
+        sample: dict[str, Any] = json.loads((fixtures / POLYGON_FIXTURE).read_text("utf-8"))
+        rows = sample["results"]
+        repeats = -(-POLYGON_PAGE_ROWS // len(rows))
+        page = {**sample, "resultsCount": POLYGON_PAGE_ROWS}
+        page["results"] = (rows * repeats)[:POLYGON_PAGE_ROWS]
+        payload = json.dumps(page).encode("utf-8")
+        provider = PolygonProvider(api_key="bench")
+
+        def run() -> object:
+            return provider._bars_from_payload(json.loads(payload))
+
+        return run
+
+    name = f"polygon.decode[{size_label(POLYGON_PAGE_ROWS)}]"
+    return BenchCase(name, POLYGON_PAGE_ROWS, prepare)
+
+
+def _synthetic_case(rows: int) -> BenchCase:
+    end = datetime(2020, 1, 1) + timedelta(minutes=rows - 1)
+
+    def prepare(_: Path) -> Callable[[], object]:
+        return lambda: generate_synthetic_bars("BENCH", "1m", "2020-01-01", end.isoformat())
+
+    return BenchCase(f"synthetic.generate[{size_label(rows)}]", rows, prepare)
+
+
+def _metrics_cases() -> list[BenchCase]:
+    """Per-call cost of the hot-path metric updates; divide median_s by rows for ns/op."""
+
+    def prepare_inc(_: Path) -> Callable[[], object]:
+        counter = MetricsRegistry().counter("bench_total", "Benchmark counter.")
+
+        def run() -> object:
+            inc = counter.inc
+            for _ in range(METRIC_OPS):
+                inc()
+            return counter.value
+
+        return run
+
+    def prepare_observe(_: Path) -> Callable[[], object]:
+        histogram = MetricsRegistry().histogram("bench_seconds", "Benchmark histogram.")
+
+        def run() -> object:
+            observe = histogram.observe
+            for _ in range(METRIC_OPS):
+                observe(0.003)
+            return histogram.count
+
+        return run
+
+    label = size_label(METRIC_OPS)
+    return [
+        BenchCase(f"metrics.counter_inc[{label}]", METRIC_OPS, prepare_inc),
+        BenchCase(f"metrics.histogram_observe[{label}]", METRIC_OPS, prepare_observe),
+    ]
+
+
+def _robustness_case() -> BenchCase:
+    """``ROBUSTNESS_PATHS`` block-bootstrap paths over a 20-year daily run, all cores."""
+
+    def prepare(scratch: Path) -> Callable[[], object]:
+        rng = np.random.default_rng(ROBUSTNESS_BARS)
+        equity = 100_000.0 * np.cumprod(1.0 + rng.normal(3e-4, 0.01, ROBUSTNESS_BARS))
+        artifacts = RunArtifacts(
+            run_id="bench",
+            path=scratch,
+            manifest={
+                "inputs": {
+                    "config": {
+                        "portfolio": {"initial_cash": 100_000.0},
+                        "universe": {"timeframe": "1d"},
+                    }
+                }
+            },
+            equity=pa.table({"equity": equity}),
+            trades=pa.table({}),
+            metrics={},
+        )
+        spec = RobustnessSpec(paths=ROBUSTNESS_PATHS, seed=7)
+        return lambda: run_robustness(artifacts, spec)
+
+    name = f"robustness.block_bootstrap[{size_label(ROBUSTNESS_PATHS)}]"
+    return BenchCase(name, ROBUSTNESS_PATHS, prepare)
+
+
+def _cli_cold_start_case() -> BenchCase:
+    def prepare(_: Path) -> Callable[[], object]:
+        command = [sys.executable, "-m", "longarc.cli", "--help"]
+        return lambda: subprocess.run(command, check=True, capture_output=True)
+
+    return BenchCase("cli.cold_start", 1, prepare)
+
+
+def default_cases(sizes: list[int], fixtures: Path) -> list[BenchCase]:
+    cases: list[BenchCase] = []
+    for rows in sizes:
+        cases.extend(_store_cases(rows))
+        cases.append(_synthetic_case(rows))
+    cases.append(_polygon_case(fixtures))
+    cases.extend(_metrics_cases())
+    cases.append(_robustness_case())
+    cases.append(_cli_cold_start_case())
+    return cases
@@ -0,0 +1,178 @@
+"""Run benchmark cases, record results per commit/machine, and compare to a baseline."""
+
+from __future__ import annotations
+
+import gc
+import hashlib
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Sequence
+
+from longarc.bench.cases import BenchCase
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    name: str
+    rows: int
+    repeat: int
+    min_s: float
+    median_s: float
+    mean_s: float
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.median_s if self.median_s > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline_s: float
+    current_s: float
+    ratio: float
+    regressed: bool
+
+
+def machine_info() -> dict[str, Any]:
+    """Host description plus a short stable ``id`` used to key result files."""
+    info: dict[str, Any] = {
+        "hostname": platform.node(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+    fingerprint = "|".join(
+        str(info[key]) for key in ("hostname", "machine", "processor", "cpu_count")
+    )
+    info["id"] = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:12]
+    return info
+
+
+def _git(*args: str) -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", *args], check=True, capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip()
+
+
+def commit_info() -> dict[str, Any]:
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {"sha": _git("rev-parse", "HEAD") or "unknown", "dirty": bool(status)}
+
+
+def select_cases(cases: Sequence[BenchCase], patterns: Sequence[str] | None) -> list[BenchCase]:
+    if not patterns:
+        return list(cases)
+    return [case for case in cases if any(fnmatch(case.name, pattern) for pattern in patterns)]
+
+
+def run_case(case: BenchCase, repeat: int, scratch: Path) -> BenchResult:
+    """Time ``case`` ``repeat`` times after one untimed warm-up call."""
+    case_dir = scratch / case.name.replace("[", "_").replace("]", "")
+    case_dir.mkdir(parents=True, exist_ok=True)
+    func = case.prepare(case_dir)
+    func()
+    timings: list[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return BenchResult(
+        name=case.name,
+        rows=case.rows,
+        repeat=repeat,
+        min_s=min(timings),
+        median_s=statistics.median(timings),
+        mean_s=statistics.fmean(timings),
+    )
+
+
+def run_suite(cases: Sequence[BenchCase], repeat: int = 5) -> dict[str, Any]:
+    """Run ``cases`` in a scratch directory and return a JSON-compatible results document."""
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="longarc-bench-") as scratch:
+        for case in cases:
+            result = run_case(case, repeat, Path(scratch))
+            LOGGER.info(
+                "%-36s median=%.6fs min=%.6fs rows/s=%.0f",
+                result.name,
+                result.median_s,
+                result.min_s,
+                result.rows_per_s,
+            )
+            results[result.name] = {**asdict(result), "rows_per_s": result.rows_per_s}
+    return {
+        "commit": commit_info(),
+        "machine": machine_info(),
+        "created_at": datetime.now(tz=UTC).isoformat(),
+        "results": results,
+    }
+
+
+def results_path(output_dir: str | Path, document: dict[str, Any]) -> Path:
+    """``<output_dir>/<machine id>/<commit sha>[-dirty].json``."""
+    commit = document["commit"]
+    name = commit["sha"][:12] + ("-dirty" if commit["dirty"] else "")
+    path: Path = Path(output_dir) / document["machine"]["id"] / f"{name}.json"
+    return path
+
+
+def write_results(path: str | Path, document: dict[str, Any]) -> Path:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(document, indent=2, sort_keys=True), encoding="utf-8")
+    return target
+
+
+def compare(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float,
+) -> list[Comparison]:
+    """Compare median timings of cases present in both documents.
+
+    A case regresses when it is more than ``threshold`` (fractional) slower than baseline.
+    """
+    if current["machine"]["id"] != baseline["machine"]["id"]:
+        LOGGER.warning(
+            "Baseline was recorded on a different machine (%s vs %s); timings may not compare",
+            baseline["machine"]["id"],
+            current["machine"]["id"],
+        )
+    comparisons: list[Comparison] = []
+    for name, result in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+        baseline_s = float(reference["median_s"])
+        current_s = float(result["median_s"])
+        ratio = current_s / baseline_s if baseline_s > 0 else 1.0
+        comparisons.append(
+            Comparison(
+                name=name,
+                baseline_s=baseline_s,
+                current_s=current_s,
+                ratio=ratio,
+                regressed=ratio > 1.0 + threshold,
+            )
+        )
+    return comparisons
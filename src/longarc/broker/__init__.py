@@ -0,0 +1,5 @@
+"""Broker adapters."""
+
+from longarc.broker.paper_sim import PaperSimBroker
+
+__all__ = ["PaperSimBroker"]
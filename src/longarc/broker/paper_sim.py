@@ -0,0 +1,20 @@
+"""Pure local paper broker (no external API)."""
+
+from __future__ import annotations
+
+from longarc.engine.portfolio import FloatArray, PortfolioSimulator, PortfolioState, StepResult
+
+
+class PaperSimBroker:
+    """Fill market orders at the latest marked close plus slippage and fees.
+
+    The broker owns the simulated account; engines plan orders against :attr:`state` and
+    submit quantities through :meth:`execute`.
+    """
+
+    def __init__(self, simulator: PortfolioSimulator, n_symbols: int) -> None:
+        self._simulator = simulator
+        self.state: PortfolioState = simulator.initial_state(n_symbols)
+
+    def execute(self, order_qty: FloatArray) -> StepResult:
+        return self._simulator.fill(self.state, order_qty)
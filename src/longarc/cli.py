@@ -3,15 +3,62 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import json
 import logging
 import os
+import sys
+import time
+from contextlib import ExitStack
+from dataclasses import asdict
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Callable, cast
 
+from longarc.bench.cases import SIZE_PRESETS, default_cases, parse_sizes
+from longarc.bench.runner import (
+    compare,
+    results_path,
+    run_suite,
+    select_cases,
+    write_results,
+)
 from longarc.core.config import load_config
-from longarc.core.logging import configure_logging
+from longarc.core.logging import configure_logging, shutdown_logging
+from longarc.core.metrics import REGISTRY
+from longarc.core.profiling import Profiler, span
 from longarc.data.providers.registry import get_provider
-from longarc.data.store import read_bars
+from longarc.data.quality import CALENDARS, QualityChecks, verify_store
+from longarc.data.query import (
+    AGGREGATIONS,
+    QUERY_FORMATS,
+    BarQuery,
+    parse_aggregation,
+    query_bars,
+    write_query,
+)
+from longarc.data.store import (
+    ADJUSTMENTS,
+    BAR_CACHE_ENV,
+    BAR_CACHE_MAX_BYTES_ENV,
+    COMPRESSIONS,
+    FLOAT_ENCODINGS,
+    LEGACY_BASES,
+    WriteOptions,
+    compact_bars,
+    map_datasets,
+    migrate_bars,
+    read_bars,
+    select_datasets,
+    write_actions,
+)
+from longarc.engine.backtest import parse_bound, run_backtest_cached
+from longarc.engine.robustness import METHODS, RobustnessSpec, run_robustness
+from longarc.engine.trading_engine import parse_speed, run_paper, run_paper_sim
+from longarc.report.run_report import REPORT_FORMATS, write_report
+from longarc.storage.journal import JournalWriter
+from longarc.storage.runs import JOURNAL_DIR, RunStore
+from longarc.storage.snapshots import SnapshotStore
 
 LOGGER = logging.getLogger(__name__)
 
@@ -33,12 +80,15 @@ def _data_download(args: argparse.Namespace) -> int:
             result.timeframe,
             result.input_rows,
             result.total_rows,
+            extra={"symbol": result.symbol, "rows": result.input_rows},
         )
     return 0
 
 
 def _data_show_latest(args: argparse.Namespace) -> int:
-    bars = read_bars(base_path=args.data_path, symbol=args.symbol, timeframe=args.timeframe)
+    bars = read_bars(
+        base_path=args.data_path, symbol=args.symbol, timeframe=args.timeframe, adjust=args.adjust
+    )
     if not bars:
         LOGGER.info(
             "No bars found for symbol=%s timeframe=%s in %s",
@@ -60,32 +110,442 @@ def _data_show_latest(args: argparse.Namespace) -> int:
     return 0
 
 
+def _data_add_action(args: argparse.Namespace) -> int:
+    if args.split is not None:
+        action = {"ex_date": args.ex_date, "kind": "split", "ratio": args.split}
+    else:
+        action = {"ex_date": args.ex_date, "kind": "dividend", "cash": args.dividend}
+    result = write_actions(args.data_path, args.symbol, [action])
+    LOGGER.info(
+        "Recorded %s %s on %s: total_actions=%s",
+        args.symbol.upper(),
+        action["kind"],
+        args.ex_date,
+        result.total_rows,
+        extra={"symbol": args.symbol.upper(), "action": action},
+    )
+    return 0
+
+
+def _data_verify(args: argparse.Namespace) -> int:
+    checks = QualityChecks(
+        calendar=args.calendar,
+        timezone=args.timezone,
+        holidays=tuple(args.holidays),
+        volume_spike=args.volume_spike,
+        stale_bars=args.stale_bars,
+    )
+    report = verify_store(
+        args.data_path,
+        checks,
+        symbols=args.symbols,
+        timeframes=args.timeframes,
+        workers=args.workers,
+    )
+    for item in report.datasets:
+        if item.status == "ok":
+            continue
+        LOGGER.warning(
+            "Data quality %s for %s %s: %s",
+            item.status,
+            item.symbol,
+            item.timeframe,
+            item.error
+            or ", ".join(
+                f"{name}={value}"
+                for name, value in asdict(item).items()
+                if isinstance(value, int) and value and name != "rows"
+            ),
+            extra={"symbol": item.symbol, "timeframe": item.timeframe, "status": item.status},
+        )
+    summary = report.summary()
+    if args.output:
+        table_path, summary_path = report.write(args.output)
+        LOGGER.info("Quality report written to %s and %s", table_path, summary_path)
+    LOGGER.info(
+        "Verified datasets=%s rows=%s ok=%s warn=%s fail=%s",
+        summary["datasets"],
+        summary["rows"],
+        summary["status"]["ok"],
+        summary["status"]["warn"],
+        summary["status"]["fail"],
+        extra={"quality": summary},
+    )
+    return 1 if summary["status"]["fail"] else 0
+
+
+def _data_query(args: argparse.Namespace) -> int:
+    query = BarQuery(
+        symbols=tuple(args.symbols or ()),
+        timeframes=tuple(args.timeframes or ()),
+        columns=tuple(args.columns or ()),
+        start=parse_bound(args.start) if args.start else None,
+        end=parse_bound(args.end, inclusive_end=True) if args.end else None,
+        adjust=args.adjust,
+        group_by=tuple(args.group_by),
+        aggregations=tuple(parse_aggregation(spec) for spec in args.agg or ()),
+        every=args.every,
+        batch_size=args.batch_size,
+    )
+    with span("data.query") as timing:
+        reader = query_bars(args.data_path, query)
+        if args.output == "-":
+            rows = write_query(reader, sys.stdout.buffer, args.format)
+            sys.stdout.buffer.flush()
+        else:
+            Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+            rows = write_query(reader, args.output, args.format)
+        timing.rows = rows
+    LOGGER.info(
+        "Query wrote rows=%s format=%s to %s",
+        rows,
+        args.format,
+        "stdout" if args.output == "-" else args.output,
+        extra={"rows": rows},
+    )
+    return 0
+
+
+def _data_migrate(args: argparse.Namespace) -> int:
+    datasets = select_datasets(args.data_path, args.symbols, args.timeframes)
+    with span("data.migrate", datasets=len(datasets)) as timing:
+        results = map_datasets(
+            migrate_bars, args.data_path, datasets, args.basis, workers=args.workers
+        )
+        timing.rows = sum(result.input_rows for result in results)
+    migrated = sum(1 for result in results if result.input_rows)
+    LOGGER.info(
+        "Migrated datasets=%s rows=%s basis=%s (already raw: %s)",
+        migrated,
+        timing.rows,
+        args.basis,
+        len(results) - migrated,
+    )
+    return 0
+
+
+def _data_compact(args: argparse.Namespace) -> int:
+    options = WriteOptions(
+        compression=args.compression,
+        compression_level=args.compression_level,
+        row_group_size=args.row_group_size,
+        float_encoding=args.float_encoding,
+        sorting_metadata=not args.no_sorting_metadata,
+    )
+    datasets = select_datasets(args.data_path, args.symbols, args.timeframes)
+    with span("data.compact", datasets=len(datasets)) as timing:
+        results = map_datasets(
+            compact_bars, args.data_path, datasets, options, args.scan_repeat, workers=args.workers
+        )
+        timing.rows = sum(result.rows for result in results)
+    for result in results:
+        LOGGER.info(
+            "Compacted %s %s rows=%s bytes=%s->%s row_groups=%s->%s scan_ms=%.2f->%.2f",
+            result.symbol,
+            result.timeframe,
+            result.rows,
+            result.bytes_before,
+            result.bytes_after,
+            result.row_groups_before,
+            result.row_groups_after,
+            result.scan_ms_before,
+            result.scan_ms_after,
+            extra={"symbol": result.symbol, "compact": asdict(result)},
+        )
+    before = sum(result.bytes_before for result in results)
+    after = sum(result.bytes_after for result in results)
+    scan_before = sum(result.scan_ms_before for result in results)
+    scan_after = sum(result.scan_ms_after for result in results)
+    LOGGER.info(
+        "Compacted datasets=%s bytes=%s->%s (%.1f%%) scan_ms=%.1f->%.1f",
+        len(results),
+        before,
+        after,
+        (after / before - 1.0) * 100.0 if before else 0.0,
+        scan_before,
+        scan_after,
+        extra={"options": asdict(options)},
+    )
+    return 0
+
+
 def _backtest(args: argparse.Namespace) -> int:
-    load_config(Path(args.config))
-    LOGGER.info("backtest not implemented yet")
+    config = load_config(Path(args.config))
+    runs = RunStore(args.runs_path)
+    artifacts, cache_hit = run_backtest_cached(
+        config, runs, start=args.start, end=args.end, use_cache=not args.no_cache
+    )
+    metrics = artifacts.metrics
+    LOGGER.info(
+        "Backtest run_id=%s cache_hit=%s total_return=%.4f max_drawdown=%.4f trades=%s path=%s",
+        artifacts.run_id,
+        cache_hit,
+        metrics["total_return"],
+        metrics["max_drawdown"],
+        metrics["trade_count"],
+        artifacts.path,
+        extra={"run_id": artifacts.run_id, "cache_hit": cache_hit},
+    )
+    return 0
+
+
+def _robustness(args: argparse.Namespace) -> int:
+    runs = RunStore(args.runs_path)
+    if not runs.exists(args.run_id):
+        LOGGER.error("Run %s not found under %s", args.run_id, args.runs_path)
+        return 1
+
+    spec = RobustnessSpec(
+        paths=args.paths,
+        method=args.method,
+        block_size=args.block_size,
+        slippage_sigma=args.slippage_sigma,
+        seed=args.seed,
+        batch_size=args.batch_size,
+    )
+    result = run_robustness(runs.load(args.run_id), spec, workers=args.workers)
+    summary = result.summary()
+    runs.write_table(args.run_id, "robustness", result.to_table())
+    runs.write_json(
+        args.run_id,
+        "robustness",
+        {"spec": asdict(spec), "summary": summary},
+    )
+    LOGGER.info(
+        "Robustness run_id=%s paths=%s method=%s max_drawdown_p5=%.4f sharpe_p50=%.4f "
+        "terminal_equity_p5=%.2f",
+        args.run_id,
+        spec.paths,
+        spec.method,
+        summary["max_drawdown"]["p5"],
+        summary["sharpe"]["p50"],
+        summary["terminal_equity"]["p5"],
+        extra={"run_id": args.run_id},
+    )
     return 0
 
 
 def _paper_sim_run(args: argparse.Namespace) -> int:
-    load_config(Path(args.config))
-    LOGGER.info("paper-sim run not implemented yet")
+    config = load_config(Path(args.config))
+    run_id = args.run_id or f"ps-{datetime.now(tz=UTC):%Y%m%dT%H%M%S%f}"
+    configs = config.strategy_configs()
+    # One run per hosted strategy; a single strategy keeps the plain run id.
+    run_ids = {
+        strategy_id: run_id if len(configs) == 1 else f"{run_id}-{strategy_id}"
+        for strategy_id in configs
+    }
+    runs = RunStore(args.runs_path)
+    with ExitStack() as stack:
+        journals = {
+            strategy_id: stack.enter_context(
+                runs.open_journal(strategy_run_id, fsync=args.journal_fsync)
+            )
+            for strategy_id, strategy_run_id in run_ids.items()
+        }
+        result = asyncio.run(
+            run_paper_sim(
+                config,
+                start=args.start,
+                end=args.end,
+                speed=parse_speed(args.speed),
+                concurrency=args.concurrency,
+                steps=args.steps,
+                journals=journals,
+                strategy_workers=args.strategy_workers,
+            )
+        )
+    cycles = result.cycles_table()
+    for strategy_id, strategy_run_id in run_ids.items():
+        summary = result.summaries[strategy_id]
+        manifest = {
+            "run_id": strategy_run_id,
+            "mode": "paper_sim",
+            "strategy_id": strategy_id,
+            "created_at": datetime.now(tz=UTC).isoformat(),
+            "inputs": {
+                "config": configs[strategy_id].model_dump(mode="json"),
+                "start": args.start,
+                "end": args.end,
+                "steps": args.steps,
+                "speed": args.speed,
+            },
+        }
+        metrics = {**summary.metrics, "latency": result.latency}
+        runs.save(strategy_run_id, manifest, summary.equity, summary.trades, metrics)
+        runs.write_table(strategy_run_id, "cycles", cycles)
+        LOGGER.info(
+            "Paper-sim run_id=%s cycles=%s trades=%s p95_cycle_ms=%.3f bar_interval_ms=%.0f",
+            strategy_run_id,
+            len(result.cycles),
+            summary.metrics["trade_count"],
+            result.latency.get("p95_ms", 0.0),
+            result.latency["bar_interval_ms"],
+            extra={"run_id": strategy_run_id, "latency": result.latency},
+        )
     return 0
 
 
 def _paper_run(args: argparse.Namespace) -> int:
-    load_config(Path(args.config))
-    LOGGER.info("paper run not implemented yet")
+    config = load_config(Path(args.config))
+    if config.broker.adapter != "paper_sim":
+        LOGGER.error(
+            "Broker adapter %r is not implemented yet; only paper_sim is supported",
+            config.broker.adapter,
+        )
+        return 1
+
+    started = time.perf_counter()
+    journal_path = Path(args.state_path) / JOURNAL_DIR
+    strategy_ids = list(config.strategy_configs())
+    with ExitStack() as stack:
+        if len(strategy_ids) == 1:
+            journals = {
+                strategy_ids[0]: stack.enter_context(
+                    JournalWriter(journal_path, "paper", fsync=args.journal_fsync)
+                )
+            }
+        else:
+            journals = {
+                strategy_id: stack.enter_context(
+                    JournalWriter(
+                        journal_path / strategy_id,
+                        f"paper-{strategy_id}",
+                        fsync=args.journal_fsync,
+                    )
+                )
+                for strategy_id in strategy_ids
+            }
+        result = asyncio.run(
+            run_paper(
+                config,
+                SnapshotStore(args.state_path),
+                concurrency=args.concurrency,
+                journals=journals,
+                strategy_workers=args.strategy_workers,
+            )
+        )
+    first_cycle_ms = result.cycles[0].total_ms if result.cycles else 0.0
+    LOGGER.info(
+        "Paper run processed cycles=%s strategies=%s orders=%s elapsed_ms=%.1f "
+        "first_cycle_ms=%.3f",
+        len(result.cycles),
+        len(result.summaries),
+        sum(report.orders for report in result.cycles),
+        (time.perf_counter() - started) * 1000.0,
+        first_cycle_ms,
+    )
     return 0
 
 
 def _report(args: argparse.Namespace) -> int:
-    LOGGER.info("report generation not implemented yet for run_id=%s", args.run_id)
+    runs = RunStore(args.runs_path)
+    if not runs.exists(args.run_id):
+        LOGGER.error("Run %s not found under %s", args.run_id, args.runs_path)
+        return 1
+
+    document, metrics_path = write_report(runs, args.run_id, fmt=args.format)
+    LOGGER.info(
+        "Report for run %s written to %s (metrics: %s)",
+        args.run_id,
+        document,
+        metrics_path,
+        extra={"run_id": args.run_id},
+    )
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    sizes = parse_sizes(args.sizes)
+    cases = select_cases(default_cases(sizes, Path(args.fixtures)), args.case)
+    if not cases:
+        LOGGER.error("No benchmark cases match %s", args.case)
+        return 1
+
+    document = run_suite(cases, repeat=args.repeat)
+    written = write_results(results_path(args.output, document), document)
+    LOGGER.info("Benchmark results written to %s", written)
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        write_results(baseline_path, document)
+        LOGGER.info("Baseline updated at %s", baseline_path)
+        return 0
+    if not baseline_path.exists():
+        LOGGER.info("No baseline at %s; skipping comparison", baseline_path)
+        return 0
+
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    comparisons = compare(document, baseline, threshold=args.threshold)
+    for item in comparisons:
+        LOGGER.info(
+            "%-36s baseline=%.6fs current=%.6fs ratio=%.2f%s",
+            item.name,
+            item.baseline_s,
+            item.current_s,
+            item.ratio,
+            " REGRESSION" if item.regressed else "",
+        )
+    regressions = [item.name for item in comparisons if item.regressed]
+    if regressions:
+        LOGGER.error(
+            "%s benchmark(s) slower than baseline by more than %.0f%%: %s",
+            len(regressions),
+            args.threshold * 100,
+            ", ".join(regressions),
+        )
+        return 1
     return 0
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="longarc")
     parser.add_argument("--log-level", default="INFO", help="Logging level")
+    parser.add_argument(
+        "--log-debug-rate",
+        type=float,
+        default=None,
+        help="Limit each DEBUG message template to this many records per second",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Log timing spans and a per-span summary for this command",
+    )
+    parser.add_argument(
+        "--profile-pstats",
+        default=None,
+        help="Also run cProfile and write pstats to this path (implies --profile)",
+    )
+    parser.add_argument(
+        "--profile-collapsed",
+        default=None,
+        help="Write flamegraph-compatible collapsed span stacks to this path (implies --profile)",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        default=None,
+        help="Write Prometheus text-format metrics to this path when the command finishes",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus metrics at http://127.0.0.1:PORT/metrics while the command runs",
+    )
+    parser.add_argument(
+        "--bar-cache",
+        default=None,
+        help=(
+            "Share decoded bars across processes as memory-mapped Arrow files in this "
+            f"directory, e.g. /dev/shm/longarc (or set {BAR_CACHE_ENV})"
+        ),
+    )
+    parser.add_argument(
+        "--bar-cache-max-mb",
+        type=int,
+        default=None,
+        help="Evict least recently used bar cache entries above this size (default 2048)",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     data_parser = subparsers.add_parser("data", help="Data commands")
@@ -114,16 +574,214 @@ def build_parser() -> argparse.ArgumentParser:
     data_latest.add_argument("--symbol", required=True, help="Ticker symbol")
     data_latest.add_argument("--timeframe", default="1d", help="Bar timeframe: 1m, 1h, 1d")
     data_latest.add_argument("--data-path", default="./data", help="Base path for local data")
+    data_latest.add_argument(
+        "--adjust",
+        choices=ADJUSTMENTS,
+        default="splits",
+        help="Corporate-action adjustment applied to stored raw bars",
+    )
     data_latest.set_defaults(handler=_data_show_latest)
 
+    data_action = data_subparsers.add_parser(
+        "add-action", help="Record a split or cash dividend for a symbol"
+    )
+    data_action.add_argument("--symbol", required=True, help="Ticker symbol")
+    data_action.add_argument("--ex-date", required=True, help="Ex-date, e.g. 2024-06-10")
+    data_action_kind = data_action.add_mutually_exclusive_group(required=True)
+    data_action_kind.add_argument(
+        "--split", type=float, default=None, help="New shares per old share, e.g. 4 for 4-for-1"
+    )
+    data_action_kind.add_argument(
+        "--dividend", type=float, default=None, help="Cash dividend per share"
+    )
+    data_action.add_argument("--data-path", default="./data", help="Base path for local data")
+    data_action.set_defaults(handler=_data_add_action)
+
+    data_verify = data_subparsers.add_parser(
+        "verify", help="Check stored bars for gaps, duplicates and bad prices"
+    )
+    data_verify.add_argument("--data-path", default="./data", help="Base path for local data")
+    data_verify.add_argument("--symbols", nargs="+", default=None, help="Only these symbols")
+    data_verify.add_argument("--timeframes", nargs="+", default=None, help="Only these timeframes")
+    data_verify.add_argument(
+        "--calendar",
+        choices=sorted(CALENDARS),
+        default="us_equity",
+        help="Trading calendar used for gap detection",
+    )
+    data_verify.add_argument(
+        "--timezone",
+        default="America/New_York",
+        help="Exchange timezone for intraday session windows",
+    )
+    data_verify.add_argument(
+        "--holidays",
+        nargs="*",
+        default=[],
+        help="Extra market holidays (YYYY-MM-DD) to skip on top of the calendar's own",
+    )
+    data_verify.add_argument(
+        "--volume-spike",
+        type=float,
+        default=20.0,
+        help="Flag bars with volume above this multiple of the median",
+    )
+    data_verify.add_argument(
+        "--stale-bars",
+        type=int,
+        default=5,
+        help="Flag runs of at least this many identical OHLC bars",
+    )
+    data_verify.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPU count)"
+    )
+    data_verify.add_argument(
+        "--output",
+        default=None,
+        help="Directory for quality.parquet (per dataset) and quality.json (summary)",
+    )
+    data_verify.set_defaults(handler=_data_verify)
+
+    data_query = data_subparsers.add_parser(
+        "query", help="Stream a projected, filtered or aggregated slice of every stored dataset"
+    )
+    data_query.add_argument("--data-path", default="./data", help="Base path for local data")
+    data_query.add_argument("--symbols", nargs="+", default=None, help="Only these symbols")
+    data_query.add_argument("--timeframes", nargs="+", default=None, help="Only these timeframes")
+    data_query.add_argument(
+        "--columns",
+        nargs="+",
+        default=None,
+        help="Output columns (default: symbol timeframe timestamp open high low close volume)",
+    )
+    data_query.add_argument("--start", default=None, help="Inclusive start date or timestamp")
+    data_query.add_argument("--end", default=None, help="Inclusive end date or exclusive timestamp")
+    data_query.add_argument(
+        "--adjust",
+        choices=ADJUSTMENTS,
+        default="splits",
+        help="Corporate-action adjustment applied to stored raw bars",
+    )
+    data_query.add_argument(
+        "--agg",
+        nargs="+",
+        default=None,
+        help=f"Aggregations as column:func, func one of {', '.join(AGGREGATIONS)}",
+    )
+    data_query.add_argument(
+        "--group-by",
+        nargs="*",
+        choices=("symbol", "timeframe"),
+        default=["symbol", "timeframe"],
+        help="Aggregation keys (pass none for a single overall row)",
+    )
+    data_query.add_argument(
+        "--every", default=None, help="Also group aggregations into UTC time buckets: 1m, 1h, 1d"
+    )
+    data_query.add_argument("--format", choices=QUERY_FORMATS, default="arrow")
+    data_query.add_argument("--output", default="-", help="Output file, or - for stdout")
+    data_query.add_argument(
+        "--batch-size", type=int, default=65_536, help="Rows per streamed record batch"
+    )
+    data_query.set_defaults(handler=_data_query)
+
+    data_compact = data_subparsers.add_parser(
+        "compact", help="Rewrite stored bars with tuned Parquet encoding and layout"
+    )
+    data_compact.add_argument("--data-path", default="./data", help="Base path for local data")
+    data_compact.add_argument("--symbols", nargs="+", default=None, help="Only these symbols")
+    data_compact.add_argument(
+        "--timeframes", nargs="+", default=None, help="Only these timeframes"
+    )
+    data_compact.add_argument("--compression", choices=COMPRESSIONS, default="zstd")
+    data_compact.add_argument(
+        "--compression-level",
+        type=int,
+        default=None,
+        help="Codec level (zstd, lz4, gzip); default 3 for zstd",
+    )
+    data_compact.add_argument(
+        "--row-group-size", type=int, default=131_072, help="Rows per Parquet row group"
+    )
+    data_compact.add_argument(
+        "--float-encoding",
+        choices=FLOAT_ENCODINGS,
+        default="auto",
+        help="Float column encoding; auto picks dictionary or byte_stream_split per column",
+    )
+    data_compact.add_argument(
+        "--no-sorting-metadata",
+        action="store_true",
+        help="Do not record timestamp sort order in row-group metadata",
+    )
+    data_compact.add_argument(
+        "--scan-repeat", type=int, default=3, help="Full reads timed before and after"
+    )
+    data_compact.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPU count)"
+    )
+    data_compact.set_defaults(handler=_data_compact)
+
+    data_migrate = data_subparsers.add_parser(
+        "migrate", help="Convert bars stored before the raw store format"
+    )
+    data_migrate.add_argument("--data-path", default="./data", help="Base path for local data")
+    data_migrate.add_argument("--symbols", nargs="+", default=None, help="Only these symbols")
+    data_migrate.add_argument(
+        "--timeframes", nargs="+", default=None, help="Only these timeframes"
+    )
+    data_migrate.add_argument(
+        "--basis",
+        choices=LEGACY_BASES,
+        required=True,
+        help="What the stored prices are: splits (Polygon adjusted bars) or raw",
+    )
+    data_migrate.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPU count)"
+    )
+    data_migrate.set_defaults(handler=_data_migrate)
+
     backtest = subparsers.add_parser("backtest", help="Run backtest")
     backtest.add_argument(
         "--config",
         default="config/config.example.yaml",
         help="Path to config yaml",
     )
+    backtest.add_argument("--start", default=None, help="Inclusive start date, e.g. 2020-01-01")
+    backtest.add_argument("--end", default=None, help="Inclusive end date, e.g. 2024-01-01")
+    backtest.add_argument("--runs-path", default="./runs", help="Base path for run artifacts")
+    backtest.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-run the simulation instead of reusing a cached run",
+    )
     backtest.set_defaults(handler=_backtest)
 
+    robustness = subparsers.add_parser(
+        "robustness", help="Monte Carlo / bootstrap robustness analysis of a backtest run"
+    )
+    robustness.add_argument("--run-id", required=True, help="Backtest run identifier")
+    robustness.add_argument("--runs-path", default="./runs", help="Base path for run artifacts")
+    robustness.add_argument("--paths", type=int, default=10_000, help="Number of simulated paths")
+    robustness.add_argument(
+        "--method", default="block_bootstrap", choices=METHODS, help="Resampling method"
+    )
+    robustness.add_argument(
+        "--block-size", type=int, default=20, help="Bars per bootstrap block"
+    )
+    robustness.add_argument(
+        "--slippage-sigma",
+        type=float,
+        default=0.0,
+        help="Lognormal sigma applied to each bar's realized slippage (0 disables)",
+    )
+    robustness.add_argument("--seed", type=int, default=0, help="Root random seed")
+    robustness.add_argument("--batch-size", type=int, default=500, help="Paths per batch")
+    robustness.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPU count)"
+    )
+    robustness.set_defaults(handler=_robustness)
+
     paper_sim = subparsers.add_parser("paper-sim", help="Run local paper simulation")
     paper_sim_subparsers = paper_sim.add_subparsers(dest="paper_sim_command", required=True)
     paper_sim_run = paper_sim_subparsers.add_parser("run", help="Run paper simulation loop")
@@ -132,6 +790,33 @@ def build_parser() -> argparse.ArgumentParser:
         default="config/config.example.yaml",
         help="Path to config yaml",
     )
+    paper_sim_run.add_argument("--steps", type=int, default=None, help="Maximum cycles to run")
+    paper_sim_run.add_argument(
+        "--speed",
+        default="max",
+        help="Replay speed: realtime, max (as fast as possible), or a multiplier like 60x",
+    )
+    paper_sim_run.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Concurrent bar reads at load, and symbol chunks per cycle for blocking feeds",
+    )
+    paper_sim_run.add_argument(
+        "--strategy-workers",
+        type=int,
+        default=None,
+        help="Threads trading hosted strategies per cycle (default: CPU count)",
+    )
+    paper_sim_run.add_argument("--start", default=None, help="Inclusive start date")
+    paper_sim_run.add_argument("--end", default=None, help="Inclusive end date")
+    paper_sim_run.add_argument("--run-id", default=None, help="Run identifier (default: generated)")
+    paper_sim_run.add_argument("--runs-path", default="./runs", help="Base path for run artifacts")
+    paper_sim_run.add_argument(
+        "--journal-fsync",
+        default="cycle",
+        help="Audit journal fsync policy: cycle, shutdown, or events:N",
+    )
     paper_sim_run.set_defaults(handler=_paper_sim_run)
 
     paper = subparsers.add_parser("paper", help="Run paper trading")
@@ -142,21 +827,120 @@ def build_parser() -> argparse.ArgumentParser:
         default="config/config.example.yaml",
         help="Path to config yaml",
     )
+    paper_run.add_argument(
+        "--state-path", default="./state", help="Directory for warm-start state snapshots"
+    )
+    paper_run.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Concurrent bar reads at load, and symbol chunks per cycle for blocking feeds",
+    )
+    paper_run.add_argument(
+        "--strategy-workers",
+        type=int,
+        default=None,
+        help="Threads trading hosted strategies per cycle (default: CPU count)",
+    )
+    paper_run.add_argument(
+        "--journal-fsync",
+        default="cycle",
+        help="Audit journal fsync policy: cycle, shutdown, or events:N",
+    )
     paper_run.set_defaults(handler=_paper_run)
 
     report = subparsers.add_parser("report", help="Generate report")
     report.add_argument("--run-id", required=True, help="Run identifier")
+    report.add_argument("--runs-path", default="./runs", help="Base path for run artifacts")
+    report.add_argument(
+        "--format", default="html", choices=REPORT_FORMATS, help="Report document format"
+    )
     report.set_defaults(handler=_report)
 
+    bench = subparsers.add_parser("bench", help="Run benchmarks and compare against a baseline")
+    bench.add_argument(
+        "--sizes",
+        default="quick",
+        help=(
+            f"Store row counts: a preset ({', '.join(SIZE_PRESETS)}; full adds 10m) "
+            "or a comma-separated list, e.g. 1k,100k,10m"
+        ),
+    )
+    bench.add_argument(
+        "--case", nargs="*", default=None, help="Glob patterns selecting cases, e.g. 'store.*'"
+    )
+    bench.add_argument("--repeat", type=int, default=5, help="Timed repetitions per case")
+    bench.add_argument(
+        "--fixtures", default="benchmarks/fixtures", help="Directory with canned payloads"
+    )
+    bench.add_argument(
+        "--output", default="benchmarks/results", help="Directory for per-run result files"
+    )
+    bench.add_argument(
+        "--baseline", default="benchmarks/baseline.json", help="Baseline results file"
+    )
+    bench.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Fail when a case's median is this fraction slower than baseline",
+    )
+    bench.add_argument(
+        "--update-baseline", action="store_true", help="Store these results as the baseline"
+    )
+    bench.set_defaults(handler=_bench)
+
     return parser
 
 
+def _command_span(args: argparse.Namespace) -> str:
+    parts = [args.command]
+    subcommand = getattr(args, f"{args.command.replace('-', '_')}_command", None)
+    if subcommand:
+        parts.append(subcommand)
+    return "cli." + ".".join(parts)
+
+
+def _bar_cache_environ(args: argparse.Namespace) -> dict[str, str]:
+    """Environment for the shared bar cache, so worker processes pick it up too."""
+    environ: dict[str, str] = {}
+    if args.bar_cache:
+        environ[BAR_CACHE_ENV] = str(Path(args.bar_cache).resolve())
+    if args.bar_cache_max_mb is not None:
+        environ[BAR_CACHE_MAX_BYTES_ENV] = str(args.bar_cache_max_mb * 1024 * 1024)
+    return environ
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
-    configure_logging(args.log_level)
+    configure_logging(args.log_level, debug_rate=args.log_debug_rate)
     handler = cast(Callable[[argparse.Namespace], int], cast(Any, args).handler)
-    return handler(args)
+    profiler: Profiler | None = None
+    if args.profile or args.profile_pstats or args.profile_collapsed:
+        profiler = Profiler(args.profile_pstats, args.profile_collapsed)
+        profiler.start()
+    server = REGISTRY.serve(port=args.metrics_port) if args.metrics_port is not None else None
+    environ = _bar_cache_environ(args)
+    previous = {name: os.environ.get(name) for name in environ}
+    os.environ.update(environ)
+    try:
+        with span(_command_span(args)):
+            return handler(args)
+    finally:
+        if profiler is not None:
+            profiler.stop()
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        if args.metrics_file:
+            REGISTRY.write_textfile(args.metrics_file)
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        shutdown_logging()
 
 
 if __name__ == "__main__":
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import yaml  # type: ignore[import-untyped]
-from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 
 
 class UniverseConfig(BaseModel):
@@ -17,6 +17,7 @@ class UniverseConfig(BaseModel):
 class DataConfig(BaseModel):
     provider: str = "local_parquet"
     path: str = "./data"
+    adjust: Literal["none", "splits", "all"] = "splits"
 
 
 class BrokerConfig(BaseModel):
@@ -45,6 +46,18 @@ class CostModelConfig(BaseModel):
     slippage_bps: float = 2.0
 
 
+class StrategyInstanceConfig(StrategyConfig):
+    """One of several strategies hosted by one paper/paper-sim process.
+
+    ``portfolio`` and ``risk`` default to the top-level sections; each instance still
+    trades its own account against its own limits.
+    """
+
+    id: str = Field(pattern=r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+    portfolio: PortfolioConfig | None = None
+    risk: RiskConfig | None = None
+
+
 class RuntimeConfig(BaseModel):
     schedule: str | None = None
     dry_run: bool = False
@@ -59,11 +72,40 @@ class AppConfig(BaseModel):
     data: DataConfig = Field(default_factory=DataConfig)
     broker: BrokerConfig = Field(default_factory=BrokerConfig)
     strategy: StrategyConfig = Field(default_factory=StrategyConfig)
+    strategies: list[StrategyInstanceConfig] = Field(default_factory=list)
     portfolio: PortfolioConfig = Field(default_factory=PortfolioConfig)
     risk: RiskConfig = Field(default_factory=RiskConfig)
     cost_model: CostModelConfig = Field(default_factory=CostModelConfig)
     runtime: RuntimeConfig = Field(default_factory=RuntimeConfig)
 
+    @model_validator(mode="after")
+    def _unique_strategy_ids(self) -> AppConfig:
+        ids = [item.id for item in self.strategies]
+        duplicates = sorted({item for item in ids if ids.count(item) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate strategy ids: {duplicates}")
+        return self
+
+    def strategy_configs(self) -> dict[str, AppConfig]:
+        """Single-strategy config per hosted strategy, keyed by strategy id.
+
+        Without ``strategies`` this is just ``strategy`` under its name; otherwise each
+        instance replaces ``strategy`` and, when given, ``portfolio`` and ``risk``.
+        """
+        if not self.strategies:
+            return {self.strategy.name: self}
+        return {
+            item.id: self.model_copy(
+                update={
+                    "strategy": StrategyConfig(name=item.name, params=item.params),
+                    "strategies": [],
+                    "portfolio": item.portfolio or self.portfolio,
+                    "risk": item.risk or self.risk,
+                }
+            )
+            for item in self.strategies
+        }
+
 
 def load_config(path: str | Path) -> AppConfig:
     """Load and validate config from YAML."""
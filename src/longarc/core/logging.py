@@ -1,16 +1,164 @@
-"""Logging setup for LongArc."""
+"""Logging setup for LongArc.
+
+Records are serialized as one JSON object per line. ``configure_logging`` routes them
+through a ``QueueHandler`` so formatting and stream I/O run on a background
+``QueueListener`` thread instead of the caller's hot path.
+"""
 
 from __future__ import annotations
 
+import atexit
+import copy
+import json
 import logging
+import queue
+import sys
+import threading
+import time
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, TextIO
+
+_RESERVED = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime", "taskName"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Render a record as a single-line JSON object.
+
+    Fixed keys are ``ts`` (UTC ISO 8601), ``level``, ``logger`` and ``message``; any
+    ``extra=`` fields (``symbol``, ``run_id``, span ``duration_ms``/``rows``/``bytes``...)
+    follow as top-level keys, and tracebacks go to ``exc``. Values that are not JSON
+    types are rendered with ``str``.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=UTC).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and key not in payload:
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        if record.stack_info:
+            payload["stack"] = record.stack_info
+        return json.dumps(payload, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+class DebugRateLimiter(logging.Filter):
+    """Token-bucket limit for DEBUG records, keyed by logger and message template.
+
+    Each template may emit ``burst`` records at once and ``rate`` per second after that;
+    INFO and above always pass. The next record that gets through carries the number
+    of records suppressed since the previous one as ``suppressed``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+        if rate <= 0:
+            raise ValueError("Debug log rate must be positive")
+        self._rate = rate
+        self._burst = float(max(burst, 1))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: dict[tuple[str, object], list[float]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        now = self._clock()
+        key = (record.name, record.msg)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [self._burst, now, 0.0]
+            tokens = min(self._burst, bucket[0] + (now - bucket[1]) * self._rate)
+            bucket[1] = now
+            if tokens < 1.0:
+                bucket[0] = tokens
+                bucket[2] += 1
+                return False
+            bucket[0] = tokens - 1.0
+            suppressed, bucket[2] = int(bucket[2]), 0.0
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class _RecordQueueHandler(QueueHandler):
+    """Enqueue a shallow copy with the message resolved but extras kept intact.
+
+    The stock ``prepare`` replaces ``msg`` with fully formatted text; the listener-side
+    ``JsonFormatter`` needs the raw message and extras instead.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        prepared = copy.copy(record)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        if record.exc_info:
+            prepared.exc_text = logging.Formatter().formatException(record.exc_info)
+            prepared.exc_info = None
+        return prepared
+
+
+_ACTIVE: tuple[QueueHandler, QueueListener] | None = None
+
+
+def shutdown_logging() -> None:
+    """Detach the queue handler and drain pending records to the output stream."""
+    global _ACTIVE
+    if _ACTIVE is None:
+        return
+    handler, listener = _ACTIVE
+    _ACTIVE = None
+    logging.getLogger().removeHandler(handler)
+    listener.stop()
+
+
+def configure_logging(
+    level: str = "INFO",
+    *,
+    stream: TextIO | None = None,
+    debug_rate: float | None = None,
+    debug_burst: int = 10,
+) -> QueueListener:
+    """Install JSON logging on the root logger behind a background queue listener.
+
+    Calling it again replaces the previous configuration. ``debug_rate`` (records per
+    second per message template) throttles high-volume DEBUG events such as per-span logs.
+    """
+    shutdown_logging()
+    global _ACTIVE
+
+    output = logging.StreamHandler(stream if stream is not None else sys.stderr)
+    output.setFormatter(JsonFormatter())
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    handler = _RecordQueueHandler(records)
+    if debug_rate is not None:
+        handler.addFilter(DebugRateLimiter(debug_rate, debug_burst))
+    listener = QueueListener(records, output, respect_handler_level=True)
+
+    root = logging.getLogger()
+    root.setLevel(level.upper())
+    root.addHandler(handler)
+    listener.start()
+    _ACTIVE = (handler, listener)
+    return listener
 
 
-def configure_logging(level: str = "INFO") -> None:
-    """Configure a simple structured-like logger format."""
-    logging.basicConfig(
-        level=level.upper(),
-        format=(
-            '{"ts":"%(asctime)s","level":"%(levelname)s",'
-            '"logger":"%(name)s","message":"%(message)s"}'
-        ),
-    )
+atexit.register(shutdown_logging)
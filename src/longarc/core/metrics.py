@@ -0,0 +1,213 @@
+"""In-process counters and histograms with Prometheus text-format exposition."""
+
+from __future__ import annotations
+
+import math
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+COUNT_BUCKETS: tuple[float, ...] = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _format_labels(labels: LabelKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for key, value in pairs
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonically increasing value.
+
+    Updates take a per-metric lock (explicit acquire/release is roughly half the cost of a
+    ``with`` block), so increments from worker threads are never lost.
+    """
+
+    __slots__ = ("labels", "_lock", "_value")
+
+    def __init__(self, labels: LabelKey) -> None:
+        self.labels = labels
+        self._lock = threading.Lock()
+        self._value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._lock.acquire()
+        try:
+            self._value += amount
+        finally:
+            self._lock.release()
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def samples(self, name: str) -> list[str]:
+        return [f"{name}{_format_labels(self.labels)} {_format_value(self._value)}"]
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus layout."""
+
+    __slots__ = ("labels", "bounds", "_lock", "_counts", "_sum")
+
+    def __init__(self, labels: LabelKey, buckets: tuple[float, ...]) -> None:
+        self.labels = labels
+        self.bounds = tuple(sorted(float(bound) for bound in buckets))
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.bounds, value)
+        self._lock.acquire()
+        try:
+            self._counts[index] += 1
+            self._sum += value
+        finally:
+            self._lock.release()
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def samples(self, name: str) -> list[str]:
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip((*self.bounds, math.inf), counts):
+            cumulative += bucket_count
+            le = (("le", _format_value(bound)),)
+            lines.append(f"{name}_bucket{_format_labels(self.labels, le)} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(self.labels)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(self.labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metric families; each distinct label set is its own child metric.
+
+    Look metrics up once (e.g. at import time) and keep the handle on hot paths, so an
+    increment is a single method call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._families: dict[str, tuple[str, str, dict[LabelKey, Any]]] = {}
+
+    def _child(self, kind: str, name: str, help_text: str, labels: dict[str, str]) -> Any:
+        key: LabelKey = tuple(sorted((label, str(value)) for label, value in labels.items()))
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = (kind, help_text, {})
+                self._families[name] = family
+            elif family[0] != kind:
+                raise ValueError(f"Metric {name!r} is already registered as a {family[0]}.")
+            return family[2].get(key), key, family[2]
+
+    def counter(self, name: str, help_text: str, **labels: str) -> Counter:
+        existing, key, children = self._child("counter", name, help_text, labels)
+        if existing is not None:
+            counter: Counter = existing
+            return counter
+        with self._lock:
+            created: Counter = children.setdefault(key, Counter(key))
+        return created
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        **labels: str,
+    ) -> Histogram:
+        existing, key, children = self._child("histogram", name, help_text, labels)
+        if existing is not None:
+            histogram: Histogram = existing
+            return histogram
+        with self._lock:
+            created: Histogram = children.setdefault(key, Histogram(key, buckets))
+        return created
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            families = [
+                (name, kind, help_text, list(children.values()))
+                for name, (kind, help_text, children) in sorted(self._families.items())
+            ]
+        lines: list[str] = []
+        for name, kind, help_text, children in families:
+            escaped_help = help_text.replace("\\", "\\\\").replace("\n", "\\n")
+            lines.append(f"# HELP {name} {escaped_help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for child in sorted(children, key=lambda metric: metric.labels):
+                lines.extend(child.samples(name))
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str | Path) -> Path:
+        """Atomically write :meth:`render` output (node_exporter textfile collector format)."""
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, staging = tempfile.mkstemp(prefix=f".{target.name}-", dir=target.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(self.render())
+            os.replace(staging, target)
+        except BaseException:
+            Path(staging).unlink(missing_ok=True)
+            raise
+        return target
+
+    def serve(self, host: str = "127.0.0.1", port: int = 9464) -> ThreadingHTTPServer:
+        """Serve ``GET /metrics`` from a daemon thread; call ``shutdown()`` to stop."""
+        registry = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return
+
+        server = ThreadingHTTPServer((host, port), _Handler)
+        thread = threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True)
+        thread.start()
+        return server
+
+
+REGISTRY = MetricsRegistry()
+"""Process-wide default registry used by the data store, providers and engines."""
@@ -0,0 +1,180 @@
+"""Lightweight timing spans and optional whole-run profiling."""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+SPAN_LOGGER = logging.getLogger("longarc.spans")
+
+
+@dataclass
+class Span:
+    """One timed region. Set ``rows``/``bytes`` inside the ``with`` block when known."""
+
+    name: str
+    fields: dict[str, Any] = field(default_factory=dict)
+    rows: int | None = None
+    bytes: int | None = None
+    duration_ms: float = 0.0
+    child_ms: float = 0.0
+
+
+_STACK: ContextVar[tuple[Span, ...]] = ContextVar("longarc_span_stack", default=())
+
+
+class SpanRecorder:
+    """Aggregate finished spans by their full stack path.
+
+    Self time (duration minus direct children) per path is exactly what a flamegraph
+    needs, so :meth:`collapsed` emits the ``frame;frame;frame <microseconds>`` format
+    understood by ``flamegraph.pl``/speedscope.
+    """
+
+    def __init__(self) -> None:
+        self._totals: dict[tuple[str, ...], list[float]] = {}
+
+    def record(self, path: tuple[str, ...], span: Span) -> None:
+        totals = self._totals.setdefault(path, [0.0, 0.0, 0.0, 0.0, 0.0])
+        totals[0] += 1
+        totals[1] += span.duration_ms
+        totals[2] += max(span.duration_ms - span.child_ms, 0.0)
+        totals[3] += span.rows or 0
+        totals[4] += span.bytes or 0
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Per-path totals, slowest first."""
+        rows = [
+            {
+                "span": ";".join(path),
+                "count": int(count),
+                "total_ms": total_ms,
+                "self_ms": self_ms,
+                "rows": int(rows),
+                "bytes": int(size),
+            }
+            for path, (count, total_ms, self_ms, rows, size) in self._totals.items()
+        ]
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+    def collapsed(self) -> str:
+        lines = [
+            f"{';'.join(path)} {round(totals[2] * 1000)}"
+            for path, totals in sorted(self._totals.items())
+            if totals[2] > 0
+        ]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+
+_RECORDER: SpanRecorder | None = None
+
+
+@contextmanager
+def span(name: str, **fields: Any) -> Iterator[Span]:
+    """Time a region and report it through ``longarc.spans`` logging at DEBUG level.
+
+    Keyword ``fields`` (e.g. ``symbol``, ``timeframe``) are attached to the log record
+    as extras alongside ``duration_ms``, ``rows`` and ``bytes``.
+    """
+    current = Span(name=name, fields=fields)
+    parents = _STACK.get()
+    token = _STACK.set((*parents, current))
+    started = time.perf_counter()
+    try:
+        yield current
+    finally:
+        current.duration_ms = (time.perf_counter() - started) * 1000.0
+        _STACK.reset(token)
+        if parents:
+            parents[-1].child_ms += current.duration_ms
+        recorder = _RECORDER
+        if recorder is not None:
+            recorder.record(tuple(item.name for item in parents) + (name,), current)
+        if SPAN_LOGGER.isEnabledFor(logging.DEBUG):
+            SPAN_LOGGER.debug(
+                "span %s duration_ms=%.3f rows=%s bytes=%s",
+                name,
+                current.duration_ms,
+                current.rows,
+                current.bytes,
+                extra={
+                    **fields,
+                    "span": name,
+                    "duration_ms": round(current.duration_ms, 3),
+                    "rows": current.rows,
+                    "bytes": current.bytes,
+                },
+            )
+
+
+def file_size(path: str | Path) -> int | None:
+    try:
+        return Path(path).stat().st_size
+    except OSError:
+        return None
+
+
+class Profiler:
+    """Collect spans (and optionally cProfile stats) for one CLI invocation.
+
+    Starting it enables span logging and aggregation; :meth:`stop` logs a per-span summary
+    and writes the requested pstats / collapsed-stack files.
+    """
+
+    def __init__(
+        self,
+        pstats_path: str | Path | None = None,
+        collapsed_path: str | Path | None = None,
+    ) -> None:
+        self.recorder = SpanRecorder()
+        self._pstats_path = Path(pstats_path) if pstats_path else None
+        self._collapsed_path = Path(collapsed_path) if collapsed_path else None
+        self._cprofile = cProfile.Profile() if self._pstats_path else None
+        self._previous_level = SPAN_LOGGER.level
+
+    def start(self) -> None:
+        global _RECORDER
+        _RECORDER = self.recorder
+        SPAN_LOGGER.setLevel(logging.DEBUG)
+        if self._cprofile is not None:
+            self._cprofile.enable()
+
+    def stop(self) -> None:
+        global _RECORDER
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        _RECORDER = None
+        SPAN_LOGGER.setLevel(self._previous_level)
+
+        for row in self.recorder.summary():
+            SPAN_LOGGER.info(
+                "profile %s count=%s total_ms=%.3f self_ms=%.3f rows=%s bytes=%s",
+                row["span"],
+                row["count"],
+                row["total_ms"],
+                row["self_ms"],
+                row["rows"],
+                row["bytes"],
+                extra={"profile": row},
+            )
+        if self._cprofile is not None and self._pstats_path is not None:
+            self._pstats_path.parent.mkdir(parents=True, exist_ok=True)
+            self._cprofile.dump_stats(str(self._pstats_path))
+            SPAN_LOGGER.info("cProfile stats written to %s", self._pstats_path)
+        if self._collapsed_path is not None:
+            self._collapsed_path.parent.mkdir(parents=True, exist_ok=True)
+            self._collapsed_path.write_text(self.recorder.collapsed(), encoding="utf-8")
+            SPAN_LOGGER.info("Collapsed span stacks written to %s", self._collapsed_path)
+
+    def __enter__(self) -> Profiler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
@@ -0,0 +1,74 @@
+"""Minimal five-field cron matching for runtime schedules."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+_FIELD_RANGES: tuple[tuple[str, int, int], ...] = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 7),
+)
+
+
+def _parse_field(expr: str, name: str, low: int, high: int) -> frozenset[int]:
+    values: set[int] = set()
+    for part in expr.split(","):
+        base, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if step < 1:
+            raise ValueError(f"Invalid step in cron {name} field: {expr!r}")
+        if base == "*":
+            start, end = low, high
+        elif "-" in base:
+            start_text, end_text = base.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(base)
+            end = high if step_text else start
+        if not (low <= start <= high and low <= end <= high and start <= end):
+            raise ValueError(f"Cron {name} field out of range: {expr!r}")
+        values.update(range(start, end + 1, step))
+    if name == "weekday":
+        return frozenset(value % 7 for value in values)
+    return frozenset(values)
+
+
+class CronSchedule:
+    """Match datetimes against ``minute hour day month weekday`` (0 or 7 = Sunday).
+
+    Supports ``*``, lists, ranges and steps. As in cron, when both day and weekday are
+    restricted a datetime matches if either does.
+    """
+
+    def __init__(self, expression: str) -> None:
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields, got {expression!r}")
+        self.expression = expression
+        parsed = [
+            _parse_field(expr, name, low, high)
+            for expr, (name, low, high) in zip(fields, _FIELD_RANGES)
+        ]
+        self._minutes, self._hours, self._days, self._months, self._weekdays = parsed
+        self._day_restricted = fields[2] != "*"
+        self._weekday_restricted = fields[4] != "*"
+
+    def matches_date(self, value: datetime) -> bool:
+        """Match only the calendar fields (day, month, weekday)."""
+        if value.month not in self._months:
+            return False
+        day_ok = value.day in self._days
+        weekday_ok = (value.isoweekday() % 7) in self._weekdays
+        if self._day_restricted and self._weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def matches(self, value: datetime) -> bool:
+        return (
+            value.minute in self._minutes
+            and value.hour in self._hours
+            and self.matches_date(value)
+        )
@@ -0,0 +1,34 @@
+"""Timezone helpers shared by engines and data tooling."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import numpy as np
+import numpy.typing as npt
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.compute as pc  # type: ignore[import-untyped]
+
+_TIMEFRAME_INTERVAL: dict[str, timedelta] = {
+    "1m": timedelta(minutes=1),
+    "1h": timedelta(hours=1),
+    "1d": timedelta(days=1),
+}
+
+
+def session_days(timestamps: pa.Array | pa.ChunkedArray, timezone: str) -> npt.NDArray[np.int64]:
+    """Return local calendar day numbers (days since epoch) for UTC timestamps."""
+    localized = pc.cast(timestamps, pa.timestamp("us", tz=timezone))
+    wall_clock = pc.local_timestamp(localized)
+    values = np.asarray(wall_clock.to_numpy(zero_copy_only=False), dtype="datetime64[us]")
+    return values.astype("datetime64[D]").astype(np.int64)
+
+
+def timeframe_interval(timeframe: str) -> timedelta:
+    try:
+        return _TIMEFRAME_INTERVAL[timeframe]
+    except KeyError as exc:
+        allowed = ", ".join(sorted(_TIMEFRAME_INTERVAL))
+        raise ValueError(
+            f"Unsupported timeframe {timeframe!r}. Expected one of: {allowed}"
+        ) from exc
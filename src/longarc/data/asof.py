@@ -0,0 +1,237 @@
+"""Point-in-time as-of joins between bar series of different timeframes or symbols.
+
+Bars are stamped at their open. A bar becomes usable only once it is complete: intraday
+bars at ``timestamp + interval`` (capped at the session close), daily bars at the
+calendar's session close of their trading day in the configured timezone. Each fast bar
+is matched to the last slower bar completed at or before the fast bar itself completes,
+so a 1m signal during a session sees the previous day's 1d bar, never today's.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+import numpy.typing as npt
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.compute as pc  # type: ignore[import-untyped]
+
+from longarc.core.profiling import span
+from longarc.core.time import timeframe_interval
+from longarc.data.quality import get_calendar
+from longarc.data.store import BAR_SCHEMA, BarCache, read_bars_table
+
+IntArray = npt.NDArray[np.int64]
+
+_US_PER_MINUTE = 60_000_000
+_US_PER_DAY = 24 * 60 * _US_PER_MINUTE
+
+
+def _epoch_us(timestamps: pa.Array | pa.ChunkedArray) -> IntArray:
+    values = np.asarray(timestamps.to_numpy(), dtype="datetime64[us]")
+    return values.view(np.int64)
+
+
+def _session_close(days: IntArray, close_minute: int, timezone: str) -> IntArray:
+    """UTC epoch µs of ``close_minute`` local wall-clock time on each local day number."""
+    unique_days, inverse = np.unique(days, return_inverse=True)
+    wall = unique_days * _US_PER_DAY + close_minute * _US_PER_MINUTE
+    instants = pc.assume_timezone(
+        pa.array(wall.astype("datetime64[us]")),
+        timezone,
+        ambiguous="earliest",
+        nonexistent="latest",
+    )
+    closes = np.asarray(instants.to_numpy(), dtype="datetime64[us]").view(np.int64)
+    return closes[inverse].reshape(days.shape)
+
+
+def bar_close_times(
+    timestamps: pa.Array | pa.ChunkedArray,
+    timeframe: str,
+    timezone: str = "America/New_York",
+    calendar: str = "us_equity",
+) -> IntArray:
+    """Epoch µs at which each bar (stamped at its open) is complete.
+
+    Daily bars close at the calendar's session close on their UTC date (the store's
+    convention for daily stamps, see ``data.quality.session_ordinals``). Intraday bars
+    close one interval after their open, or at the local session close when that comes
+    first, so a partial final hourly bar is usable at 16:00.
+    """
+    session = get_calendar(calendar)
+    interval = int(timeframe_interval(timeframe).total_seconds() * 1_000_000)
+    opens = _epoch_us(timestamps)
+    if interval >= _US_PER_DAY:
+        return _session_close(opens // _US_PER_DAY, session.close_minute, timezone)
+
+    local = pc.local_timestamp(pc.cast(timestamps, pa.timestamp("us", tz=timezone)))
+    local_days = np.asarray(local.to_numpy(), dtype="datetime64[us]").view(np.int64)
+    close = _session_close(local_days // _US_PER_DAY, session.close_minute, timezone)
+    ends = opens + interval
+    # Bars opening after the session close (extended hours) keep their nominal end.
+    capped: IntArray = np.where((opens < close) & (close < ends), close, ends)
+    return capped
+
+
+def asof_indices(left_times: IntArray, right_times: IntArray) -> IntArray:
+    """Index of the last right row with ``right_times <= left_times`` per left row, or -1.
+
+    ``right_times`` must be non-decreasing; ``left_times`` may be in any order.
+    """
+    return np.searchsorted(right_times, left_times, side="right").astype(np.int64) - 1
+
+
+def _take(right: pa.Table, indices: IntArray, columns: Sequence[str], prefix: str) -> pa.Table:
+    positions = pa.array(indices, mask=indices < 0)
+    return pa.table(
+        {f"{prefix}{name}": right[name].take(positions) for name in ["timestamp", *columns]}
+    )
+
+
+def asof_join(
+    left: pa.Table,
+    right: pa.Table,
+    left_timeframe: str,
+    right_timeframe: str,
+    *,
+    columns: Sequence[str] | None = None,
+    prefix: str = "",
+    timezone: str = "America/New_York",
+    calendar: str = "us_equity",
+) -> pa.Table:
+    """Append ``right`` columns as of each ``left`` bar's completion.
+
+    ``right`` must be timestamp-sorted. Joined columns are ``prefix + name`` plus
+    ``prefix + "timestamp"`` (the open of the matched bar); they are null where no right
+    bar had completed yet.
+    """
+    selected = [name for name in (columns or right.column_names) if name != "timestamp"]
+    left_close = bar_close_times(left["timestamp"], left_timeframe, timezone, calendar)
+    right_close = bar_close_times(right["timestamp"], right_timeframe, timezone, calendar)
+    joined = _take(right, asof_indices(left_close, right_close), selected, prefix)
+    for name in joined.column_names:
+        left = left.append_column(name, joined[name])
+    return left
+
+
+@dataclass(frozen=True)
+class AsOfSource:
+    """A slower series (or another symbol) to join onto a base series."""
+
+    symbol: str
+    timeframe: str
+    columns: tuple[str, ...] = ("close",)
+    prefix: str | None = None
+
+    @property
+    def column_prefix(self) -> str:
+        if self.prefix is not None:
+            return self.prefix
+        return f"{self.symbol.lower()}_{self.timeframe}_"
+
+
+def read_asof(
+    base_path: str | Path,
+    symbol: str,
+    timeframe: str,
+    sources: Sequence[AsOfSource],
+    *,
+    columns: Sequence[str] | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    timezone: str = "America/New_York",
+    calendar: str = "us_equity",
+    adjust: str = "splits",
+    cache: BarCache | None = None,
+) -> pa.Table:
+    """Read ``symbol``/``timeframe`` bars with every source joined point-in-time.
+
+    Sources are read up to ``end`` without a lower bound, so the first base bars still
+    see the last source bar completed before ``start``.
+    """
+    with span("store.read_asof", symbol=symbol.upper(), timeframe=timeframe) as timing:
+        table = read_bars_table(
+            base_path, symbol, timeframe, columns, start, end, cache=cache, adjust=adjust
+        )
+        for source in sources:
+            right = read_bars_table(
+                base_path,
+                source.symbol,
+                source.timeframe,
+                list(source.columns),
+                end=end,
+                cache=cache,
+                adjust=adjust,
+            )
+            table = asof_join(
+                table,
+                right,
+                timeframe,
+                source.timeframe,
+                columns=source.columns,
+                prefix=source.column_prefix,
+                timezone=timezone,
+                calendar=calendar,
+            )
+        timing.rows = table.num_rows
+    return table
+
+
+class AsOfJoiner:
+    """Incremental as-of join for paper mode, fed one batch of new bars at a time.
+
+    ``extend`` appends newly stored bars of the slower series (rows at or before the last
+    one seen are ignored, so re-reading overlapping windows is harmless). ``lookup``
+    resolves non-decreasing fast-bar timestamps and drops source rows no later lookup can
+    match, so memory stays bounded by the gap between the two timeframes.
+    """
+
+    def __init__(
+        self,
+        timeframe: str,
+        columns: Sequence[str] = ("close",),
+        *,
+        prefix: str = "",
+        timezone: str = "America/New_York",
+        calendar: str = "us_equity",
+    ) -> None:
+        self.timeframe = timeframe
+        self.columns = [name for name in columns if name != "timestamp"]
+        self.prefix = prefix
+        self.timezone = timezone
+        self.calendar = calendar
+        self._bars: pa.Table | None = None
+        self._close = np.empty(0, dtype=np.int64)
+        self._last_open: int | None = None
+
+    def __len__(self) -> int:
+        return int(self._close.size)
+
+    def extend(self, bars: pa.Table) -> None:
+        bars = bars.select(["timestamp", *self.columns])
+        if self._last_open is not None and bars.num_rows:
+            bars = bars.filter(pc.greater(pc.cast(bars["timestamp"], pa.int64()), self._last_open))
+        if bars.num_rows == 0:
+            return
+        close = bar_close_times(bars["timestamp"], self.timeframe, self.timezone, self.calendar)
+        self._bars = bars if self._bars is None else pa.concat_tables([self._bars, bars])
+        self._close = np.concatenate([self._close, close])
+        self._last_open = int(_epoch_us(bars["timestamp"])[-1])
+
+    def lookup(self, timestamps: pa.Array | pa.ChunkedArray, timeframe: str) -> pa.Table:
+        """Joined columns for fast bars of ``timeframe`` stamped at ``timestamps``."""
+        left_close = bar_close_times(timestamps, timeframe, self.timezone, self.calendar)
+        if self._bars is None:
+            empty = BAR_SCHEMA.empty_table().select(["timestamp", *self.columns])
+            return _take(empty, np.full(left_close.size, -1), self.columns, self.prefix)
+        indices = asof_indices(left_close, self._close)
+        joined = _take(self._bars, indices, self.columns, self.prefix)
+        keep = int(indices.max()) if indices.size else -1
+        if keep > 0:
+            self._bars = self._bars.slice(keep)
+            self._close = self._close[keep:]
+        return joined
@@ -5,6 +5,8 @@ from __future__ import annotations
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
+from longarc.core.metrics import REGISTRY
+from longarc.core.profiling import span
 from longarc.data.providers.base import DownloadResult
 from longarc.data.store import WriteResult, write_bars
 
@@ -14,6 +16,11 @@ _TIMEFRAME_STEP: dict[str, timedelta] = {
     "1d": timedelta(days=1),
 }
 
+_ROWS_INGESTED = REGISTRY.counter(
+    "longarc_provider_rows_ingested_total", "Bars downloaded and stored.", provider="local_parquet"
+)
+
+
 def _parse_day(value: str) -> datetime:
     return datetime.fromisoformat(value).replace(tzinfo=UTC)
 
@@ -72,13 +79,25 @@ class LocalParquetProvider:
         start: str,
         end: str,
     ) -> DownloadResult:
-        bars = generate_synthetic_bars(symbol=symbol, timeframe=timeframe, start=start, end=end)
-        result: WriteResult = write_bars(
-            base_path=base_path,
-            symbol=symbol,
+        with span(
+            "provider.download",
+            provider="local_parquet",
+            symbol=symbol.upper(),
             timeframe=timeframe,
-            bars=bars,
-        )
+        ) as timing:
+            with span("synthetic.generate") as step:
+                bars = generate_synthetic_bars(
+                    symbol=symbol, timeframe=timeframe, start=start, end=end
+                )
+                step.rows = len(bars)
+            result: WriteResult = write_bars(
+                base_path=base_path,
+                symbol=symbol,
+                timeframe=timeframe,
+                bars=bars,
+            )
+            timing.rows = result.input_rows
+        _ROWS_INGESTED.inc(result.input_rows)
         return DownloadResult(
             symbol=symbol.upper(),
             timeframe=timeframe,
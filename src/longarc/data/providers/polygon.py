@@ -3,15 +3,33 @@
 from __future__ import annotations
 
 import json
-from datetime import UTC, datetime
+import logging
+import time
+from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import Any, Callable, Mapping
+from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
+from longarc.core.metrics import REGISTRY
+from longarc.core.profiling import span
 from longarc.data.providers.base import DownloadResult
-from longarc.data.store import WriteResult, write_bars
+from longarc.data.store import WriteResult, write_actions, write_bars
 
+LOGGER = logging.getLogger(__name__)
+
+_REQUEST_SECONDS = REGISTRY.histogram(
+    "longarc_provider_request_seconds", "Provider HTTP request latency.", provider="polygon"
+)
+_RETRIES = REGISTRY.counter(
+    "longarc_provider_retries_total", "Provider requests retried.", provider="polygon"
+)
+_ROWS_INGESTED = REGISTRY.counter(
+    "longarc_provider_rows_ingested_total", "Bars downloaded and stored.", provider="polygon"
+)
+
+_API_ROOT = "https://api.polygon.io"
 _TIMEFRAME_MAP: dict[str, tuple[int, str]] = {
     "1m": (1, "minute"),
     "1h": (1, "hour"),
@@ -31,15 +49,25 @@ def _timeframe_for(timeframe: str) -> tuple[int, str]:
 
 def _fetch_json(url: str) -> Mapping[str, Any]:
     request = Request(url, headers={"User-Agent": "longarc/0.1.0"})
-    with urlopen(request, timeout=30) as response:  # noqa: S310
-        payload = response.read().decode("utf-8")
+    with span("polygon.fetch") as timing:
+        with urlopen(request, timeout=30) as response:  # noqa: S310
+            raw = response.read()
+        timing.bytes = len(raw)
 
-    decoded = json.loads(payload)
+    with span("polygon.json_decode") as timing:
+        decoded = json.loads(raw.decode("utf-8"))
+        timing.bytes = len(raw)
     if not isinstance(decoded, dict):
         raise ValueError("Polygon response must be a JSON object.")
     return decoded
 
 
+def _is_transient(exc: Exception) -> bool:
+    if isinstance(exc, HTTPError):
+        return exc.code == 429 or exc.code >= 500
+    return isinstance(exc, (URLError, TimeoutError, ConnectionError))
+
+
 def _as_float(value: Any, field: str) -> float:
     if isinstance(value, bool):
         raise ValueError(f"Polygon field {field} must be numeric, got bool")
@@ -49,6 +77,15 @@ def _as_float(value: Any, field: str) -> float:
         raise ValueError(f"Polygon field {field} must be numeric, got {value!r}") from exc
 
 
+def _as_date(value: Any, field: str) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f"Polygon field {field} must be a YYYY-MM-DD date, got {value!r}")
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError as exc:
+        raise ValueError(f"Polygon field {field} must be a YYYY-MM-DD date, got {value!r}") from exc
+
+
 def _as_int(value: Any, field: str) -> int:
     if isinstance(value, bool):
         raise ValueError(f"Polygon field {field} must be an integer, got bool")
@@ -58,60 +95,157 @@ def _as_int(value: Any, field: str) -> int:
         raise ValueError(f"Polygon field {field} must be an integer, got {value!r}") from exc
 
 
+def _results(payload: Mapping[str, Any]) -> list[Any]:
+    status = str(payload.get("status", "")).upper()
+    if status and status != "OK":
+        error = payload.get("error") or payload.get("message") or "unknown_error"
+        raise ValueError(f"Polygon request failed with status={status}: {error}")
+
+    raw_results = payload.get("results", [])
+    if not isinstance(raw_results, list):
+        raise ValueError("Polygon response field 'results' must be a list.")
+    return raw_results
+
+
+def _actions_from_payloads(splits: list[Any], dividends: list[Any]) -> list[dict[str, object]]:
+    actions: list[dict[str, object]] = []
+    for row in splits:
+        if not isinstance(row, Mapping):
+            raise ValueError("Polygon split row must be an object.")
+        split_from = _as_float(row.get("split_from"), "split_from")
+        split_to = _as_float(row.get("split_to"), "split_to")
+        if split_from <= 0:
+            raise ValueError(f"Polygon field split_from must be positive, got {split_from!r}")
+        ratio = split_to / split_from
+        ex_date = _as_date(row.get("execution_date"), "execution_date")
+        actions.append({"ex_date": ex_date, "kind": "split", "ratio": ratio})
+    for row in dividends:
+        if not isinstance(row, Mapping):
+            raise ValueError("Polygon dividend row must be an object.")
+        cash = _as_float(row.get("cash_amount"), "cash_amount")
+        if cash > 0:
+            ex_date = _as_date(row.get("ex_dividend_date"), "ex_dividend_date")
+            actions.append({"ex_date": ex_date, "kind": "dividend", "cash": cash})
+    return actions
+
+
 class PolygonProvider:
-    """Download bars from Polygon aggs endpoint and persist to local parquet."""
+    """Download raw bars from Polygon aggs endpoint and persist to local parquet.
+
+    Bars are requested unadjusted; splits and cash dividends from the reference endpoints
+    go to the symbol's corporate actions table (``corporate_actions=False`` skips them) and
+    are applied when bars are read. Rate limiting (HTTP 429), server errors and connection
+    failures are retried up to ``max_retries`` times with exponential backoff starting at
+    ``retry_backoff`` seconds.
+    """
 
     def __init__(
         self,
         api_key: str,
         fetch_json: Callable[[str], Mapping[str, Any]] | None = None,
+        *,
+        max_retries: int = 2,
+        retry_backoff: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep,
+        corporate_actions: bool = True,
     ) -> None:
         if not api_key.strip():
             raise ValueError("Polygon provider requires a non-empty API key.")
+        if max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
         self._api_key = api_key.strip()
         self._fetch_json = fetch_json or _fetch_json
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._sleep = sleep
+        self._corporate_actions = corporate_actions
+
+    def _request(self, url: str) -> Mapping[str, Any]:
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                payload = self._fetch_json(url)
+            except Exception as exc:
+                _REQUEST_SECONDS.observe(time.perf_counter() - started)
+                if attempt >= self._max_retries or not _is_transient(exc):
+                    raise
+                delay = self._retry_backoff * 2**attempt
+                LOGGER.warning(
+                    "Polygon request failed (%s); retry %s/%s in %.1fs",
+                    exc,
+                    attempt + 1,
+                    self._max_retries,
+                    delay,
+                )
+                _RETRIES.inc()
+                attempt += 1
+                self._sleep(delay)
+                continue
+            _REQUEST_SECONDS.observe(time.perf_counter() - started)
+            return payload
 
     def _build_url(self, symbol: str, timeframe: str, start: str, end: str) -> str:
         multiplier, timespan = _timeframe_for(timeframe)
         query = urlencode(
             {
-                "adjusted": "true",
+                "adjusted": "false",
                 "sort": "asc",
                 "limit": "50000",
                 "apiKey": self._api_key,
             }
         )
         return (
-            f"https://api.polygon.io/v2/aggs/ticker/{symbol.upper()}/range/"
+            f"{_API_ROOT}/v2/aggs/ticker/{symbol.upper()}/range/"
             f"{multiplier}/{timespan}/{start}/{end}?{query}"
         )
 
-    def _bars_from_payload(self, payload: Mapping[str, Any]) -> list[dict[str, object]]:
-        status = str(payload.get("status", "")).upper()
-        if status and status != "OK":
-            error = payload.get("error") or payload.get("message") or "unknown_error"
-            raise ValueError(f"Polygon request failed with status={status}: {error}")
+    def _reference_url(self, resource: str, symbol: str) -> str:
+        query = urlencode({"ticker": symbol.upper(), "limit": "1000", "apiKey": self._api_key})
+        return f"{_API_ROOT}/v3/reference/{resource}?{query}"
 
-        raw_results = payload.get("results", [])
-        if not isinstance(raw_results, list):
-            raise ValueError("Polygon response field 'results' must be a list.")
+    def _paged_results(self, url: str) -> list[Any]:
+        results: list[Any] = []
+        next_url: str | None = url
+        while next_url:
+            payload = self._request(next_url)
+            results.extend(_results(payload))
+            cursor = payload.get("next_url")
+            # Polygon's next_url omits the API key.
+            next_url = f"{cursor}&{urlencode({'apiKey': self._api_key})}" if cursor else None
+        return results
 
-        bars: list[dict[str, object]] = []
-        for row in raw_results:
-            if not isinstance(row, Mapping):
-                raise ValueError("Polygon bar row must be an object.")
-            millis = _as_int(row.get("t"), "t")
-            timestamp = datetime.fromtimestamp(millis / 1000, tz=UTC)
-            bars.append(
-                {
-                    "timestamp": timestamp,
-                    "open": _as_float(row.get("o"), "o"),
-                    "high": _as_float(row.get("h"), "h"),
-                    "low": _as_float(row.get("l"), "l"),
-                    "close": _as_float(row.get("c"), "c"),
-                    "volume": _as_float(row.get("v"), "v"),
-                }
+    def fetch_actions(self, symbol: str) -> list[dict[str, object]]:
+        """All splits and cash dividends Polygon reports for ``symbol``."""
+        with span("polygon.actions", symbol=symbol.upper()) as timing:
+            actions = _actions_from_payloads(
+                self._paged_results(self._reference_url("splits", symbol)),
+                self._paged_results(self._reference_url("dividends", symbol)),
             )
+            timing.rows = len(actions)
+        return actions
+
+    def _bars_from_payload(self, payload: Mapping[str, Any]) -> list[dict[str, object]]:
+        raw_results = _results(payload)
+
+        bars: list[dict[str, object]] = []
+        with span("polygon.decode") as timing:
+            for row in raw_results:
+                if not isinstance(row, Mapping):
+                    raise ValueError("Polygon bar row must be an object.")
+                millis = _as_int(row.get("t"), "t")
+                timestamp = datetime.fromtimestamp(millis / 1000, tz=UTC)
+                bars.append(
+                    {
+                        "timestamp": timestamp,
+                        "open": _as_float(row.get("o"), "o"),
+                        "high": _as_float(row.get("h"), "h"),
+                        "low": _as_float(row.get("l"), "l"),
+                        "close": _as_float(row.get("c"), "c"),
+                        "volume": _as_float(row.get("v"), "v"),
+                    }
+                )
+            timing.rows = len(bars)
         return bars
 
     def download_symbol(
@@ -123,14 +257,21 @@ class PolygonProvider:
         end: str,
     ) -> DownloadResult:
         url = self._build_url(symbol=symbol, timeframe=timeframe, start=start, end=end)
-        payload = self._fetch_json(url)
-        bars = self._bars_from_payload(payload)
-        result: WriteResult = write_bars(
-            base_path=base_path,
-            symbol=symbol,
-            timeframe=timeframe,
-            bars=bars,
-        )
+        with span(
+            "provider.download", provider="polygon", symbol=symbol.upper(), timeframe=timeframe
+        ) as timing:
+            payload = self._request(url)
+            bars = self._bars_from_payload(payload)
+            result: WriteResult = write_bars(
+                base_path=base_path,
+                symbol=symbol,
+                timeframe=timeframe,
+                bars=bars,
+            )
+            if self._corporate_actions:
+                write_actions(base_path, symbol, self.fetch_actions(symbol))
+            timing.rows = result.input_rows
+        _ROWS_INGESTED.inc(result.input_rows)
         return DownloadResult(
             symbol=symbol.upper(),
             timeframe=timeframe,
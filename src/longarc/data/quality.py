@@ -0,0 +1,380 @@
+"""Vectorized bar-quality checks over every dataset in the local store."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+import numpy.typing as npt
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.compute as pc  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+from longarc.core.profiling import span
+from longarc.core.time import timeframe_interval
+from longarc.data.store import REQUIRED_COLUMNS, bar_path, map_datasets, select_datasets
+
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.int64]
+
+ERROR_CHECKS: tuple[str, ...] = ("duplicates", "unsorted", "ohlc_errors", "non_positive")
+WARNING_CHECKS: tuple[str, ...] = ("missing_bars", "volume_spikes", "stale_bars")
+QUALITY_TABLE = "quality.parquet"
+QUALITY_SUMMARY = "quality.json"
+
+
+# Unscheduled NYSE closures (national days of mourning, 9/11, Hurricane Sandy).
+_US_EQUITY_CLOSURES: tuple[str, ...] = (
+    "1994-04-27",
+    "2001-09-11",
+    "2001-09-12",
+    "2001-09-13",
+    "2001-09-14",
+    "2004-06-11",
+    "2007-01-02",
+    "2012-10-29",
+    "2012-10-30",
+    "2018-12-05",
+    "2025-01-09",
+)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """The ``n``-th ``weekday`` (Monday 0) of the month; ``n=-1`` is the last one."""
+    if n < 0:
+        last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        return last - timedelta(days=(last.weekday() - weekday) % 7)
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = divmod(b, 4)
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    weekday = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 19 * weekday) // 433
+    month = (h + weekday - 7 * m + 90) // 25
+    return date(year, month, (h + weekday - 7 * m + 33 * month + 19) % 32)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays are observed the Friday before, Sunday ones the Monday after."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def us_equity_holidays(first_year: int = 1990, last_year: int = 2060) -> tuple[str, ...]:
+    """NYSE full-day closures between ``first_year`` and ``last_year`` as ISO dates.
+
+    Rule-based holidays (MLK Day from 1998, Juneteenth from 2022) plus the unscheduled
+    closures above. A Saturday New Year's Day is not observed on the prior Friday. Early
+    closes are trading days and are not listed.
+    """
+    days: list[date] = []
+    for year in range(first_year, last_year + 1):
+        new_year = date(year, 1, 1)
+        if new_year.weekday() != 5:
+            days.append(_observed(new_year))
+        if year >= 1998:
+            days.append(_nth_weekday(year, 1, 0, 3))
+        days.append(_nth_weekday(year, 2, 0, 3))
+        days.append(_easter(year) - timedelta(days=2))
+        days.append(_nth_weekday(year, 5, 0, -1))
+        if year >= 2022:
+            days.append(_observed(date(year, 6, 19)))
+        days.append(_observed(date(year, 7, 4)))
+        days.append(_nth_weekday(year, 9, 0, 1))
+        days.append(_nth_weekday(year, 11, 3, 4))
+        days.append(_observed(date(year, 12, 25)))
+    days.extend(
+        date.fromisoformat(day)
+        for day in _US_EQUITY_CLOSURES
+        if first_year <= int(day[:4]) <= last_year
+    )
+    return tuple(sorted({day.isoformat() for day in days}))
+
+
+@dataclass(frozen=True)
+class SessionCalendar:
+    """Trading days (numpy ``weekmask`` minus ``holidays``) and the local session window.
+
+    Session bounds are in minutes after local midnight.
+    """
+
+    name: str
+    weekmask: str
+    open_minute: int
+    close_minute: int
+    holidays: tuple[str, ...] = ()
+
+
+CALENDARS: dict[str, SessionCalendar] = {
+    "us_equity": SessionCalendar(
+        "us_equity", "1111100", 9 * 60 + 30, 16 * 60, us_equity_holidays()
+    ),
+    "24x7": SessionCalendar("24x7", "1111111", 0, 24 * 60),
+}
+
+
+def get_calendar(name: str) -> SessionCalendar:
+    try:
+        return CALENDARS[name]
+    except KeyError as exc:
+        allowed = ", ".join(sorted(CALENDARS))
+        raise ValueError(f"Unsupported calendar {name!r}. Expected one of: {allowed}") from exc
+
+
+@dataclass(frozen=True)
+class QualityChecks:
+    """Thresholds and calendar used by :func:`verify_dataset`.
+
+    ``volume_spike`` flags bars whose volume exceeds that multiple of the dataset's median
+    positive volume; ``stale_bars`` is the shortest run of identical OHLC bars reported.
+    """
+
+    calendar: str = "us_equity"
+    timezone: str = "America/New_York"
+    holidays: tuple[str, ...] = ()
+    volume_spike: float = 20.0
+    stale_bars: int = 5
+
+
+@dataclass(frozen=True)
+class DatasetQuality:
+    symbol: str
+    timeframe: str
+    rows: int = 0
+    start: str | None = None
+    end: str | None = None
+    duplicates: int = 0
+    unsorted: int = 0
+    ohlc_errors: int = 0
+    non_positive: int = 0
+    gaps: int = 0
+    missing_bars: int = 0
+    max_gap_bars: int = 0
+    off_session: int = 0
+    volume_spikes: int = 0
+    stale_bars: int = 0
+    error: str | None = None
+
+    @property
+    def status(self) -> str:
+        if self.error is not None or any(getattr(self, name) for name in ERROR_CHECKS):
+            return "fail"
+        if any(getattr(self, name) for name in WARNING_CHECKS):
+            return "warn"
+        return "ok"
+
+
+def session_ordinals(
+    timestamps: pa.Array | pa.ChunkedArray,
+    timeframe: str,
+    calendar: SessionCalendar,
+    timezone: str,
+    holidays: Sequence[str] = (),
+) -> tuple[IntArray, npt.NDArray[np.bool_]]:
+    """Number each bar slot of the trading calendar consecutively.
+
+    Returns ``(ordinal, in_session)``: consecutive expected bars have consecutive ordinals,
+    so a jump of ``k`` between neighbouring bars means ``k - 1`` missing bars. Daily bars
+    are matched to trading days by their UTC date (providers stamp them at midnight
+    UTC or exchange-local midnight); intraday bars use local wall-clock time in
+    ``timezone`` against the calendar's session window. ``holidays`` are closed in addition
+    to the calendar's own.
+    """
+    interval_minutes = int(timeframe_interval(timeframe).total_seconds() // 60)
+    daily = interval_minutes >= 24 * 60
+    if daily:
+        values = timestamps
+    else:
+        values = pc.local_timestamp(pc.cast(timestamps, pa.timestamp("us", tz=timezone)))
+    local = np.asarray(values.to_numpy(zero_copy_only=False), dtype="datetime64[us]")
+    days = local.astype("datetime64[D]")
+    holiday_days = np.unique(np.array([*calendar.holidays, *holidays], dtype="datetime64[D]"))
+    trading_day = np.is_busday(days, weekmask=calendar.weekmask, holidays=holiday_days)
+    day_index = np.busday_count(
+        np.datetime64("1970-01-01", "D"),
+        days,
+        weekmask=calendar.weekmask,
+        holidays=holiday_days,
+    ).astype(np.int64)
+    if daily:
+        return day_index, trading_day
+
+    minutes = ((local - days) // np.timedelta64(1, "m")).astype(np.int64)
+    # A partial final slot (e.g. the 15:30 hourly bar of a 16:00 close) still counts.
+    slots_per_day = -(-(calendar.close_minute - calendar.open_minute) // interval_minutes)
+    slot = (minutes - calendar.open_minute) // interval_minutes
+    in_session = trading_day & (slot >= 0) & (slot < slots_per_day)
+    ordinal: IntArray = day_index * slots_per_day + slot
+    return ordinal, in_session
+
+
+def _stale_bar_count(table: pa.Table, min_run: int) -> int:
+    if table.num_rows < 2:
+        return 0
+    same = np.ones(table.num_rows - 1, dtype=np.bool_)
+    for name in ("open", "high", "low", "close"):
+        values = np.asarray(table[name].to_numpy(), dtype=np.float64)
+        same &= values[1:] == values[:-1]
+    edges = np.diff(np.concatenate(([0], same.astype(np.int8), [0])))
+    run_bars = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1) + 1
+    return int(run_bars[run_bars >= min_run].sum())
+
+
+def check_table(
+    table: pa.Table, symbol: str, timeframe: str, checks: QualityChecks
+) -> DatasetQuality:
+    """Run every check over one dataset's columns (timestamps as stored, unsorted allowed)."""
+    if table.num_rows == 0:
+        return DatasetQuality(symbol=symbol, timeframe=timeframe)
+
+    stamps = table["timestamp"]
+    ticks = np.asarray(stamps.to_numpy(), dtype="datetime64[us]").astype(np.int64)
+    steps = np.diff(ticks)
+    prices = {
+        name: np.asarray(table[name].to_numpy(), dtype=np.float64)
+        for name in ("open", "high", "low", "close")
+    }
+    volume = np.asarray(table["volume"].to_numpy(), dtype=np.float64)
+    high, low = prices["high"], prices["low"]
+
+    bad_price = np.zeros(table.num_rows, dtype=np.bool_)
+    for values in prices.values():
+        bad_price |= ~np.isfinite(values) | (values <= 0)
+    bad_price |= ~np.isfinite(volume) | (volume < 0)
+    inconsistent = high < low
+    for name in ("open", "close"):
+        inconsistent |= (prices[name] > high) | (prices[name] < low)
+
+    positive_volume = volume[volume > 0]
+    spikes = 0
+    if positive_volume.size:
+        spikes = int(np.count_nonzero(volume > checks.volume_spike * np.median(positive_volume)))
+
+    ordinal, in_session = session_ordinals(
+        stamps, timeframe, get_calendar(checks.calendar), checks.timezone, checks.holidays
+    )
+    unsorted = int(np.count_nonzero(steps < 0))
+    sessions = ordinal[in_session]
+    if unsorted:
+        sessions = np.sort(sessions)
+    jumps = np.diff(sessions) - 1
+    missing = jumps[jumps > 0]
+
+    return DatasetQuality(
+        symbol=symbol,
+        timeframe=timeframe,
+        rows=table.num_rows,
+        start=str(np.datetime64(int(ticks.min()), "us")),
+        end=str(np.datetime64(int(ticks.max()), "us")),
+        duplicates=int(np.count_nonzero(steps == 0)),
+        unsorted=unsorted,
+        ohlc_errors=int(np.count_nonzero(inconsistent)),
+        non_positive=int(np.count_nonzero(bad_price)),
+        gaps=int(missing.size),
+        missing_bars=int(missing.sum()),
+        max_gap_bars=int(missing.max()) if missing.size else 0,
+        off_session=int(np.count_nonzero(~in_session)),
+        volume_spikes=spikes,
+        stale_bars=_stale_bar_count(table, checks.stale_bars),
+    )
+
+
+def verify_dataset(
+    base_path: str, symbol: str, timeframe: str, checks: QualityChecks
+) -> DatasetQuality:
+    """Read only the bar columns of one stored dataset and check them."""
+    try:
+        parquet = pq.ParquetFile(bar_path(base_path, symbol, timeframe))
+        table = parquet.read(columns=list(REQUIRED_COLUMNS), use_threads=False)
+        return check_table(table, symbol, timeframe, checks)
+    except (OSError, ValueError, KeyError, pa.ArrowException) as exc:
+        return DatasetQuality(symbol=symbol, timeframe=timeframe, error=str(exc))
+
+
+_COUNT_FIELDS = tuple(
+    name
+    for name, kind in DatasetQuality.__annotations__.items()
+    if kind == "int" and name != "rows"
+)
+QUALITY_SCHEMA = pa.schema(
+    [
+        ("symbol", pa.string()),
+        ("timeframe", pa.string()),
+        ("rows", pa.int64()),
+        ("start", pa.string()),
+        ("end", pa.string()),
+        *((name, pa.int64()) for name in _COUNT_FIELDS),
+        ("error", pa.string()),
+        ("status", pa.string()),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class QualityReport:
+    checks: QualityChecks
+    datasets: list[DatasetQuality] = field(default_factory=list)
+
+    def table(self) -> pa.Table:
+        rows = [{**asdict(item), "status": item.status} for item in self.datasets]
+        return pa.Table.from_pylist(rows, schema=QUALITY_SCHEMA)
+
+    def summary(self) -> dict[str, Any]:
+        statuses = [item.status for item in self.datasets]
+        totals = {
+            name: sum(int(getattr(item, name)) for item in self.datasets)
+            for name in _COUNT_FIELDS
+            if name != "max_gap_bars"
+        }
+        totals["max_gap_bars"] = max((item.max_gap_bars for item in self.datasets), default=0)
+        return {
+            "checks": asdict(self.checks),
+            "datasets": len(self.datasets),
+            "rows": sum(item.rows for item in self.datasets),
+            "status": {name: statuses.count(name) for name in ("ok", "warn", "fail")},
+            "totals": totals,
+            "failed": [
+                f"{item.symbol}/{item.timeframe}" for item in self.datasets if item.status == "fail"
+            ],
+        }
+
+    def write(self, output_dir: str | Path) -> tuple[Path, Path]:
+        target = Path(output_dir)
+        target.mkdir(parents=True, exist_ok=True)
+        table_path = target / QUALITY_TABLE
+        summary_path = target / QUALITY_SUMMARY
+        pq.write_table(self.table(), table_path)
+        summary_path.write_text(json.dumps(self.summary(), indent=2), encoding="utf-8")
+        return table_path, summary_path
+
+
+def verify_store(
+    base_path: str | Path,
+    checks: QualityChecks | None = None,
+    *,
+    symbols: Sequence[str] | None = None,
+    timeframes: Sequence[str] | None = None,
+    workers: int | None = None,
+) -> QualityReport:
+    """Check every stored dataset (optionally filtered), fanning files out across processes."""
+    checks = checks or QualityChecks()
+    get_calendar(checks.calendar)
+    datasets = select_datasets(base_path, symbols, timeframes)
+    with span("data.verify", datasets=len(datasets)) as timing:
+        results = map_datasets(verify_dataset, base_path, datasets, checks, workers=workers)
+        timing.rows = sum(item.rows for item in results)
+    return QualityReport(checks=checks, datasets=results)
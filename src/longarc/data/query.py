@@ -0,0 +1,262 @@
+"""Streaming queries over the whole bar store as one partitioned Arrow dataset."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Iterator, Sequence
+
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.compute as pc  # type: ignore[import-untyped]
+import pyarrow.csv as pacsv  # type: ignore[import-untyped]
+import pyarrow.dataset as ds  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+from longarc.core.profiling import span
+from longarc.core.time import timeframe_interval
+from longarc.data.store import (
+    ADJUSTMENTS,
+    BAR_SCHEMA,
+    Adjustment,
+    apply_adjustment,
+    bar_path,
+    check_raw,
+    load_adjustment,
+    select_datasets,
+)
+
+QUERY_FORMATS: tuple[str, ...] = ("arrow", "parquet", "csv")
+AGGREGATIONS: tuple[str, ...] = ("count", "sum", "mean", "min", "max", "first", "last")
+PARTITION_SCHEMA = pa.schema([("symbol", pa.string()), ("timeframe", pa.string())])
+DATASET_SCHEMA = pa.schema([*PARTITION_SCHEMA, *BAR_SCHEMA])
+
+# Partial aggregates computed per batch and how partials of that kind combine.
+_PARTIALS: dict[str, tuple[tuple[str, str], ...]] = {
+    "count": (("count", "sum"),),
+    "sum": (("sum", "sum"),),
+    "mean": (("sum", "sum"), ("count", "sum")),
+    "min": (("min", "min"),),
+    "max": (("max", "max"),),
+    "first": (("first", "first"),),
+    "last": (("last", "last"),),
+}
+_MERGE_EVERY = 64
+
+
+def parse_aggregation(spec: str) -> tuple[str, str]:
+    """Split ``"close:mean"`` into ``("close", "mean")``."""
+    column, sep, func = spec.partition(":")
+    if not sep or not column or not func:
+        raise ValueError(f"Aggregation must look like column:func, got {spec!r}")
+    return column, func
+
+
+@dataclass(frozen=True)
+class BarQuery:
+    """Projection, filters and optional aggregation for :func:`query_bars`.
+
+    Without ``aggregations`` rows stream out with ``columns`` (default: every column).
+    With them, rows are grouped by ``group_by`` plus, when ``every`` is set, the bar
+    timestamp floored to that interval in UTC; each ``(column, func)`` becomes a
+    ``<column>_<func>`` column. ``start`` is inclusive and ``end`` exclusive.
+    """
+
+    symbols: tuple[str, ...] = ()
+    timeframes: tuple[str, ...] = ()
+    columns: tuple[str, ...] = ()
+    start: datetime | None = None
+    end: datetime | None = None
+    adjust: str = "splits"
+    group_by: tuple[str, ...] = ("symbol", "timeframe")
+    aggregations: tuple[tuple[str, str], ...] = ()
+    every: str | None = None
+    batch_size: int = 65_536
+
+    def __post_init__(self) -> None:
+        unknown = [name for name in self.columns if name not in DATASET_SCHEMA.names]
+        if unknown:
+            allowed = ", ".join(DATASET_SCHEMA.names)
+            raise ValueError(f"Unknown query columns {unknown}. Expected any of: {allowed}")
+        if self.adjust not in ADJUSTMENTS:
+            allowed = ", ".join(ADJUSTMENTS)
+            raise ValueError(f"Unsupported adjustment {self.adjust!r}. Expected one of: {allowed}")
+        for column, func in self.aggregations:
+            if func not in AGGREGATIONS:
+                allowed = ", ".join(AGGREGATIONS)
+                raise ValueError(f"Unsupported aggregation {func!r}. Expected one of: {allowed}")
+            # Time buckets replace ``timestamp`` before aggregation.
+            bucketed = self.every is not None or func in ("sum", "mean")
+            if column not in BAR_SCHEMA.names or (column == "timestamp" and bucketed):
+                raise ValueError(f"Cannot aggregate column {column!r} with {func!r}")
+        unknown_keys = [name for name in self.group_by if name not in PARTITION_SCHEMA.names]
+        if unknown_keys:
+            allowed = ", ".join(PARTITION_SCHEMA.names)
+            raise ValueError(f"Cannot group by {unknown_keys}. Expected any of: {allowed}")
+        if self.every is not None:
+            if not self.aggregations:
+                raise ValueError("Time buckets (every) require at least one aggregation")
+            timeframe_interval(self.every)
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+    @property
+    def output_columns(self) -> list[str]:
+        return list(self.columns) if self.columns else list(DATASET_SCHEMA.names)
+
+
+def bar_dataset(
+    base_path: str | Path,
+    symbols: Sequence[str] | None = None,
+    timeframes: Sequence[str] | None = None,
+) -> ds.Dataset:
+    """Stored bar files as one dataset with ``symbol``/``timeframe`` partition columns.
+
+    Only ``<SYMBOL>/<timeframe>/bars.parquet`` files are included (not the per-symbol
+    actions tables), pruned by ``symbols`` and ``timeframes`` before anything is opened.
+    """
+    files = [
+        str(bar_path(base_path, symbol, timeframe))
+        for symbol, timeframe in select_datasets(base_path, symbols, timeframes)
+    ]
+    return ds.dataset(
+        files,
+        schema=DATASET_SCHEMA,
+        format="parquet",
+        partitioning=ds.partitioning(PARTITION_SCHEMA),
+        partition_base_dir=str(Path(base_path)),
+    )
+
+
+def _filter(query: BarQuery) -> ds.Expression | None:
+    ts_type = BAR_SCHEMA.field("timestamp").type
+    expression = None
+    if query.start is not None:
+        expression = ds.field("timestamp") >= pa.scalar(query.start, ts_type)
+    if query.end is not None:
+        upper = ds.field("timestamp") < pa.scalar(query.end, ts_type)
+        expression = upper if expression is None else expression & upper
+    return expression
+
+
+def _scan(base_path: str | Path, query: BarQuery, columns: list[str]) -> Iterator[pa.RecordBatch]:
+    """Yield filtered, adjusted batches one fragment at a time.
+
+    Adjustment assumes timestamp-sorted files, as the store writes them.
+    """
+    needed = list(columns)
+    if query.adjust != "none" and "timestamp" not in needed:
+        needed.append("timestamp")
+    dataset = bar_dataset(base_path, query.symbols or None, query.timeframes or None)
+    scanner = dataset.scanner(
+        columns=needed,
+        filter=_filter(query),
+        batch_size=query.batch_size,
+        batch_readahead=2,
+        fragment_readahead=1,
+        # Pre-buffering fetches every projected column chunk of a file up front.
+        fragment_scan_options=ds.ParquetFragmentScanOptions(pre_buffer=False),
+    )
+    current: str | None = None
+    adjustment: Adjustment | None = None
+    for tagged in scanner.scan_batches():
+        batch = tagged.record_batch
+        if batch.num_rows == 0:
+            continue
+        if query.adjust != "none":
+            if tagged.fragment.path != current:
+                current = tagged.fragment.path
+                path = Path(current)
+                symbol, timeframe = path.parent.parent.name, path.parent.name
+                check_raw(tagged.fragment.physical_schema, symbol, timeframe)
+                adjustment = load_adjustment(base_path, symbol, timeframe, query.adjust)
+            if adjustment is not None:
+                table = apply_adjustment(pa.Table.from_batches([batch]), adjustment)
+                batch = table.combine_chunks().to_batches()[0]
+        yield batch.select(columns)
+
+
+def _aggregate(base_path: str | Path, query: BarQuery) -> pa.Table:
+    """Fold batches into per-group partial aggregates, keeping memory bounded by groups."""
+    keys = list(query.group_by) + (["timestamp"] if query.every else [])
+    sources = sorted({column for column, _ in query.aggregations})
+    columns = list(dict.fromkeys([*keys, *sources]))
+    partials = sorted(
+        {
+            (column, partial, combine)
+            for column, func in query.aggregations
+            for partial, combine in _PARTIALS[func]
+        }
+    )
+    bucket_seconds = int(timeframe_interval(query.every).total_seconds()) if query.every else 0
+
+    def partial(table: pa.Table) -> pa.Table:
+        if bucket_seconds:
+            bucket = pc.floor_temporal(table["timestamp"], multiple=bucket_seconds, unit="second")
+            table = table.set_column(table.column_names.index("timestamp"), "timestamp", bucket)
+        grouped = table.group_by(keys, use_threads=False)
+        return grouped.aggregate([(column, func) for column, func, _ in partials])
+
+    def merge(tables: list[pa.Table]) -> pa.Table:
+        grouped = pa.concat_tables(tables).group_by(keys, use_threads=False)
+        merged = grouped.aggregate(
+            [(f"{column}_{func}", combine) for column, func, combine in partials]
+        )
+        names = {
+            f"{column}_{func}_{combine}": f"{column}_{func}" for column, func, combine in partials
+        }
+        return merged.rename_columns([names.get(name, name) for name in merged.column_names])
+
+    pending: list[pa.Table] = []
+    scan_schema = pa.schema([DATASET_SCHEMA.field(name) for name in columns])
+    for batch in _scan(base_path, query, columns):
+        pending.append(partial(pa.Table.from_batches([batch])))
+        if len(pending) >= _MERGE_EVERY:
+            pending = [merge(pending)]
+    state = merge(pending) if pending else partial(scan_schema.empty_table())
+
+    outputs: dict[str, pa.ChunkedArray] = {name: state[name] for name in keys}
+    for column, func in query.aggregations:
+        if func == "mean":
+            total = pc.cast(state[f"{column}_sum"], pa.float64())
+            values = pc.divide(total, pc.cast(state[f"{column}_count"], pa.float64()))
+        else:
+            values = state[f"{column}_{_PARTIALS[func][0][0]}"]
+        outputs[f"{column}_{func}"] = values
+    result = pa.table(outputs)
+    return result.sort_by([(name, "ascending") for name in keys]) if keys else result
+
+
+def query_bars(base_path: str | Path, query: BarQuery) -> pa.RecordBatchReader:
+    """Stream the query result; only aggregations hold state (one row per group)."""
+    if query.aggregations:
+        return _aggregate(base_path, query).to_reader()
+    columns = query.output_columns
+    schema = pa.schema([DATASET_SCHEMA.field(name) for name in columns])
+    return pa.RecordBatchReader.from_batches(schema, _scan(base_path, query, columns))
+
+
+def write_query(
+    reader: pa.RecordBatchReader, sink: str | Path | BinaryIO, fmt: str = "arrow"
+) -> int:
+    """Write batches as an Arrow IPC stream, Parquet or CSV; returns rows written."""
+    if fmt not in QUERY_FORMATS:
+        allowed = ", ".join(QUERY_FORMATS)
+        raise ValueError(f"Unsupported query format {fmt!r}. Expected one of: {allowed}")
+    target = str(sink) if isinstance(sink, Path) else sink
+    if fmt == "arrow":
+        writer = pa.ipc.new_stream(target, reader.schema)
+    elif fmt == "parquet":
+        writer = pq.ParquetWriter(target, reader.schema, compression="zstd")
+    else:
+        writer = pacsv.CSVWriter(target, reader.schema)
+    rows = 0
+    with span("data.query.write", format=fmt) as timing:
+        try:
+            for batch in reader:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+        finally:
+            writer.close()
+        timing.rows = rows
+    return rows
@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Mapping, Sequence
+from typing import Any, Callable, Mapping, Sequence, TypeVar
 
+import numpy as np
+import numpy.typing as npt
 import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.compute as pc  # type: ignore[import-untyped]
 import pyarrow.parquet as pq  # type: ignore[import-untyped]
 
+from longarc.core.metrics import REGISTRY, Counter
+from longarc.core.profiling import file_size, span
+
 REQUIRED_COLUMNS: tuple[str, ...] = (
     "timestamp",
     "open",
@@ -20,16 +31,179 @@ REQUIRED_COLUMNS: tuple[str, ...] = (
 )
 
 
+FLOAT_COLUMNS: tuple[str, ...] = ("open", "high", "low", "close", "volume")
+PRICE_COLUMNS: tuple[str, ...] = ("open", "high", "low", "close")
+ACTION_KINDS: tuple[str, ...] = ("split", "dividend")
+ADJUSTMENTS: tuple[str, ...] = ("none", "splits", "all")
+LEGACY_BASES: tuple[str, ...] = ("raw", "splits")
+PRICE_BASIS_KEY = b"longarc.price_basis"
+RAW_PRICE_BASIS = b"raw"
+COMPRESSIONS: tuple[str, ...] = ("zstd", "lz4", "snappy", "gzip", "none")
+FLOAT_ENCODINGS: tuple[str, ...] = ("auto", "dictionary", "byte_stream_split")
+_DEFAULT_LEVELS: dict[str, int] = {"zstd": 3}
+_LEVELLED = frozenset({"zstd", "lz4", "gzip"})
+
+BAR_CACHE_ENV = "LONGARC_BAR_CACHE"
+BAR_CACHE_MAX_BYTES_ENV = "LONGARC_BAR_CACHE_MAX_BYTES"
+DEFAULT_BAR_CACHE_MAX_BYTES = 2 * 1024**3
+
+T = TypeVar("T")
+
+
 @dataclass(frozen=True)
 class WriteResult:
     input_rows: int
     total_rows: int
 
 
+@dataclass(frozen=True)
+class WriteOptions:
+    """Parquet layout for bar files.
+
+    ``float_encoding="auto"`` dictionary-encodes float columns with few distinct values
+    (tick-rounded prices, lot-sized volumes) and byte-stream-splits the rest, which
+    compresses high-entropy floats much better than a dictionary that overflows.
+    ``compression_level=None`` uses 3 for zstd and the codec default otherwise.
+    """
+
+    compression: str = "zstd"
+    compression_level: int | None = None
+    row_group_size: int = 131_072
+    float_encoding: str = "auto"
+    sorting_metadata: bool = True
+
+    def __post_init__(self) -> None:
+        if self.compression not in COMPRESSIONS:
+            allowed = ", ".join(COMPRESSIONS)
+            raise ValueError(
+                f"Unsupported compression {self.compression!r}. Expected one of: {allowed}"
+            )
+        if self.float_encoding not in FLOAT_ENCODINGS:
+            allowed = ", ".join(FLOAT_ENCODINGS)
+            raise ValueError(
+                f"Unsupported float encoding {self.float_encoding!r}. Expected one of: {allowed}"
+            )
+        if self.compression_level is not None and self.compression not in _LEVELLED:
+            raise ValueError(f"Compression {self.compression!r} does not take a level")
+        if self.row_group_size < 1:
+            raise ValueError("row_group_size must be positive")
+
+    def parquet_kwargs(self, table: pa.Table) -> dict[str, Any]:
+        """Keyword arguments for ``pq.write_table`` tailored to ``table``'s columns."""
+        floats = [name for name in FLOAT_COLUMNS if name in table.column_names]
+        if self.float_encoding == "dictionary":
+            split: list[str] = []
+        elif self.float_encoding == "byte_stream_split":
+            split = floats
+        else:
+            split = [
+                name
+                for name in floats
+                if table.num_rows
+                and pc.count_distinct(table[name]).as_py() > table.num_rows // 2
+            ]
+        kwargs: dict[str, Any] = {
+            "compression": self.compression,
+            "row_group_size": self.row_group_size,
+            "use_dictionary": [name for name in table.column_names if name not in split],
+            "use_byte_stream_split": split or False,
+        }
+        level = self.compression_level or _DEFAULT_LEVELS.get(self.compression)
+        if level is not None:
+            kwargs["compression_level"] = level
+        if self.sorting_metadata and "timestamp" in table.column_names:
+            kwargs["sorting_columns"] = [
+                pq.SortingColumn(table.column_names.index("timestamp"))
+            ]
+        return kwargs
+
+
+DEFAULT_WRITE_OPTIONS = WriteOptions()
+
+
+@dataclass(frozen=True)
+class CompactResult:
+    symbol: str
+    timeframe: str
+    rows: int
+    bytes_before: int
+    bytes_after: int
+    row_groups_before: int
+    row_groups_after: int
+    scan_ms_before: float
+    scan_ms_after: float
+
+
 def _bar_file(base_path: Path, symbol: str, timeframe: str) -> Path:
     return base_path / symbol.upper() / timeframe / "bars.parquet"
 
 
+def bar_path(base_path: str | Path, symbol: str, timeframe: str) -> Path:
+    return _bar_file(Path(base_path), symbol, timeframe)
+
+
+def actions_path(base_path: str | Path, symbol: str) -> Path:
+    """Per-symbol corporate actions file, shared by every timeframe of the symbol."""
+    return Path(base_path) / symbol.upper() / "actions.parquet"
+
+
+def list_datasets(base_path: str | Path) -> list[tuple[str, str]]:
+    """Return ``(symbol, timeframe)`` pairs stored under ``base_path``, sorted."""
+    base = Path(base_path)
+    if not base.is_dir():
+        return []
+    return sorted(
+        (path.parent.parent.name, path.parent.name) for path in base.glob("*/*/bars.parquet")
+    )
+
+
+def select_datasets(
+    base_path: str | Path,
+    symbols: Sequence[str] | None = None,
+    timeframes: Sequence[str] | None = None,
+) -> list[tuple[str, str]]:
+    wanted = {symbol.upper() for symbol in symbols} if symbols else None
+    return [
+        (symbol, timeframe)
+        for symbol, timeframe in list_datasets(base_path)
+        if (wanted is None or symbol in wanted) and (not timeframes or timeframe in timeframes)
+    ]
+
+
+def _map_batch(
+    func: Callable[..., T], base_path: str, batch: list[tuple[str, str]], args: tuple[Any, ...]
+) -> list[T]:
+    return [func(base_path, symbol, timeframe, *args) for symbol, timeframe in batch]
+
+
+def map_datasets(
+    func: Callable[..., T],
+    base_path: str | Path,
+    datasets: Sequence[tuple[str, str]],
+    *args: Any,
+    workers: int | None = None,
+) -> list[T]:
+    """Call ``func(base_path, symbol, timeframe, *args)`` per dataset across processes.
+
+    Datasets are striped into ``4 x workers`` batches so thousands of small files cost a
+    few pickling round-trips rather than one each. Results keep the order of ``datasets``.
+    ``func`` must be a picklable module-level function.
+    """
+    base = str(base_path)
+    max_workers = workers if workers is not None else (os.cpu_count() or 1)
+    if max_workers <= 1 or len(datasets) <= 1:
+        return _map_batch(func, base, list(datasets), args)
+    n_batches = min(len(datasets), max_workers * 4)
+    batches = [list(datasets[idx::n_batches]) for idx in range(n_batches)]
+    with ProcessPoolExecutor(max_workers=min(max_workers, n_batches)) as pool:
+        repeated = [func] * n_batches, [base] * n_batches, batches, [args] * n_batches
+        chunks = list(pool.map(_map_batch, *repeated))
+    results: list[T] = []
+    for position in range(len(datasets)):
+        results.append(chunks[position % n_batches][position // n_batches])
+    return results
+
+
 def _to_timestamp(value: Any) -> datetime:
     if isinstance(value, datetime):
         dt = value
@@ -67,37 +241,475 @@ def _normalize_bar(record: Mapping[str, Any]) -> dict[str, Any]:
     }
 
 
+BAR_SCHEMA = pa.schema(
+    [
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("open", pa.float64()),
+        ("high", pa.float64()),
+        ("low", pa.float64()),
+        ("close", pa.float64()),
+        ("volume", pa.float64()),
+    ]
+)
+
+
+ACTIONS_SCHEMA = pa.schema(
+    [
+        ("ex_date", pa.timestamp("us", tz="UTC")),
+        ("kind", pa.string()),
+        ("ratio", pa.float64()),
+        ("cash", pa.float64()),
+    ]
+)
+
+
+def _normalize_action(record: Mapping[str, Any]) -> dict[str, Any]:
+    """Validate one corporate action.
+
+    A ``split`` carries ``ratio`` new shares per old share (4.0 for a 4-for-1 split, 0.1
+    for a 1-for-10 reverse split); a ``dividend`` carries the ``cash`` paid per share.
+    """
+    missing = [field for field in ("ex_date", "kind") if field not in record]
+    if missing:
+        raise ValueError(f"Corporate action is missing required fields: {missing}")
+    kind = str(record["kind"]).lower()
+    if kind not in ACTION_KINDS:
+        allowed = ", ".join(ACTION_KINDS)
+        raise ValueError(f"Unsupported corporate action {kind!r}. Expected one of: {allowed}")
+    ratio = _to_float(record.get("ratio", 1.0), "ratio")
+    cash = _to_float(record.get("cash", 0.0), "cash")
+    if kind == "split" and not ratio > 0:
+        raise ValueError(f"Split ratio must be positive, got {ratio!r}")
+    if kind == "dividend" and not cash > 0:
+        raise ValueError(f"Dividend cash must be positive, got {cash!r}")
+    return {
+        "ex_date": _to_timestamp(record["ex_date"]),
+        "kind": kind,
+        "ratio": ratio if kind == "split" else 1.0,
+        "cash": cash if kind == "dividend" else 0.0,
+    }
+
+
+def read_actions(base_path: str | Path, symbol: str) -> pa.Table:
+    """Stored corporate actions for ``symbol`` sorted by ex-date (empty when none)."""
+    path = actions_path(base_path, symbol)
+    if not path.exists():
+        return ACTIONS_SCHEMA.empty_table()
+    table = pq.read_table(path)
+    return table.sort_by([("ex_date", "ascending"), ("kind", "ascending")])
+
+
+def write_actions(
+    base_path: str | Path, symbol: str, actions: Sequence[Mapping[str, Any]]
+) -> WriteResult:
+    """Merge actions into the symbol's table, keyed by ``(ex_date, kind)``.
+
+    Stored bars are never touched: a new split costs one row here and readers pick it up
+    on their next call.
+    """
+    incoming = [_normalize_action(record) for record in actions]
+    merged = {
+        (row["ex_date"], row["kind"]): row for row in read_actions(base_path, symbol).to_pylist()
+    }
+    for row in incoming:
+        merged[(row["ex_date"], row["kind"])] = row
+    table = pa.Table.from_pylist([merged[key] for key in sorted(merged)], schema=ACTIONS_SCHEMA)
+    path = actions_path(base_path, symbol)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        pq.write_table(table, staging)
+        os.replace(staging, path)
+    finally:
+        staging.unlink(missing_ok=True)
+    return WriteResult(input_rows=len(incoming), total_rows=table.num_rows)
+
+
+def _epoch_us(values: pa.Array | pa.ChunkedArray) -> npt.NDArray[np.int64]:
+    return np.asarray(values.to_numpy(), dtype="datetime64[us]").view(np.int64)
+
+
+def _check_adjust(adjust: str) -> None:
+    if adjust not in ADJUSTMENTS:
+        allowed = ", ".join(ADJUSTMENTS)
+        raise ValueError(f"Unsupported adjustment {adjust!r}. Expected one of: {allowed}")
+
+
+def mark_raw(table: pa.Table) -> pa.Table:
+    """Tag ``table``'s schema as raw, unadjusted bars (the store's own format)."""
+    metadata = dict(table.schema.metadata or {})
+    metadata[PRICE_BASIS_KEY] = RAW_PRICE_BASIS
+    return table.replace_schema_metadata(metadata)
+
+
+def is_raw(schema: pa.Schema) -> bool:
+    return (schema.metadata or {}).get(PRICE_BASIS_KEY) == RAW_PRICE_BASIS
+
+
+def check_raw(schema: pa.Schema, symbol: str, timeframe: str) -> None:
+    """Refuse bar files written before the store kept raw prices.
+
+    Those files may already be split-adjusted by the provider, so adjusting them again or
+    merging raw bars into them would mix two price bases in one dataset.
+    """
+    if not is_raw(schema):
+        raise ValueError(
+            f"Bars for {symbol.upper()} {timeframe} predate the raw store format and may "
+            "already be adjusted; re-download them or run `longarc data migrate`"
+        )
+
+
+def adjustment_factors(
+    timestamps: npt.NDArray[np.int64],
+    actions: pa.Table,
+    adjust: str = "splits",
+    closes: tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]] | None = None,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Cumulative backward ``(price, volume)`` multipliers for sorted epoch-µs ``timestamps``.
+
+    Each action scales every bar strictly before its ex-date. A split divides prices and
+    multiplies volume by ``ratio``. With ``adjust="all"`` a dividend also multiplies prices
+    by ``1 - cash / close``, where ``close`` is the last raw close before the ex-date taken
+    from ``closes`` (timestamp-sorted raw ``(timestamps, close)`` of the whole dataset).
+    """
+    _check_adjust(adjust)
+    ex_dates = _epoch_us(actions["ex_date"])
+    kinds = np.asarray(actions["kind"].to_numpy(zero_copy_only=False), dtype=object)
+    price_step = np.ones(ex_dates.size, dtype=np.float64)
+    volume_step = np.ones(ex_dates.size, dtype=np.float64)
+    if adjust != "none":
+        split = kinds == "split"
+        ratio = np.asarray(actions["ratio"].to_numpy(), dtype=np.float64)[split]
+        price_step[split] = 1.0 / ratio
+        volume_step[split] = ratio
+    if adjust == "all" and closes is not None and closes[0].size:
+        dividend = kinds == "dividend"
+        cash = np.asarray(actions["cash"].to_numpy(), dtype=np.float64)[dividend]
+        prior = np.searchsorted(closes[0], ex_dates[dividend], side="left") - 1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = 1.0 - cash / np.where(prior >= 0, closes[1][np.maximum(prior, 0)], np.nan)
+        # No earlier bar (nothing to adjust) or a payout above the price leaves bars as-is.
+        price_step[dividend] = np.where(np.isfinite(factor) & (factor > 0), factor, 1.0)
+
+    # Factors are constant between consecutive ex-dates: expand one value per segment.
+    order = np.argsort(ex_dates, kind="stable")
+    price = np.append(np.cumprod(price_step[order][::-1])[::-1], 1.0)
+    volume = np.append(np.cumprod(volume_step[order][::-1])[::-1], 1.0)
+    bounds = np.searchsorted(timestamps, ex_dates[order], side="left")
+    counts = np.diff(bounds, prepend=0, append=timestamps.size)
+    return np.repeat(price, counts), np.repeat(volume, counts)
+
+
 def _bars_to_table(bars: list[dict[str, Any]]) -> pa.Table:
     if not bars:
-        schema = pa.schema(
-            [
-                ("timestamp", pa.timestamp("us", tz="UTC")),
-                ("open", pa.float64()),
-                ("high", pa.float64()),
-                ("low", pa.float64()),
-                ("close", pa.float64()),
-                ("volume", pa.float64()),
-            ]
-        )
-        return pa.Table.from_pydict({field: [] for field in REQUIRED_COLUMNS}, schema=schema)
+        return pa.Table.from_pydict({field: [] for field in REQUIRED_COLUMNS}, schema=BAR_SCHEMA)
 
     return pa.Table.from_pylist(bars)
 
 
-def read_bars(base_path: str | Path, symbol: str, timeframe: str) -> list[dict[str, Any]]:
+def _rows_read(timeframe: str) -> Counter:
+    return REGISTRY.counter(
+        "longarc_store_rows_read_total", "Bars read from the store.", timeframe=timeframe
+    )
+
+
+def _cache_lookups(result: str) -> Counter:
+    return REGISTRY.counter(
+        "longarc_bar_cache_lookups_total", "Shared bar cache lookups.", result=result
+    )
+
+
+class BarCache:
+    """Shared tier of decoded bar tables as uncompressed Arrow IPC files.
+
+    Every process that opens an entry memory-maps the same file, so on a tmpfs such as
+    ``/dev/shm`` N readers of one universe share a single copy of the decoded columns in
+    the page cache instead of each decoding Parquet into private memory.
+
+    Entries are keyed by the source file's size, mtime and inode, so any rewrite of
+    ``bars.parquet`` (``write_bars``, ``compact_bars`` or an external tool) makes older
+    entries unreachable; the store's writers also drop them eagerly. When the directory
+    exceeds ``max_bytes`` the least recently used entries are deleted (open mappings in
+    other processes stay valid until they are released).
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int = DEFAULT_BAR_CACHE_MAX_BYTES) -> None:
+        if max_bytes < 1:
+            raise ValueError("Bar cache max_bytes must be positive")
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+
+    def _dataset_dir(self, base_path: str | Path, symbol: str, timeframe: str) -> Path:
+        namespace = hashlib.sha256(str(Path(base_path).resolve()).encode("utf-8")).hexdigest()
+        return self.path / namespace[:16] / symbol.upper() / timeframe
+
+    def table(self, base_path: str | Path, symbol: str, timeframe: str) -> pa.Table:
+        """Return the full timestamp-sorted dataset backed by a memory-mapped IPC file."""
+        source = _bar_file(Path(base_path), symbol, timeframe)
+        stat = source.stat()
+        fingerprint = f"{stat.st_size:x}-{stat.st_mtime_ns:x}-{stat.st_ino:x}"
+        entry = self._dataset_dir(base_path, symbol, timeframe) / f"{fingerprint}.arrow"
+        try:
+            table = pa.ipc.open_file(pa.memory_map(str(entry))).read_all()
+        except (FileNotFoundError, pa.ArrowInvalid):
+            _cache_lookups("miss").inc()
+            decoded = self._materialize(source, entry)
+            try:
+                table = pa.ipc.open_file(pa.memory_map(str(entry))).read_all()
+            except (FileNotFoundError, pa.ArrowInvalid):
+                # Another process evicted or replaced the entry in the meantime.
+                table = decoded
+        else:
+            _cache_lookups("hit").inc()
+            os.utime(entry)
+        return table
+
+    def _materialize(self, source: Path, entry: Path) -> pa.Table:
+        """Write ``entry`` and return the decoded table it was written from."""
+        with span("store.bar_cache.materialize") as timing:
+            table = pq.read_table(source).sort_by("timestamp").combine_chunks()
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            for stale in entry.parent.glob("*.arrow"):
+                # Leave a copy of the same fingerprint another process may have just written.
+                if stale.name != entry.name:
+                    stale.unlink(missing_ok=True)
+            staging = entry.with_name(f".{entry.name}.{os.getpid()}.tmp")
+            try:
+                with pa.OSFile(str(staging), "wb") as sink:
+                    with pa.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table, max_chunksize=max(table.num_rows, 1))
+                os.replace(staging, entry)
+            finally:
+                staging.unlink(missing_ok=True)
+            timing.rows = table.num_rows
+            timing.bytes = file_size(entry)
+        self.evict(keep=entry)
+        return table
+
+    def invalidate(self, base_path: str | Path, symbol: str, timeframe: str) -> None:
+        for entry in self._dataset_dir(base_path, symbol, timeframe).glob("*.arrow"):
+            entry.unlink(missing_ok=True)
+
+    def size_bytes(self) -> int:
+        return sum(file_size(entry) or 0 for entry in self.path.rglob("*.arrow"))
+
+    def evict(self, keep: Path | None = None) -> int:
+        """Delete least recently used entries until the cache fits ``max_bytes``."""
+        entries = []
+        for entry in self.path.rglob("*.arrow"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            entry.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        if evicted:
+            REGISTRY.counter(
+                "longarc_bar_cache_evictions_total", "Shared bar cache entries evicted."
+            ).inc(evicted)
+        return evicted
+
+
+def default_bar_cache() -> BarCache | None:
+    """The cache configured through ``LONGARC_BAR_CACHE`` (inherited by worker processes)."""
+    path = os.environ.get(BAR_CACHE_ENV)
+    if not path:
+        return None
+    max_bytes = int(os.environ.get(BAR_CACHE_MAX_BYTES_ENV, DEFAULT_BAR_CACHE_MAX_BYTES))
+    return _bar_cache(path, max_bytes)
+
+
+@lru_cache(maxsize=8)
+def _bar_cache(path: str, max_bytes: int) -> BarCache:
+    return BarCache(path, max_bytes)
+
+
+def _invalidate_cache(base_path: str | Path, symbol: str, timeframe: str) -> None:
+    cache = default_bar_cache()
+    if cache is not None:
+        cache.invalidate(base_path, symbol, timeframe)
+
+
+@dataclass(frozen=True)
+class Adjustment:
+    """One dataset's corporate actions resolved for :func:`apply_adjustment`.
+
+    ``closes`` holds the raw ``(timestamps, close)`` series dividend factors need.
+    """
+
+    adjust: str
+    actions: pa.Table
+    closes: tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]] | None = None
+
+
+def load_adjustment(
+    base_path: str | Path,
+    symbol: str,
+    timeframe: str,
+    adjust: str,
+    cache: BarCache | None = None,
+) -> Adjustment | None:
+    """Resolve ``adjust`` for one dataset; ``None`` when there is nothing to apply."""
+    _check_adjust(adjust)
+    if adjust == "none":
+        return None
+    actions = read_actions(base_path, symbol)
+    if actions.num_rows == 0:
+        return None
+    closes = None
+    if adjust == "all" and "dividend" in actions["kind"].to_pylist():
+        raw = read_bars_table(
+            base_path, symbol, timeframe, columns=["close"], adjust="none", cache=cache
+        )
+        closes = (_epoch_us(raw["timestamp"]), np.asarray(raw["close"].to_numpy(), np.float64))
+    return Adjustment(adjust=adjust, actions=actions, closes=closes)
+
+
+def apply_adjustment(table: pa.Table, adjustment: Adjustment | None) -> pa.Table:
+    """Scale price and volume columns of timestamp-sorted raw bars; others pass through."""
+    if adjustment is None or table.num_rows == 0:
+        return table
+    price, volume = adjustment_factors(
+        _epoch_us(table["timestamp"]), adjustment.actions, adjustment.adjust, adjustment.closes
+    )
+    for name in table.column_names:
+        factor = price if name in PRICE_COLUMNS else volume if name == "volume" else None
+        if factor is None or not (factor != 1.0).any():
+            continue
+        index = table.column_names.index(name)
+        table = table.set_column(index, name, pc.multiply(table[name], pa.array(factor)))
+    return table
+
+
+def _adjust_table(
+    table: pa.Table,
+    base_path: str | Path,
+    symbol: str,
+    timeframe: str,
+    adjust: str,
+    cache: BarCache | None = None,
+) -> pa.Table:
+    if adjust == "none" or table.num_rows == 0:
+        return table
+    return apply_adjustment(table, load_adjustment(base_path, symbol, timeframe, adjust, cache))
+
+
+def read_bars_table(
+    base_path: str | Path,
+    symbol: str,
+    timeframe: str,
+    columns: Sequence[str] | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    cache: BarCache | None = None,
+    adjust: str = "splits",
+) -> pa.Table:
+    """Read stored bars as a timestamp-sorted Arrow table without row materialization.
+
+    ``start`` is inclusive and ``end`` exclusive; both are pushed down to the Parquet reader.
+    With a ``cache`` (or ``LONGARC_BAR_CACHE`` set) the result is a zero-copy slice of the
+    shared memory-mapped copy instead. Bars are stored raw; ``adjust`` applies the symbol's
+    corporate actions on the way out (``"splits"``, ``"all"`` for splits and dividends, or
+    ``"none"``). Only adjusted columns are copied.
+    """
+    _check_adjust(adjust)
+    path = _bar_file(Path(base_path), symbol, timeframe)
+    selected = list(columns) if columns is not None else list(REQUIRED_COLUMNS)
+    if "timestamp" not in selected:
+        selected.insert(0, "timestamp")
+    if not path.exists():
+        return BAR_SCHEMA.empty_table().select(selected)
+    cache = cache or default_bar_cache()
+
+    with span("store.read_bars_table", symbol=symbol.upper(), timeframe=timeframe) as timing:
+        cached = cache.table(base_path, symbol, timeframe) if cache is not None else None
+        schema = cached.schema if cached is not None else pq.read_schema(path)
+        if adjust != "none":
+            check_raw(schema, symbol, timeframe)
+        available = set(schema.names)
+        missing = [field for field in selected if field not in available]
+        if missing:
+            raise ValueError(f"Parquet is missing required fields: {missing}")
+
+        ts_type = BAR_SCHEMA.field("timestamp").type
+        if cached is not None:
+            table = cached.select(selected)
+            stamps = table["timestamp"].to_numpy().view(np.int64)
+            lo, hi = 0, len(stamps)
+            if start is not None:
+                lo = int(stamps.searchsorted(pa.scalar(_to_timestamp(start), ts_type).value))
+            if end is not None:
+                hi = int(stamps.searchsorted(pa.scalar(_to_timestamp(end), ts_type).value))
+            table = table.slice(lo, max(hi - lo, 0))
+            timing.rows = table.num_rows
+            _rows_read(timeframe).inc(table.num_rows)
+            return _adjust_table(table, base_path, symbol, timeframe, adjust, cache)
+
+        filters: list[tuple[str, str, Any]] = []
+        if start is not None:
+            filters.append(("timestamp", ">=", pa.scalar(_to_timestamp(start), ts_type)))
+        if end is not None:
+            filters.append(("timestamp", "<", pa.scalar(_to_timestamp(end), ts_type)))
+        table = pq.read_table(path, columns=selected, filters=filters or None)
+        timing.rows = table.num_rows
+        timing.bytes = file_size(path)
+    _rows_read(timeframe).inc(table.num_rows)
+    return _adjust_table(table.sort_by("timestamp"), base_path, symbol, timeframe, adjust)
+
+
+def bars_fingerprint(base_path: str | Path, symbol: str, timeframe: str) -> str:
+    """Return a content hash of the stored bars file (``"missing"`` when absent).
+
+    The symbol's corporate actions file, when present, is hashed too since it changes
+    adjusted prices.
+    """
+    path = _bar_file(Path(base_path), symbol, timeframe)
+    if not path.exists():
+        return "missing"
+
+    digest = hashlib.sha256()
+    for source in (path, actions_path(base_path, symbol)):
+        if not source.exists():
+            continue
+        with source.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_bars(
+    base_path: str | Path, symbol: str, timeframe: str, adjust: str = "splits"
+) -> list[dict[str, Any]]:
+    _check_adjust(adjust)
     path = _bar_file(Path(base_path), symbol, timeframe)
     if not path.exists():
         return []
 
-    table = pq.read_table(path)
-    columns = set(table.column_names)
-    missing = [field for field in REQUIRED_COLUMNS if field not in columns]
-    if missing:
-        raise ValueError(f"Parquet is missing required fields: {missing}")
+    with span("store.read_bars", symbol=symbol.upper(), timeframe=timeframe) as timing:
+        table = pq.read_table(path)
+        columns = set(table.column_names)
+        missing = [field for field in REQUIRED_COLUMNS if field not in columns]
+        if missing:
+            raise ValueError(f"Parquet is missing required fields: {missing}")
+        if adjust != "none":
+            check_raw(table.schema, symbol, timeframe)
+        table = _adjust_table(table.sort_by("timestamp"), base_path, symbol, timeframe, adjust)
 
-    rows = table.to_pylist()
-    normalized = [_normalize_bar(row) for row in rows]
-    normalized.sort(key=lambda row: row["timestamp"])
+        rows = table.to_pylist()
+        normalized = [_normalize_bar(row) for row in rows]
+        normalized.sort(key=lambda row: row["timestamp"])
+        timing.rows = len(normalized)
+        timing.bytes = file_size(path)
+    _rows_read(timeframe).inc(len(normalized))
     return normalized
 
 
@@ -106,21 +718,136 @@ def write_bars(
     symbol: str,
     timeframe: str,
     bars: Sequence[Mapping[str, Any]],
+    options: WriteOptions = DEFAULT_WRITE_OPTIONS,
 ) -> WriteResult:
     base = Path(base_path)
     path = _bar_file(base, symbol, timeframe)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    existing = read_bars(base, symbol, timeframe)
-    incoming = [_normalize_bar(record) for record in bars]
+    with span("store.write_bars", symbol=symbol.upper(), timeframe=timeframe) as timing:
+        if path.exists():
+            check_raw(pq.read_schema(path), symbol, timeframe)
+        existing = read_bars(base, symbol, timeframe, adjust="none")
+        with span("store.normalize") as step:
+            incoming = [_normalize_bar(record) for record in bars]
+            step.rows = len(incoming)
 
-    merged: dict[datetime, dict[str, Any]] = {}
-    for row in existing:
-        merged[row["timestamp"]] = row
-    for row in incoming:
-        merged[row["timestamp"]] = row
+        with span("store.merge") as step:
+            merged: dict[datetime, dict[str, Any]] = {}
+            for row in existing:
+                merged[row["timestamp"]] = row
+            for row in incoming:
+                merged[row["timestamp"]] = row
+
+            ordered = [merged[ts] for ts in sorted(merged)]
+            table = mark_raw(_bars_to_table(ordered))
+            step.rows = len(ordered)
 
-    ordered = [merged[ts] for ts in sorted(merged)]
-    table = _bars_to_table(ordered)
-    pq.write_table(table, path)
+        with span("store.parquet_write") as step:
+            pq.write_table(table, path, **options.parquet_kwargs(table))
+            step.rows = table.num_rows
+            step.bytes = file_size(path)
+        timing.rows = len(incoming)
+        timing.bytes = step.bytes
+    _invalidate_cache(base, symbol, timeframe)
+    REGISTRY.counter(
+        "longarc_store_rows_written_total", "Bars received by write_bars.", timeframe=timeframe
+    ).inc(len(incoming))
+    REGISTRY.histogram(
+        "longarc_store_write_seconds", "write_bars wall time.", timeframe=timeframe
+    ).observe(timing.duration_ms / 1000.0)
     return WriteResult(input_rows=len(incoming), total_rows=len(ordered))
+
+
+def _scan_ms(path: Path, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(repeat, 1)):
+        started = time.perf_counter()
+        pq.read_table(path, use_threads=False)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000.0
+
+
+def compact_bars(
+    base_path: str | Path,
+    symbol: str,
+    timeframe: str,
+    options: WriteOptions = DEFAULT_WRITE_OPTIONS,
+    scan_repeat: int = 3,
+) -> CompactResult:
+    """Rewrite one bar file timestamp-sorted with ``options``, replacing it atomically.
+
+    Rows and the price-basis marker are kept as-is (no de-duplication). Scan time is the
+    best of ``scan_repeat`` full single-threaded reads before and after.
+    """
+    path = _bar_file(Path(base_path), symbol, timeframe)
+    with span("store.compact", symbol=symbol.upper(), timeframe=timeframe) as timing:
+        before = pq.ParquetFile(path).metadata
+        bytes_before = path.stat().st_size
+        scan_before = _scan_ms(path, scan_repeat)
+        table = pq.read_table(path).sort_by("timestamp")
+        staging = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            pq.write_table(table, staging, **options.parquet_kwargs(table))
+            os.replace(staging, path)
+        finally:
+            staging.unlink(missing_ok=True)
+        _invalidate_cache(base_path, symbol, timeframe)
+        timing.rows = table.num_rows
+        timing.bytes = path.stat().st_size
+    return CompactResult(
+        symbol=symbol.upper(),
+        timeframe=timeframe,
+        rows=table.num_rows,
+        bytes_before=bytes_before,
+        bytes_after=timing.bytes,
+        row_groups_before=before.num_row_groups,
+        row_groups_after=pq.ParquetFile(path).metadata.num_row_groups,
+        scan_ms_before=scan_before,
+        scan_ms_after=_scan_ms(path, scan_repeat),
+    )
+
+
+def migrate_bars(
+    base_path: str | Path,
+    symbol: str,
+    timeframe: str,
+    basis: str,
+    options: WriteOptions = DEFAULT_WRITE_OPTIONS,
+) -> WriteResult:
+    """Convert a bar file written before the raw store format, replacing it atomically.
+
+    ``basis`` says what the legacy prices are: ``"splits"`` (Polygon's default
+    split-adjusted bars) divides the symbol's recorded splits back out, ``"raw"`` only adds
+    the marker. Files already in the raw format are left untouched, so re-running is safe.
+    Splits missing from the actions table cannot be undone; re-download the symbol instead.
+    """
+    if basis not in LEGACY_BASES:
+        allowed = ", ".join(LEGACY_BASES)
+        raise ValueError(f"Unsupported price basis {basis!r}. Expected one of: {allowed}")
+    path = _bar_file(Path(base_path), symbol, timeframe)
+    with span("store.migrate", symbol=symbol.upper(), timeframe=timeframe) as timing:
+        table = pq.read_table(path)
+        timing.rows = table.num_rows
+        if is_raw(table.schema):
+            return WriteResult(input_rows=0, total_rows=table.num_rows)
+        table = table.sort_by("timestamp")
+        actions = read_actions(base_path, symbol)
+        if basis == "splits" and actions.num_rows:
+            price, volume = adjustment_factors(_epoch_us(table["timestamp"]), actions, "splits")
+            for name in table.column_names:
+                factor = price if name in PRICE_COLUMNS else volume if name == "volume" else None
+                if factor is None:
+                    continue
+                index = table.column_names.index(name)
+                table = table.set_column(index, name, pc.divide(table[name], pa.array(factor)))
+        table = mark_raw(table)
+        staging = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            pq.write_table(table, staging, **options.parquet_kwargs(table))
+            os.replace(staging, path)
+        finally:
+            staging.unlink(missing_ok=True)
+        _invalidate_cache(base_path, symbol, timeframe)
+        timing.bytes = file_size(path)
+    return WriteResult(input_rows=table.num_rows, total_rows=table.num_rows)
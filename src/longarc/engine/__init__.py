@@ -0,0 +1,19 @@
+"""Simulation and trading engines."""
+
+from longarc.engine.backtest import BacktestResult, run_backtest, run_backtest_cached
+from longarc.engine.portfolio import (
+    PortfolioResult,
+    PortfolioSimulator,
+    PortfolioState,
+    StepResult,
+)
+
+__all__ = [
+    "BacktestResult",
+    "PortfolioResult",
+    "PortfolioSimulator",
+    "PortfolioState",
+    "StepResult",
+    "run_backtest",
+    "run_backtest_cached",
+]
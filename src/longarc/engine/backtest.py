@@ -0,0 +1,326 @@
+"""Backtest engine and content-addressed run cache."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+import numpy.typing as npt
+import pyarrow as pa  # type: ignore[import-untyped]
+
+import longarc
+from longarc.core.config import AppConfig
+from longarc.core.metrics import REGISTRY, Counter
+from longarc.core.profiling import span
+from longarc.core.time import session_days
+from longarc.data.store import bars_fingerprint, read_bars_table
+from longarc.engine.portfolio import PortfolioResult, PortfolioSimulator
+from longarc.report.performance import summary_metrics
+from longarc.storage.journal import record_positions, record_trades
+from longarc.storage.runs import RunArtifacts, RunStore
+from longarc.strategy import get_strategy
+
+LOGGER = logging.getLogger(__name__)
+
+FloatArray = npt.NDArray[np.float64]
+TimestampArray = npt.NDArray[np.datetime64]
+
+_TIMESTAMP_TYPE = pa.timestamp("us", tz="UTC")
+
+
+@dataclass(frozen=True)
+class PriceMatrix:
+    """Close prices aligned on the union of bar timestamps; NaN where a symbol has no bar."""
+
+    timestamps: TimestampArray
+    symbols: list[str]
+    close: FloatArray
+
+
+@dataclass(frozen=True)
+class BacktestResult:
+    equity: pa.Table
+    trades: pa.Table
+    metrics: dict[str, Any]
+    positions: pa.Table
+
+
+def parse_bound(value: str, *, inclusive_end: bool = False) -> datetime:
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    if inclusive_end and len(value) == 10:
+        parsed += timedelta(days=1)
+    return parsed
+
+
+def forward_fill(values: FloatArray) -> FloatArray:
+    """Carry the last finite value down each column."""
+    rows = np.arange(values.shape[0])[:, None]
+    last_valid = np.where(np.isfinite(values), rows, 0)
+    np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+    filled = values[last_valid, np.arange(values.shape[1])]
+    seen = np.maximum.accumulate(np.isfinite(values), axis=0)
+    return np.where(seen, filled, np.nan)
+
+
+def lag_weights(weights: FloatArray) -> FloatArray:
+    """Shift target weights one bar later, so a signal from bar t's close trades at bar t+1.
+
+    The first bar stays flat (zero weights).
+    """
+    lagged = np.zeros_like(weights)
+    lagged[1:] = weights[:-1]
+    return lagged
+
+
+def load_price_matrix(
+    data_path: str | Path,
+    symbols: Sequence[str],
+    timeframe: str,
+    start: str | None = None,
+    end: str | None = None,
+    adjust: str = "splits",
+) -> PriceMatrix:
+    start_ts = parse_bound(start) if start else None
+    end_ts = parse_bound(end, inclusive_end=True) if end else None
+    normalized = [symbol.upper() for symbol in symbols]
+
+    per_symbol: list[tuple[TimestampArray, FloatArray]] = []
+    for symbol in normalized:
+        table = read_bars_table(
+            data_path,
+            symbol,
+            timeframe,
+            columns=["close"],
+            start=start_ts,
+            end=end_ts,
+            adjust=adjust,
+        )
+        timestamps = np.asarray(table["timestamp"].to_numpy(), dtype="datetime64[us]")
+        closes = np.asarray(table["close"].to_numpy(), dtype=np.float64)
+        per_symbol.append((timestamps, closes))
+
+    if per_symbol:
+        union = np.unique(np.concatenate([timestamps for timestamps, _ in per_symbol]))
+    else:
+        union = np.array([], dtype="datetime64[us]")
+
+    close = np.full((union.size, len(normalized)), np.nan, dtype=np.float64)
+    for column, (timestamps, closes) in enumerate(per_symbol):
+        close[np.searchsorted(union, timestamps), column] = closes
+    return PriceMatrix(timestamps=union, symbols=normalized, close=close)
+
+
+def build_trades_table(
+    timestamps: TimestampArray,
+    symbols: list[str],
+    marks: FloatArray,
+    result: PortfolioResult,
+) -> pa.Table:
+    bar_idx, symbol_idx = np.nonzero(result.order_qty)
+    qty = result.order_qty[bar_idx, symbol_idx]
+    price = result.fill_price[bar_idx, symbol_idx]
+    mark = marks[bar_idx, symbol_idx]
+    return pa.table(
+        {
+            "timestamp": pa.array(timestamps[bar_idx], type=_TIMESTAMP_TYPE),
+            "symbol": pa.array(np.asarray(symbols, dtype=object)[symbol_idx], type=pa.string()),
+            "side": pa.array(np.where(qty > 0, "buy", "sell"), type=pa.string()),
+            "qty": np.abs(qty),
+            "price": price,
+            "notional": np.abs(qty * price),
+            "fee": result.fees[bar_idx, symbol_idx],
+            "slippage": np.abs(qty * (price - mark)),
+        }
+    )
+
+
+def build_equity_table(
+    timestamps: TimestampArray,
+    marks: FloatArray,
+    result: PortfolioResult,
+) -> pa.Table:
+    exposure = np.abs(result.positions * np.nan_to_num(marks, nan=0.0)).sum(axis=1)
+    return pa.table(
+        {
+            "timestamp": pa.array(timestamps, type=_TIMESTAMP_TYPE),
+            "equity": result.equity,
+            "cash": result.cash,
+            "pnl": result.pnl,
+            "gross_exposure": exposure,
+            "halted": result.halted,
+        }
+    )
+
+
+def build_positions_table(
+    timestamps: TimestampArray,
+    symbols: list[str],
+    marks: FloatArray,
+    result: PortfolioResult,
+) -> pa.Table:
+    """Non-zero holdings at the last bar, marked at the last known price."""
+    if timestamps.size == 0:
+        held = np.zeros(0, dtype=np.int64)
+        last_ts = timestamps
+    else:
+        held = np.flatnonzero(result.positions[-1])
+        last_ts = np.full(held.size, timestamps[-1], dtype="datetime64[us]")
+    return pa.table(
+        {
+            "timestamp": pa.array(last_ts, type=_TIMESTAMP_TYPE),
+            "symbol": pa.array(np.asarray(symbols, dtype=object)[held], type=pa.string()),
+            "qty": result.positions[-1][held] if held.size else np.zeros(0, dtype=np.float64),
+            "mark": marks[-1][held] if held.size else np.zeros(0, dtype=np.float64),
+        }
+    )
+
+
+def summarize_run(
+    config: AppConfig,
+    timestamps: TimestampArray,
+    symbols: list[str],
+    marks: FloatArray,
+    result: PortfolioResult,
+) -> BacktestResult:
+    """Turn a simulated account history into equity/trades tables and headline metrics."""
+    trades = build_trades_table(timestamps, symbols, marks, result)
+    metrics: dict[str, Any] = dict(
+        summary_metrics(result.equity, config.portfolio.initial_cash, config.universe.timeframe)
+    )
+    metrics.update(
+        {
+            "base_currency": result.base_currency,
+            "trade_count": trades.num_rows,
+            "total_fees": float(result.fees.sum()),
+            "total_slippage": float(np.sum(trades["slippage"].to_numpy())),
+            "kill_switch_tripped": bool(result.halted.any()),
+        }
+    )
+    return BacktestResult(
+        equity=build_equity_table(timestamps, marks, result),
+        trades=trades,
+        metrics=metrics,
+        positions=build_positions_table(timestamps, symbols, marks, result),
+    )
+
+
+def run_backtest(
+    config: AppConfig,
+    start: str | None = None,
+    end: str | None = None,
+) -> BacktestResult:
+    """Run the configured strategy over stored bars for the whole universe."""
+    with span("backtest.load_prices") as timing:
+        prices = load_price_matrix(
+            config.data.path,
+            config.universe.symbols,
+            config.universe.timeframe,
+            start,
+            end,
+            adjust=config.data.adjust,
+        )
+        timing.rows = prices.timestamps.size
+    with span("backtest.signals", strategy=config.strategy.name) as timing:
+        strategy = get_strategy(config.strategy.name, config.strategy.params)
+        marks = forward_fill(prices.close)
+        # Signals use bar t's close, so they can only trade from bar t+1.
+        weights = lag_weights(strategy.target_weights(marks))
+        days = session_days(pa.array(prices.timestamps, type=_TIMESTAMP_TYPE), config.timezone)
+        timing.rows = prices.timestamps.size
+
+    with span("backtest.simulate") as timing:
+        simulator = PortfolioSimulator(config.portfolio, config.risk, config.cost_model)
+        result = simulator.run(prices.close, weights, days)
+        timing.rows = prices.timestamps.size
+    with span("backtest.summarize"):
+        return summarize_run(config, prices.timestamps, prices.symbols, marks, result)
+
+
+def code_version() -> str:
+    """Package version plus a digest of the installed ``longarc`` sources."""
+    digest = hashlib.sha256()
+    root = Path(longarc.__file__).parent
+    for path in sorted(root.rglob("*.py")):
+        digest.update(path.relative_to(root).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return f"{longarc.__version__}+{digest.hexdigest()[:12]}"
+
+
+def backtest_inputs(
+    config: AppConfig,
+    start: str | None = None,
+    end: str | None = None,
+) -> dict[str, Any]:
+    """Everything a backtest result depends on, in canonical JSON-compatible form."""
+    timeframe = config.universe.timeframe
+    fingerprints = {
+        f"{symbol.upper()}/{timeframe}": bars_fingerprint(config.data.path, symbol, timeframe)
+        for symbol in config.universe.symbols
+    }
+    return {
+        "config": config.model_dump(mode="json"),
+        "start": start,
+        "end": end,
+        "data": fingerprints,
+        "code_version": code_version(),
+    }
+
+
+def cache_key(inputs: dict[str, Any]) -> str:
+    canonical = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _cache_lookup(result: str) -> Counter:
+    return REGISTRY.counter(
+        "longarc_backtest_cache_lookups_total", "Backtest run-cache lookups.", result=result
+    )
+
+
+def run_backtest_cached(
+    config: AppConfig,
+    runs: RunStore,
+    start: str | None = None,
+    end: str | None = None,
+    *,
+    use_cache: bool = True,
+) -> tuple[RunArtifacts, bool]:
+    """Return stored artifacts for identical inputs, otherwise run and store the backtest.
+
+    The second element of the returned tuple is True on a cache hit.
+    """
+    with span("backtest.cache_key"):
+        inputs = backtest_inputs(config, start, end)
+        key = cache_key(inputs)
+    run_id = f"bt-{key[:16]}"
+
+    if use_cache and runs.exists(run_id) and runs.read_manifest(run_id).get("cache_key") == key:
+        LOGGER.info("Backtest cache hit: run_id=%s", run_id, extra={"run_id": run_id})
+        _cache_lookup("hit").inc()
+        return runs.load(run_id), True
+    _cache_lookup("miss").inc()
+
+    result = run_backtest(config, start, end)
+    with span("backtest.journal") as timing, runs.open_journal(
+        run_id, fsync="shutdown"
+    ) as journal:
+        record_trades(journal, result.trades)
+        record_positions(journal, result.positions)
+        timing.rows = result.trades.num_rows * 2 + result.positions.num_rows
+    manifest = {
+        "run_id": run_id,
+        "mode": "backtest",
+        "cache_key": key,
+        "created_at": datetime.now(tz=UTC).isoformat(),
+        "inputs": inputs,
+    }
+    runs.save(run_id, manifest, result.equity, result.trades, result.metrics)
+    return runs.load(run_id), False
@@ -0,0 +1,213 @@
+"""Vectorized multi-symbol portfolio simulation with risk limits."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from longarc.core.config import CostModelConfig, PortfolioConfig, RiskConfig
+from longarc.risk.rules import clip_order_notional, clip_position_notional, daily_loss_breached
+
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.int64]
+BoolArray = npt.NDArray[np.bool_]
+
+
+@dataclass
+class PortfolioState:
+    """Mutable account state carried between timesteps."""
+
+    cash: float
+    positions: FloatArray
+    last_prices: FloatArray
+    day: int | None = None
+    day_start_equity: float = 0.0
+    halted: bool = False
+
+    @classmethod
+    def initial(cls, n_symbols: int, initial_cash: float) -> PortfolioState:
+        return cls(
+            cash=float(initial_cash),
+            positions=np.zeros(n_symbols, dtype=np.float64),
+            last_prices=np.full(n_symbols, np.nan, dtype=np.float64),
+            day_start_equity=float(initial_cash),
+        )
+
+    def equity(self) -> float:
+        marks = np.nan_to_num(self.last_prices, nan=0.0)
+        return float(self.cash + self.positions @ marks)
+
+
+@dataclass(frozen=True)
+class StepResult:
+    order_qty: FloatArray
+    fill_price: FloatArray
+    fees: FloatArray
+    equity: float
+    halted: bool
+
+
+@dataclass(frozen=True)
+class PortfolioResult:
+    """Per-timestep account history; array shapes are [T] or [T, N]."""
+
+    base_currency: str
+    initial_cash: float
+    equity: FloatArray
+    cash: FloatArray
+    positions: FloatArray
+    order_qty: FloatArray
+    fill_price: FloatArray
+    fees: FloatArray
+    halted: BoolArray
+
+    @property
+    def pnl(self) -> FloatArray:
+        """Per-bar PnL in ``base_currency`` (fees and slippage included)."""
+        return np.diff(self.equity, prepend=self.initial_cash)
+
+
+class PortfolioSimulator:
+    """Apply target weights to a whole universe per timestep.
+
+    Prices that are NaN or non-positive mark a symbol as untradable for that bar: no order
+    is sent and the position is valued at its last known price. NaN target weights hold the
+    current position.
+    """
+
+    def __init__(
+        self,
+        portfolio: PortfolioConfig,
+        risk: RiskConfig,
+        cost_model: CostModelConfig,
+    ) -> None:
+        self._portfolio = portfolio
+        self._risk = risk
+        self._fee_rate = cost_model.fee_bps / 10_000.0
+        self._slippage_rate = cost_model.slippage_bps / 10_000.0
+
+    @property
+    def base_currency(self) -> str:
+        return self._portfolio.base_currency
+
+    def initial_state(self, n_symbols: int) -> PortfolioState:
+        return PortfolioState.initial(n_symbols, self._portfolio.initial_cash)
+
+    def plan_orders(
+        self,
+        state: PortfolioState,
+        prices: FloatArray,
+        target_weights: FloatArray,
+        day: int,
+    ) -> FloatArray:
+        """Mark ``state`` to ``prices`` and return risk-clipped order quantities for one bar.
+
+        Rolls the daily-loss baseline on a new ``day`` and latches the kill switch when the
+        configured loss is breached; once halted, only position-reducing orders are produced.
+        """
+        tradable = np.isfinite(prices) & (prices > 0)
+        marks = np.where(tradable, prices, state.last_prices)
+        state.last_prices = marks
+        values = np.nan_to_num(marks, nan=0.0)
+        equity = float(state.cash + state.positions @ values)
+
+        if state.day != day:
+            state.day = day
+            state.day_start_equity = equity
+
+        if (
+            self._risk.kill_switch
+            and not state.halted
+            and daily_loss_breached(equity, state.day_start_equity, self._risk.max_daily_loss)
+        ):
+            state.halted = True
+
+        current = state.positions * values
+        if state.halted:
+            target = np.zeros_like(current)
+        else:
+            target = np.where(np.isnan(target_weights), current, target_weights * equity)
+        target = clip_position_notional(target, self._risk.max_position_notional)
+        orders = clip_order_notional(target - current, self._risk.max_order_notional)
+
+        safe_marks = np.where(tradable, prices, 1.0)
+        order_qty: FloatArray = np.where(tradable, orders / safe_marks, 0.0)
+        return order_qty
+
+    def fill(self, state: PortfolioState, order_qty: FloatArray) -> StepResult:
+        """Fill ``order_qty`` at the marked prices plus slippage and book cash and fees."""
+        marks = np.nan_to_num(state.last_prices, nan=0.0)
+        fill_price = np.where(
+            order_qty != 0, marks * (1.0 + np.sign(order_qty) * self._slippage_rate), 0.0
+        )
+        traded = order_qty * fill_price
+        fees = np.abs(traded) * self._fee_rate
+
+        state.positions = state.positions + order_qty
+        state.cash = float(state.cash - traded.sum() - fees.sum())
+        return StepResult(
+            order_qty=order_qty,
+            fill_price=fill_price,
+            fees=fees,
+            equity=state.equity(),
+            halted=state.halted,
+        )
+
+    def step(
+        self,
+        state: PortfolioState,
+        prices: FloatArray,
+        target_weights: FloatArray,
+        day: int,
+    ) -> StepResult:
+        """Advance ``state`` by one bar and return the orders filled at that bar."""
+        return self.fill(state, self.plan_orders(state, prices, target_weights, day))
+
+    def run(
+        self,
+        prices: FloatArray,
+        target_weights: FloatArray,
+        days: IntArray,
+    ) -> PortfolioResult:
+        """Simulate ``prices``/``target_weights`` of shape [T, N] bar by bar."""
+        if prices.shape != target_weights.shape:
+            raise ValueError(
+                f"prices shape {prices.shape} does not match target weights "
+                f"shape {target_weights.shape}"
+            )
+        if prices.ndim != 2 or days.shape != (prices.shape[0],):
+            raise ValueError("Expected prices of shape [T, N] and days of shape [T].")
+
+        n_steps, n_symbols = prices.shape
+        state = self.initial_state(n_symbols)
+        equity = np.empty(n_steps, dtype=np.float64)
+        cash = np.empty(n_steps, dtype=np.float64)
+        positions = np.empty((n_steps, n_symbols), dtype=np.float64)
+        order_qty = np.empty((n_steps, n_symbols), dtype=np.float64)
+        fill_price = np.empty((n_steps, n_symbols), dtype=np.float64)
+        fees = np.empty((n_steps, n_symbols), dtype=np.float64)
+        halted = np.empty(n_steps, dtype=np.bool_)
+
+        for idx in range(n_steps):
+            result = self.step(state, prices[idx], target_weights[idx], int(days[idx]))
+            equity[idx] = result.equity
+            cash[idx] = state.cash
+            positions[idx] = state.positions
+            order_qty[idx] = result.order_qty
+            fill_price[idx] = result.fill_price
+            fees[idx] = result.fees
+            halted[idx] = result.halted
+
+        return PortfolioResult(
+            base_currency=self.base_currency,
+            initial_cash=self._portfolio.initial_cash,
+            equity=equity,
+            cash=cash,
+            positions=positions,
+            order_qty=order_qty,
+            fill_price=fill_price,
+            fees=fees,
+            halted=halted,
+        )
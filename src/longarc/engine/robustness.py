@@ -0,0 +1,190 @@
+"""Monte Carlo / bootstrap robustness analysis over stored backtest runs."""
+
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.compute as pc  # type: ignore[import-untyped]
+
+from longarc.core.profiling import span
+from longarc.report.performance import periods_per_year, simple_returns
+from longarc.storage.runs import RunArtifacts
+
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.int64]
+
+METHODS: tuple[str, ...] = ("block_bootstrap", "shuffle")
+
+
+@dataclass(frozen=True)
+class RobustnessSpec:
+    """Resampling settings.
+
+    ``block_bootstrap`` draws circular blocks of ``block_size`` bars with replacement;
+    ``shuffle`` randomly reorders bars (and therefore the trades executed on them).
+    ``slippage_sigma`` > 0 scales each bar's realized slippage by a lognormal factor.
+    """
+
+    paths: int = 1000
+    method: str = "block_bootstrap"
+    block_size: int = 20
+    slippage_sigma: float = 0.0
+    seed: int = 0
+    batch_size: int = 500
+
+    def __post_init__(self) -> None:
+        if self.method not in METHODS:
+            raise ValueError(f"Unsupported method {self.method!r}. Expected one of: {METHODS}")
+        if self.paths < 1 or self.block_size < 1 or self.batch_size < 1:
+            raise ValueError("paths, block_size and batch_size must be positive.")
+        if self.slippage_sigma < 0:
+            raise ValueError("slippage_sigma must be non-negative.")
+
+
+@dataclass(frozen=True)
+class RobustnessResult:
+    max_drawdown: FloatArray
+    sharpe: FloatArray
+    terminal_equity: FloatArray
+
+    def to_table(self) -> pa.Table:
+        return pa.table(
+            {
+                "path": np.arange(self.terminal_equity.size, dtype=np.int64),
+                "max_drawdown": self.max_drawdown,
+                "sharpe": self.sharpe,
+                "terminal_equity": self.terminal_equity,
+            }
+        )
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        out: dict[str, dict[str, float]] = {}
+        for name, values in (
+            ("max_drawdown", self.max_drawdown),
+            ("sharpe", self.sharpe),
+            ("terminal_equity", self.terminal_equity),
+        ):
+            p5, p50, p95 = np.percentile(values, [5, 50, 95])
+            out[name] = {
+                "mean": float(values.mean()),
+                "std": float(values.std()),
+                "p5": float(p5),
+                "p50": float(p50),
+                "p95": float(p95),
+            }
+        return out
+
+
+def _resample_index(
+    rng: np.random.Generator,
+    n_paths: int,
+    n_bars: int,
+    spec: RobustnessSpec,
+) -> IntArray:
+    if spec.method == "shuffle":
+        return np.argsort(rng.random((n_paths, n_bars)), axis=1)
+
+    block = min(spec.block_size, n_bars)
+    n_blocks = math.ceil(n_bars / block)
+    starts = rng.integers(0, n_bars, size=(n_paths, n_blocks))
+    index = (starts[:, :, None] + np.arange(block)[None, None, :]) % n_bars
+    return index.reshape(n_paths, n_blocks * block)[:, :n_bars]
+
+
+def simulate_batch(
+    returns: FloatArray,
+    slippage: FloatArray,
+    initial_equity: float,
+    annualization: float,
+    spec: RobustnessSpec,
+    seed: np.random.SeedSequence,
+    n_paths: int,
+) -> tuple[FloatArray, FloatArray, FloatArray]:
+    """Simulate ``n_paths`` resampled equity curves and return their path statistics.
+
+    ``slippage`` holds each bar's realized slippage as a fraction of prior equity.
+    """
+    rng = np.random.default_rng(seed)
+    index = _resample_index(rng, n_paths, returns.size, spec)
+    path_returns = returns[index]
+    if spec.slippage_sigma > 0:
+        scale = rng.lognormal(-0.5 * spec.slippage_sigma**2, spec.slippage_sigma, index.shape)
+        path_returns = path_returns - slippage[index] * (scale - 1.0)
+
+    growth = np.cumprod(1.0 + path_returns, axis=1, dtype=np.float64)
+    peaks = np.maximum.accumulate(np.maximum(growth, 1.0), axis=1)
+    max_drawdown: FloatArray = (growth / peaks - 1.0).min(axis=1)
+
+    std = path_returns.std(axis=1, ddof=1) if returns.size > 1 else np.zeros(n_paths)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe: FloatArray = np.where(
+            std > 0, path_returns.mean(axis=1) / std * math.sqrt(annualization), 0.0
+        )
+    return max_drawdown, sharpe, initial_equity * growth[:, -1]
+
+
+def _bar_slippage_fraction(artifacts: RunArtifacts, initial_equity: float) -> FloatArray:
+    equity_table = artifacts.equity
+    equity = np.asarray(equity_table["equity"].to_numpy(), dtype=np.float64)
+    previous = np.concatenate([[initial_equity], equity[:-1]])
+    per_bar = np.zeros(equity.size, dtype=np.float64)
+    trades = artifacts.trades
+    if trades.num_rows:
+        grouped = trades.group_by("timestamp").aggregate([("slippage", "sum")])
+        positions = pc.index_in(grouped["timestamp"], value_set=equity_table["timestamp"])
+        per_bar[np.asarray(positions.to_numpy(zero_copy_only=False), dtype=np.int64)] = (
+            grouped["slippage_sum"].to_numpy()
+        )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(previous > 0, per_bar / previous, 0.0)
+
+
+def run_robustness(
+    artifacts: RunArtifacts,
+    spec: RobustnessSpec,
+    workers: int | None = None,
+) -> RobustnessResult:
+    """Resample a stored run's bar returns into ``spec.paths`` synthetic equity curves.
+
+    Paths are simulated in batches of ``spec.batch_size``; each batch owns a child of the
+    root seed, so results are identical for any ``workers`` count.
+    """
+    config: dict[str, Any] = artifacts.manifest["inputs"]["config"]
+    initial_equity = float(config["portfolio"]["initial_cash"])
+    annualization = periods_per_year(str(config["universe"]["timeframe"]))
+    equity = np.asarray(artifacts.equity["equity"].to_numpy(), dtype=np.float64)
+    if equity.size == 0:
+        raise ValueError(f"Run {artifacts.run_id!r} has an empty equity curve.")
+
+    returns = simple_returns(equity, initial_equity)
+    slippage = _bar_slippage_fraction(artifacts, initial_equity)
+    sizes = [spec.batch_size] * (spec.paths // spec.batch_size)
+    if spec.paths % spec.batch_size:
+        sizes.append(spec.paths % spec.batch_size)
+    seeds = np.random.SeedSequence(spec.seed).spawn(len(sizes))
+    args = [
+        (returns, slippage, initial_equity, annualization, spec, seed, size)
+        for seed, size in zip(seeds, sizes)
+    ]
+
+    max_workers = workers if workers is not None else (os.cpu_count() or 1)
+    with span("robustness.simulate", method=spec.method) as timing:
+        if max_workers <= 1 or len(args) == 1:
+            batches = [simulate_batch(*batch_args) for batch_args in args]
+        else:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(args))) as pool:
+                batches = list(pool.map(simulate_batch, *zip(*args)))
+        timing.rows = spec.paths
+
+    return RobustnessResult(
+        max_drawdown=np.concatenate([batch[0] for batch in batches]),
+        sharpe=np.concatenate([batch[1] for batch in batches]),
+        terminal_equity=np.concatenate([batch[2] for batch in batches]),
+    )
@@ -0,0 +1,810 @@
+"""Asyncio trading loop: fetch -> signal -> orders -> execute -> persist, one cycle per bar."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Mapping, Sequence
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import numpy.typing as npt
+import pyarrow as pa  # type: ignore[import-untyped]
+
+from longarc.broker.paper_sim import PaperSimBroker
+from longarc.core.config import AppConfig
+from longarc.core.metrics import COUNT_BUCKETS, REGISTRY
+from longarc.core.profiling import span
+from longarc.core.schedule import CronSchedule
+from longarc.core.time import timeframe_interval
+from longarc.data.store import read_bars_table
+from longarc.engine.backtest import BacktestResult, parse_bound, summarize_run
+from longarc.engine.portfolio import PortfolioResult, PortfolioSimulator, StepResult
+from longarc.storage.journal import JournalWriter, record_positions
+from longarc.storage.snapshots import SnapshotStore, decode_array, encode_array
+from longarc.strategy import IndicatorCache, get_strategy
+
+LOGGER = logging.getLogger(__name__)
+
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.int64]
+TimestampArray = npt.NDArray[np.datetime64]
+
+_CYCLES = REGISTRY.counter("longarc_engine_cycles_total", "Trading cycles completed.")
+_CYCLE_SECONDS = REGISTRY.histogram(
+    "longarc_engine_cycle_seconds", "Trading cycle latency (fetch through persist)."
+)
+_ORDERS_PER_CYCLE = REGISTRY.histogram(
+    "longarc_engine_orders_per_cycle", "Orders planned per trading cycle.", COUNT_BUCKETS
+)
+_ORDERS = REGISTRY.counter("longarc_engine_orders_total", "Orders planned.")
+
+
+def parse_speed(value: str) -> float:
+    """Parse a replay speed: ``realtime`` (1x), ``max`` (no pacing), ``Nx`` or ``N``."""
+    normalized = value.strip().lower()
+    if normalized == "realtime":
+        return 1.0
+    if normalized in {"max", "asap"}:
+        return math.inf
+    try:
+        speed = float(normalized.removesuffix("x"))
+    except ValueError as exc:
+        raise ValueError(
+            f"Invalid speed {value!r}. Expected realtime, max, or a multiplier like 10x."
+        ) from exc
+    if speed <= 0:
+        raise ValueError(f"Speed must be positive, got {value!r}")
+    return speed
+
+
+@dataclass(frozen=True)
+class CycleReport:
+    cycle: int
+    timestamp: datetime
+    symbols_with_bars: int
+    orders: int
+    fetch_ms: float
+    signal_ms: float
+    orders_ms: float
+    execute_ms: float
+    persist_ms: float
+    total_ms: float
+
+
+@dataclass(frozen=True)
+class PaperSimResult:
+    summaries: dict[str, BacktestResult]
+    cycles: list[CycleReport]
+    latency: dict[str, float]
+
+    @property
+    def summary(self) -> BacktestResult:
+        """The summary of a single-strategy run; see :attr:`summaries` otherwise."""
+        if len(self.summaries) != 1:
+            raise ValueError(f"Run hosts {len(self.summaries)} strategies; use summaries.")
+        return next(iter(self.summaries.values()))
+
+    def cycles_table(self) -> pa.Table:
+        return pa.Table.from_pylist([asdict(report) for report in self.cycles])
+
+
+def latency_summary(cycles: Sequence[CycleReport], bar_interval_seconds: float) -> dict[str, float]:
+    """Cycle latency percentiles compared against the bar interval."""
+    if not cycles:
+        return {"cycles": 0.0, "bar_interval_ms": bar_interval_seconds * 1000.0}
+    totals = np.array([report.total_ms for report in cycles], dtype=np.float64)
+    p50, p95, p99 = np.percentile(totals, [50, 95, 99])
+    interval_ms = bar_interval_seconds * 1000.0
+    return {
+        "cycles": float(totals.size),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "max_ms": float(totals.max()),
+        "bar_interval_ms": interval_ms,
+        "max_fraction_of_interval": float(totals.max() / interval_ms),
+    }
+
+
+class ReplayFeed:
+    """Stored bars replayed as if they were arriving live.
+
+    Every series is concatenated and keyed by ``(symbol, position in the union timestamp
+    grid)``, so one ``np.searchsorted`` per fetch advances the cursors of all requested
+    symbols at once. Replay fetches are in-memory work; feeds whose :meth:`fetch` blocks on
+    I/O set :attr:`blocking` so the engine runs their chunk fetches on threads.
+    """
+
+    blocking = False
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        series: Sequence[tuple[TimestampArray, FloatArray]],
+        last_seen: Mapping[str, datetime] | None = None,
+    ) -> None:
+        self.symbols = [symbol.upper() for symbol in symbols]
+        empty = (np.array([], dtype="datetime64[us]"), np.array([], dtype=np.float64))
+        series = list(series) or [empty] * len(self.symbols)
+        if len(series) != len(self.symbols):
+            raise ValueError(f"Expected {len(self.symbols)} series, got {len(series)}")
+        series.append(empty)
+        self.timestamps = np.unique(np.concatenate([ts for ts, _ in series]))
+        self._stride = self.timestamps.size + 1
+        keys = [
+            index * self._stride + np.searchsorted(self.timestamps, ts)
+            for index, (ts, _) in enumerate(series)
+        ]
+        self._keys = np.concatenate(keys).astype(np.int64)
+        self._times = np.concatenate([ts for ts, _ in series])
+        self._closes = np.concatenate([closes for _, closes in series])
+        sizes = np.array([ts.size for ts, _ in series[:-1]], dtype=np.int64)
+        self._starts = np.cumsum(sizes) - sizes
+        self._cursors = self._starts.copy()
+        self._checkpoints = [(last_seen or {}).get(symbol) for symbol in self.symbols]
+
+    @classmethod
+    async def load(
+        cls,
+        data_path: str | Path,
+        symbols: Sequence[str],
+        timeframe: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        concurrency: int = 16,
+        after: Mapping[str, datetime] | None = None,
+        adjust: str = "splits",
+    ) -> ReplayFeed:
+        """Load bars per symbol concurrently.
+
+        ``after`` maps symbols to their last processed bar; only later bars are read.
+        ``adjust`` selects the corporate-action adjustment of closes (see ``read_bars_table``).
+        """
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+        checkpoints = {symbol.upper(): ts for symbol, ts in (after or {}).items()}
+
+        async def load_one(symbol: str) -> tuple[TimestampArray, FloatArray]:
+            symbol_start = start
+            checkpoint = checkpoints.get(symbol.upper())
+            if checkpoint is not None:
+                resume = checkpoint + timedelta(microseconds=1)
+                symbol_start = resume if start is None else max(start, resume)
+            async with semaphore:
+                table = await asyncio.to_thread(
+                    read_bars_table,
+                    data_path,
+                    symbol,
+                    timeframe,
+                    columns=["close"],
+                    start=symbol_start,
+                    end=end,
+                    adjust=adjust,
+                )
+            return (
+                np.asarray(table["timestamp"].to_numpy(), dtype="datetime64[us]"),
+                np.asarray(table["close"].to_numpy(), dtype=np.float64),
+            )
+
+        series = await asyncio.gather(*(load_one(symbol) for symbol in symbols))
+        return cls(symbols, series, last_seen=checkpoints)
+
+    def last_seen(self) -> dict[str, datetime]:
+        """Timestamp of the last bar handed out per symbol (including restored checkpoints)."""
+        seen: dict[str, datetime] = {}
+        for index, symbol in enumerate(self.symbols):
+            checkpoint = self._checkpoints[index]
+            if self._cursors[index] > self._starts[index]:
+                seen[symbol] = _to_datetime(self._times[self._cursors[index] - 1])
+            elif checkpoint is not None:
+                seen[symbol] = checkpoint
+        return seen
+
+    def fetch(self, indices: IntArray, timestamp: np.datetime64) -> FloatArray:
+        """Latest close at or before ``timestamp`` for ``indices``, NaN if no new bar arrived."""
+        grid = np.searchsorted(self.timestamps, timestamp, side="right")
+        ends = np.searchsorted(self._keys, indices * self._stride + grid, side="left")
+        arrived = ends > self._cursors[indices]
+        out = np.full(indices.size, np.nan, dtype=np.float64)
+        out[arrived] = self._closes[ends[arrived] - 1]
+        self._cursors[indices[arrived]] = ends[arrived]
+        return out
+
+
+@dataclass(frozen=True)
+class _BookCycle:
+    """Orders and stage durations (seconds) of one book in one cycle."""
+
+    orders: int
+    signal_s: float
+    orders_s: float
+    execute_s: float
+    persist_s: float
+
+
+@dataclass(frozen=True)
+class _BookHistory:
+    """Per-cycle account history of one book, arrays of shape [T] or [T, N]."""
+
+    equity: FloatArray
+    cash: FloatArray
+    positions: FloatArray
+    marks: FloatArray
+    order_qty: FloatArray
+    fill_price: FloatArray
+    fees: FloatArray
+    halted: npt.NDArray[np.bool_]
+
+    @classmethod
+    def allocate(cls, n_steps: int, n_symbols: int) -> _BookHistory:
+        return cls(
+            equity=np.empty(n_steps, dtype=np.float64),
+            cash=np.empty(n_steps, dtype=np.float64),
+            positions=np.empty((n_steps, n_symbols), dtype=np.float64),
+            marks=np.empty((n_steps, n_symbols), dtype=np.float64),
+            order_qty=np.zeros((n_steps, n_symbols), dtype=np.float64),
+            fill_price=np.zeros((n_steps, n_symbols), dtype=np.float64),
+            fees=np.zeros((n_steps, n_symbols), dtype=np.float64),
+            halted=np.empty(n_steps, dtype=np.bool_),
+        )
+
+
+class StrategyBook:
+    """One hosted strategy with its own paper broker, risk limits, journal and history.
+
+    Books only read what the engine shares between them (the cycle's closes and the
+    indicator cache), so different books can trade on different threads.
+    """
+
+    def __init__(
+        self,
+        strategy_id: str,
+        config: AppConfig,
+        symbols: Sequence[str],
+        journal: JournalWriter | None = None,
+    ) -> None:
+        self.id = strategy_id
+        self.config = config
+        self.journal = journal
+        self.strategy = get_strategy(config.strategy.name, config.strategy.params)
+        self.simulator = PortfolioSimulator(config.portfolio, config.risk, config.cost_model)
+        self.broker = PaperSimBroker(self.simulator, len(symbols))
+        self._symbol_names = np.asarray(symbols, dtype=object)
+        self._last_weights = np.zeros(len(symbols), dtype=np.float64)
+        self._pending = np.zeros(len(symbols), dtype=np.float64)
+        self._history = _BookHistory.allocate(0, len(symbols))
+
+    def mark(self, closes: FloatArray) -> None:
+        state = self.broker.state
+        state.last_prices = np.where(np.isfinite(closes), closes, state.last_prices)
+
+    def start(self, n_steps: int, indicators: IndicatorCache) -> None:
+        """Allocate history and take the signal of the last bar already seen (if any)."""
+        self._history = _BookHistory.allocate(n_steps, self._symbol_names.size)
+        if indicators.bars_seen:
+            self._pending = self.strategy.latest_weights(indicators)
+
+    def trade(
+        self,
+        idx: int,
+        timestamp: np.datetime64,
+        closes: FloatArray,
+        indicators: IndicatorCache,
+        day: int,
+        clock: Callable[[], float],
+    ) -> _BookCycle:
+        """Signal, plan, execute and journal cycle ``idx`` for this book.
+
+        Orders follow the previous bar's signal; this bar's signal trades next cycle, as
+        in the backtest.
+        """
+        started = clock()
+        weights = self._pending
+        self._pending = self.strategy.latest_weights(indicators)
+        signalled = clock()
+        planned = self.simulator.plan_orders(self.broker.state, closes, weights, day)
+        ordered = clock()
+        history = self._history
+        step: StepResult | None = None
+        if not self.config.runtime.dry_run:
+            step = self.broker.execute(planned)
+            history.order_qty[idx] = step.order_qty
+            history.fill_price[idx] = step.fill_price
+            history.fees[idx] = step.fees
+        executed = clock()
+        state = self.broker.state
+        history.equity[idx] = state.equity()
+        history.cash[idx] = state.cash
+        history.positions[idx] = state.positions
+        history.marks[idx] = state.last_prices
+        history.halted[idx] = state.halted
+        if self.journal is not None:
+            self._journal_cycle(timestamp, self._pending, planned, step)
+        journaled = clock()
+        return _BookCycle(
+            orders=int(np.count_nonzero(planned)),
+            signal_s=signalled - started,
+            orders_s=ordered - signalled,
+            execute_s=executed - ordered,
+            persist_s=journaled - executed,
+        )
+
+    def finish(self, cycle_times: TimestampArray, symbols: list[str]) -> BacktestResult:
+        """Summarize the recorded cycles and journal the closing positions."""
+        history = self._history
+        result = PortfolioResult(
+            base_currency=self.simulator.base_currency,
+            initial_cash=self.config.portfolio.initial_cash,
+            equity=history.equity,
+            cash=history.cash,
+            positions=history.positions,
+            order_qty=history.order_qty,
+            fill_price=history.fill_price,
+            fees=history.fees,
+            halted=history.halted,
+        )
+        summary = summarize_run(self.config, cycle_times, symbols, history.marks, result)
+        if self.journal is not None:
+            record_positions(self.journal, summary.positions)
+            self.journal.end_cycle()
+        return summary
+
+    def _journal_cycle(
+        self,
+        timestamp: np.datetime64,
+        weights: FloatArray,
+        planned: FloatArray,
+        step: StepResult | None,
+    ) -> None:
+        """Append the cycle's target-weight changes, planned orders and fills to the journal."""
+        assert self.journal is not None
+        changed = np.flatnonzero(np.isfinite(weights) & (weights != self._last_weights))
+        self._last_weights = np.where(np.isfinite(weights), weights, self._last_weights)
+        if changed.size:
+            self.journal.append_columns(
+                "decision",
+                {
+                    "ts": np.full(changed.size, timestamp, dtype="datetime64[us]"),
+                    "symbol": self._symbol_names[changed],
+                    "value": weights[changed],
+                },
+            )
+
+        ordered = np.flatnonzero(planned)
+        if not ordered.size:
+            return
+        qty = planned[ordered]
+        order_ts = np.full(ordered.size, timestamp, dtype="datetime64[us]")
+        sides = np.where(qty > 0, "buy", "sell").astype(object)
+        self.journal.append_columns(
+            "order",
+            {
+                "ts": order_ts,
+                "symbol": self._symbol_names[ordered],
+                "side": sides,
+                "qty": np.abs(qty),
+                "price": self.broker.state.last_prices[ordered],
+            },
+        )
+        if step is None:
+            return
+        filled = np.flatnonzero(step.order_qty)
+        fill_qty = step.order_qty[filled]
+        price = step.fill_price[filled]
+        mark = self.broker.state.last_prices[filled]
+        self.journal.append_columns(
+            "fill",
+            {
+                "ts": np.full(filled.size, timestamp, dtype="datetime64[us]"),
+                "symbol": self._symbol_names[filled],
+                "side": np.where(fill_qty > 0, "buy", "sell").astype(object),
+                "qty": np.abs(fill_qty),
+                "price": price,
+                "notional": np.abs(fill_qty * price),
+                "fee": step.fees[filled],
+                "slippage": np.abs(fill_qty * (price - mark)),
+            },
+        )
+
+    def snapshot_payload(self) -> dict[str, Any]:
+        state = self.broker.state
+        return {
+            "name": self.config.strategy.name,
+            "params": self.config.strategy.params,
+            "portfolio": {
+                "base_currency": self.simulator.base_currency,
+                "cash": state.cash,
+                "positions": encode_array(state.positions),
+                "last_prices": encode_array(state.last_prices),
+                "day": state.day,
+                "day_start_equity": state.day_start_equity,
+                "halted": state.halted,
+            },
+        }
+
+    def check_snapshot(self, payload: Mapping[str, Any]) -> None:
+        strategy = self.config.strategy
+        if payload["name"] != strategy.name or payload["params"] != strategy.params:
+            raise ValueError(f"Snapshot strategy {self.id!r} does not match the configuration.")
+
+    def restore(self, payload: Mapping[str, Any]) -> None:
+        self.check_snapshot(payload)
+        portfolio = payload["portfolio"]
+        state = self.broker.state
+        state.cash = float(portfolio["cash"])
+        state.positions = decode_array(portfolio["positions"])
+        state.last_prices = decode_array(portfolio["last_prices"])
+        state.day = portfolio["day"]
+        state.day_start_equity = float(portfolio["day_start_equity"])
+        state.halted = bool(portfolio["halted"])
+
+
+class TradingEngine:
+    """Drive one or more strategies, each with its own paper broker, through replayed bars.
+
+    Each cycle fetches the universe once (feeds doing blocking I/O in ``concurrency``
+    symbol chunks on concurrent threads) and feeds one shared :class:`IndicatorCache` that computes
+    every distinct indicator once. Strategy books (one per ``config.strategy_configs()``
+    entry, with isolated portfolios and risk limits) then trade in ``strategy_workers``
+    chunks on worker threads (default: one per book up to the CPU count). Signal, risk and
+    fill stages are vectorized across the universe. ``speed`` paces cycles to bar time
+    divided by the multiplier (``math.inf`` runs as fast as possible).
+
+    The first ``warmup`` cycles only feed the indicators and marks (no orders, no reports);
+    a negative ``warmup`` warms up on all but the last ``-warmup`` cycles. Cycles are
+    counted after ``runtime.schedule`` has dropped unscheduled bars.
+    ``on_cycle_end`` runs in the persist stage of every trading cycle, after the cycle's
+    decisions, orders and fills have been appended to each book's journal in ``journals``
+    (keyed by strategy id).
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        feed: ReplayFeed,
+        *,
+        speed: float = math.inf,
+        concurrency: int = 8,
+        steps: int | None = None,
+        warmup: int = 0,
+        on_cycle_end: Callable[[TradingEngine], None] | None = None,
+        journals: Mapping[str, JournalWriter] | None = None,
+        strategy_workers: int | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._config = config
+        self._feed = feed
+        self._speed = speed
+        self._steps = steps
+        self._warmup = warmup
+        self._on_cycle_end = on_cycle_end
+        self._clock = clock
+        self._sleep = sleep
+        self._tz = ZoneInfo(config.timezone)
+        self._schedule = (
+            CronSchedule(config.runtime.schedule) if config.runtime.schedule else None
+        )
+        n_symbols = len(feed.symbols)
+        chunk_count = max(1, min(concurrency, n_symbols))
+        self._symbol_indices = np.arange(n_symbols, dtype=np.int64)
+        self._chunks = np.array_split(self._symbol_indices, chunk_count)
+
+        journals = journals or {}
+        configs = config.strategy_configs()
+        unknown = sorted(set(journals) - set(configs))
+        if unknown:
+            raise ValueError(f"Journals given for unknown strategies: {unknown}")
+        self.books = {
+            strategy_id: StrategyBook(
+                strategy_id, book_config, feed.symbols, journals.get(strategy_id)
+            )
+            for strategy_id, book_config in configs.items()
+        }
+        books = list(self.books.values())
+        lookback = max(book.strategy.lookback for book in books)
+        self.indicators = IndicatorCache(n_symbols, lookback)
+        self._indicator_keys = [key for book in books for key in book.strategy.indicators]
+        if strategy_workers is None:
+            strategy_workers = os.cpu_count() or 1
+        if strategy_workers < 1:
+            raise ValueError(f"strategy_workers must be positive, got {strategy_workers}")
+        book_chunks = max(1, min(strategy_workers, len(books)))
+        self._book_chunks = [
+            [books[index] for index in chunk]
+            for chunk in np.array_split(np.arange(len(books)), book_chunks)
+        ]
+
+    def _cycle_times(self) -> TimestampArray:
+        timestamps = self._feed.timestamps
+        if self._schedule is None:
+            return timestamps
+        intraday = self._config.universe.timeframe != "1d"
+        keep = []
+        for value in timestamps:
+            local = _to_datetime(value).astimezone(self._tz)
+            matched = (
+                self._schedule.matches(local) if intraday else self._schedule.matches_date(local)
+            )
+            keep.append(matched)
+        return timestamps[np.asarray(keep, dtype=np.bool_)]
+
+    async def _fetch(self, timestamp: np.datetime64) -> FloatArray:
+        if not self._feed.blocking:
+            return self._feed.fetch(self._symbol_indices, timestamp)
+        fetches = (asyncio.to_thread(self._feed.fetch, chunk, timestamp) for chunk in self._chunks)
+        parts = await asyncio.gather(*fetches)
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.float64)
+
+    async def _trade(
+        self,
+        executor: ThreadPoolExecutor | None,
+        idx: int,
+        timestamp: np.datetime64,
+        closes: FloatArray,
+        day: int,
+    ) -> list[_BookCycle]:
+        def trade_chunk(chunk: Sequence[StrategyBook]) -> list[_BookCycle]:
+            return [
+                book.trade(idx, timestamp, closes, self.indicators, day, self._clock)
+                for book in chunk
+            ]
+
+        if executor is None:
+            return trade_chunk(list(self.books.values()))
+        loop = asyncio.get_running_loop()
+        parts = await asyncio.gather(
+            *(loop.run_in_executor(executor, trade_chunk, chunk) for chunk in self._book_chunks)
+        )
+        return [cycle for part in parts for cycle in part]
+
+    def snapshot_payload(self) -> dict[str, Any]:
+        """JSON-compatible indicator, per-strategy portfolio and last-bar state."""
+        indicators = self.indicators
+        return {
+            "symbols": self._feed.symbols,
+            "indicators": {
+                "window": encode_array(indicators.window),
+                "last_close": encode_array(indicators.last_close),
+                "bars_seen": indicators.bars_seen,
+            },
+            "strategies": {book.id: book.snapshot_payload() for book in self.books.values()},
+            "last_bar": {
+                symbol: seen.isoformat() for symbol, seen in self._feed.last_seen().items()
+            },
+        }
+
+    def restore(self, payload: Mapping[str, Any]) -> None:
+        """Load state produced by :meth:`snapshot_payload` for the same universe/strategies.
+
+        Single-strategy snapshots written before strategies were hosted together are
+        accepted too.
+        """
+        if list(payload["symbols"]) != self._feed.symbols:
+            raise ValueError("Snapshot universe does not match the configured symbols.")
+        payload = _upgrade_snapshot(payload, next(iter(self.books)))
+        strategies = payload["strategies"]
+        if set(strategies) != set(self.books):
+            raise ValueError("Snapshot strategies do not match the configured strategies.")
+        for strategy_id, book in self.books.items():
+            book.check_snapshot(strategies[strategy_id])
+        indicators = payload["indicators"]
+        window = decode_array(indicators["window"])
+        if window.shape != self.indicators.window.shape:
+            raise ValueError("Snapshot indicator window does not match the strategy parameters.")
+
+        self.indicators.restore(
+            window, decode_array(indicators["last_close"]), int(indicators["bars_seen"])
+        )
+        for strategy_id, book in self.books.items():
+            book.restore(strategies[strategy_id])
+
+    async def run(self) -> PaperSimResult:
+        books = list(self.books.values())
+        cycle_times = self._cycle_times()
+        for timestamp in cycle_times[: self._warmup]:
+            closes = await self._fetch(timestamp)
+            self.indicators.update(closes)
+            for book in books:
+                book.mark(closes)
+        cycle_times = cycle_times[self._warmup :]
+        if self._steps is not None:
+            cycle_times = cycle_times[: self._steps]
+        n_steps = cycle_times.size
+        interval = timeframe_interval(self._config.universe.timeframe).total_seconds()
+        if self.indicators.bars_seen:
+            self.indicators.prepare(self._indicator_keys)
+        for book in books:
+            book.start(n_steps, self.indicators)
+        reports: list[CycleReport] = []
+
+        executor = None
+        if len(self._book_chunks) > 1:
+            executor = ThreadPoolExecutor(len(self._book_chunks), "longarc-strategy")
+        wall_start = self._clock()
+        first = cycle_times[0] if n_steps else None
+        try:
+            for idx, timestamp in enumerate(cycle_times):
+                if first is not None and math.isfinite(self._speed):
+                    offset = (timestamp - first) / np.timedelta64(1, "s") / self._speed
+                    delay = wall_start + offset - self._clock()
+                    if delay > 0:
+                        await self._sleep(delay)
+
+                started = self._clock()
+                closes = await self._fetch(timestamp)
+                fetched = self._clock()
+                self.indicators.update(closes)
+                self.indicators.prepare(self._indicator_keys)
+                prepared = self._clock()
+                local_day = _to_datetime(timestamp).astimezone(self._tz).date().toordinal()
+                cycles = await self._trade(executor, idx, timestamp, closes, local_day)
+                traded = self._clock()
+                for book in books:
+                    if book.journal is not None:
+                        book.journal.end_cycle()
+                if self._on_cycle_end is not None:
+                    self._on_cycle_end(self)
+                persisted = self._clock()
+                n_orders = sum(cycle.orders for cycle in cycles)
+                _CYCLES.inc()
+                _CYCLE_SECONDS.observe(persisted - started)
+                _ORDERS_PER_CYCLE.observe(n_orders)
+                _ORDERS.inc(n_orders)
+
+                # Book stages are summed, so they can exceed the wall time when books
+                # trade concurrently.
+                reports.append(
+                    CycleReport(
+                        cycle=idx,
+                        timestamp=_to_datetime(timestamp),
+                        symbols_with_bars=int(np.count_nonzero(np.isfinite(closes))),
+                        orders=n_orders,
+                        fetch_ms=(fetched - started) * 1000.0,
+                        signal_ms=(prepared - fetched + _total(cycles, "signal_s")) * 1000.0,
+                        orders_ms=_total(cycles, "orders_s") * 1000.0,
+                        execute_ms=_total(cycles, "execute_s") * 1000.0,
+                        persist_ms=(persisted - traded + _total(cycles, "persist_s")) * 1000.0,
+                        total_ms=(persisted - started) * 1000.0,
+                    )
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        summaries = {book.id: book.finish(cycle_times, self._feed.symbols) for book in books}
+        return PaperSimResult(
+            summaries=summaries, cycles=reports, latency=latency_summary(reports, interval)
+        )
+
+
+def _total(cycles: Sequence[_BookCycle], stage: str) -> float:
+    return float(sum(getattr(cycle, stage) for cycle in cycles))
+
+
+def _upgrade_snapshot(payload: Mapping[str, Any], strategy_id: str) -> Mapping[str, Any]:
+    """Map the single-strategy snapshot layout onto the per-strategy one."""
+    if "strategies" in payload:
+        return payload
+    strategy = payload["strategy"]
+    return {
+        **payload,
+        "indicators": {key: strategy[key] for key in ("window", "last_close", "bars_seen")},
+        "strategies": {
+            strategy_id: {
+                "name": strategy["name"],
+                "params": strategy["params"],
+                "portfolio": payload["portfolio"],
+            }
+        },
+    }
+
+
+def _to_datetime(value: np.datetime64) -> datetime:
+    micros = int(value.astype("datetime64[us]").astype(np.int64))
+    return datetime.fromtimestamp(micros / 1_000_000, tz=UTC)
+
+
+async def run_paper_sim(
+    config: AppConfig,
+    *,
+    start: str | None = None,
+    end: str | None = None,
+    speed: float = math.inf,
+    concurrency: int = 8,
+    steps: int | None = None,
+    journals: Mapping[str, JournalWriter] | None = None,
+    strategy_workers: int | None = None,
+) -> PaperSimResult:
+    """Replay stored bars for the configured universe through every configured strategy."""
+    with span("paper_sim.load_feed") as timing:
+        feed = await ReplayFeed.load(
+            config.data.path,
+            config.universe.symbols,
+            config.universe.timeframe,
+            start=parse_bound(start) if start else None,
+            end=parse_bound(end, inclusive_end=True) if end else None,
+            concurrency=concurrency,
+            adjust=config.data.adjust,
+        )
+        timing.rows = len(feed.timestamps)
+    engine = TradingEngine(
+        config,
+        feed,
+        speed=speed,
+        concurrency=concurrency,
+        steps=steps,
+        journals=journals,
+        strategy_workers=strategy_workers,
+    )
+    with span("paper_sim.loop") as timing:
+        result = await engine.run()
+        timing.rows = len(result.cycles)
+    LOGGER.info("Paper-sim latency: %s", result.latency)
+    return result
+
+
+async def run_paper(
+    config: AppConfig,
+    snapshots: SnapshotStore,
+    *,
+    concurrency: int = 8,
+    journals: Mapping[str, JournalWriter] | None = None,
+    strategy_workers: int | None = None,
+) -> PaperSimResult:
+    """Process bars that arrived since the last snapshot, snapshotting after every cycle.
+
+    Warm start restores the latest valid snapshot and reads only bars after each symbol's
+    checkpoint. Cold start reads full history, uses all but the newest cycle to warm up the
+    strategies, and trades the newest cycle. One snapshot covers every hosted strategy.
+    """
+    snapshot = snapshots.load_latest()
+    after: dict[str, datetime] = {}
+    if snapshot is not None:
+        after = {
+            symbol: datetime.fromisoformat(value)
+            for symbol, value in snapshot.payload.get("last_bar", {}).items()
+        }
+    with span("paper.load_feed") as timing:
+        feed = await ReplayFeed.load(
+            config.data.path,
+            config.universe.symbols,
+            config.universe.timeframe,
+            concurrency=concurrency,
+            after=after,
+            adjust=config.data.adjust,
+        )
+        timing.rows = len(feed.timestamps)
+
+    def persist(engine: TradingEngine) -> None:
+        snapshots.save(engine.snapshot_payload())
+
+    engine = TradingEngine(
+        config,
+        feed,
+        concurrency=concurrency,
+        warmup=-1 if snapshot is None else 0,
+        on_cycle_end=persist,
+        journals=journals,
+        strategy_workers=strategy_workers,
+    )
+    if snapshot is not None:
+        engine.restore(snapshot.payload)
+        LOGGER.info(
+            "Restored snapshot sequence=%s; %s new bar timestamps to process",
+            snapshot.sequence,
+            len(feed.timestamps),
+        )
+    else:
+        LOGGER.info("No snapshot found; cold start over %s bar timestamps", len(feed.timestamps))
+    with span("paper.loop") as timing:
+        result = await engine.run()
+        timing.rows = len(result.cycles)
+    return result
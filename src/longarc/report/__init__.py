@@ -0,0 +1,19 @@
+"""Run reporting and performance metrics."""
+
+from longarc.report.performance import (
+    drawdown_series,
+    periods_per_year,
+    sharpe_ratio,
+    simple_returns,
+    sortino_ratio,
+    summary_metrics,
+)
+
+__all__ = [
+    "drawdown_series",
+    "periods_per_year",
+    "sharpe_ratio",
+    "simple_returns",
+    "sortino_ratio",
+    "summary_metrics",
+]
@@ -0,0 +1,89 @@
+"""Vectorized performance metrics over equity curves."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import numpy.typing as npt
+
+FloatArray = npt.NDArray[np.float64]
+
+_PERIODS_PER_YEAR: dict[str, float] = {
+    "1m": 252.0 * 390.0,
+    "1h": 252.0 * 7.0,
+    "1d": 252.0,
+}
+
+
+def periods_per_year(timeframe: str) -> float:
+    try:
+        return _PERIODS_PER_YEAR[timeframe]
+    except KeyError as exc:
+        allowed = ", ".join(sorted(_PERIODS_PER_YEAR))
+        raise ValueError(
+            f"Unsupported timeframe {timeframe!r}. Expected one of: {allowed}"
+        ) from exc
+
+
+def simple_returns(equity: FloatArray, initial: float) -> FloatArray:
+    """Per-bar simple returns, the first bar measured against ``initial``."""
+    previous = np.concatenate([[initial], equity[:-1]])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.where(previous != 0, equity / previous - 1.0, 0.0)
+    return returns.astype(np.float64)
+
+
+def drawdown_series(equity: FloatArray) -> FloatArray:
+    """Fractional drawdown from the running peak (<= 0)."""
+    if equity.size == 0:
+        return np.zeros(0, dtype=np.float64)
+    peaks = np.maximum.accumulate(equity)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(peaks > 0, equity / peaks - 1.0, 0.0)
+
+
+def sharpe_ratio(returns: FloatArray, annualization: float) -> float:
+    if returns.size < 2:
+        return 0.0
+    std = float(returns.std(ddof=1))
+    if std == 0.0 or not math.isfinite(std):
+        return 0.0
+    return float(returns.mean() / std * math.sqrt(annualization))
+
+
+def sortino_ratio(returns: FloatArray, annualization: float) -> float:
+    """Mean return over downside deviation (root mean square of negative returns)."""
+    if returns.size < 2:
+        return 0.0
+    downside = float(np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2)))
+    if downside == 0.0 or not math.isfinite(downside):
+        return 0.0
+    return float(returns.mean() / downside * math.sqrt(annualization))
+
+
+def summary_metrics(
+    equity: FloatArray,
+    initial_cash: float,
+    timeframe: str,
+) -> dict[str, float]:
+    """Headline return/risk metrics for one equity curve."""
+    annualization = periods_per_year(timeframe)
+    returns = simple_returns(equity, initial_cash)
+    final_equity = float(equity[-1]) if equity.size else float(initial_cash)
+    total_return = final_equity / initial_cash - 1.0 if initial_cash else 0.0
+    years = equity.size / annualization
+    if years > 0 and final_equity > 0 and initial_cash > 0:
+        annualized = (final_equity / initial_cash) ** (1.0 / years) - 1.0
+    else:
+        annualized = 0.0
+    volatility = float(returns.std(ddof=1) * math.sqrt(annualization)) if returns.size > 1 else 0.0
+    return {
+        "bars": float(equity.size),
+        "final_equity": final_equity,
+        "total_return": float(total_return),
+        "annualized_return": float(annualized),
+        "annualized_volatility": volatility,
+        "sharpe": sharpe_ratio(returns, annualization),
+        "max_drawdown": float(drawdown_series(equity).min()) if equity.size else 0.0,
+    }
@@ -0,0 +1,400 @@
+"""Columnar run reports: metrics, cost attribution and per-symbol PnL from stored artifacts."""
+
+from __future__ import annotations
+
+import html
+import json
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+import numpy.typing as npt
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.compute as pc  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+from longarc.core.profiling import span
+from longarc.report.performance import (
+    drawdown_series,
+    periods_per_year,
+    simple_returns,
+    sortino_ratio,
+    summary_metrics,
+)
+from longarc.storage.journal import iter_journal, segment_paths
+from longarc.storage.runs import EQUITY_FILE, JOURNAL_DIR, TRADES_FILE, RunStore
+
+FloatArray = npt.NDArray[np.float64]
+
+REPORT_FORMATS = ("html", "markdown")
+REPORT_METRICS_FILE = "report.json"
+_REPORT_FILES = {"html": "report.html", "markdown": "report.md"}
+_FILL_COLUMNS = ["event_type", "symbol", "side", "qty", "price", "notional", "fee", "slippage"]
+_TABLE_ROWS = 10
+_CHART_POINTS = 800
+
+
+class SymbolLedger:
+    """Per-symbol fill aggregates accumulated one record batch at a time.
+
+    Memory is bounded by the number of symbols, not the number of fills.
+    """
+
+    _FIELDS = ("fills", "bought", "sold", "buy_notional", "sell_notional", "fees", "slippage")
+
+    def __init__(self) -> None:
+        self.symbols: list[str] = []
+        self._index: dict[str, int] = {}
+        self._values = {name: np.zeros(0, dtype=np.float64) for name in self._FIELDS}
+        self.held = np.zeros(0, dtype=np.float64)
+        self.mark = np.full(0, np.nan, dtype=np.float64)
+        self.last_fill_price = np.full(0, np.nan, dtype=np.float64)
+
+    def _codes(self, symbols: pa.Array) -> npt.NDArray[np.int64]:
+        dictionary = pc.dictionary_encode(symbols)
+        for symbol in dictionary.dictionary.to_pylist():
+            if symbol not in self._index:
+                self._index[symbol] = len(self.symbols)
+                self.symbols.append(symbol)
+        grow = len(self.symbols) - self.held.size
+        if grow > 0:
+            for name in self._FIELDS:
+                self._values[name] = np.concatenate([self._values[name], np.zeros(grow)])
+            self.held = np.concatenate([self.held, np.zeros(grow)])
+            self.mark = np.concatenate([self.mark, np.full(grow, np.nan)])
+            self.last_fill_price = np.concatenate([self.last_fill_price, np.full(grow, np.nan)])
+        lookup = np.array(
+            [self._index[symbol] for symbol in dictionary.dictionary.to_pylist()], dtype=np.int64
+        )
+        indices = np.asarray(dictionary.indices.to_numpy(zero_copy_only=False), dtype=np.int64)
+        return lookup[indices]
+
+    def add_fills(self, batch: pa.RecordBatch) -> None:
+        if batch.num_rows == 0:
+            return
+        codes = self._codes(batch["symbol"])
+        size = len(self.symbols)
+        qty = np.nan_to_num(batch["qty"].to_numpy(zero_copy_only=False))
+        notional = np.nan_to_num(batch["notional"].to_numpy(zero_copy_only=False))
+        is_buy = np.asarray(
+            pc.equal(batch["side"], "buy").to_numpy(zero_copy_only=False), dtype=np.bool_
+        )
+        values = self._values
+        values["fills"] += np.bincount(codes, minlength=size)
+        values["bought"] += np.bincount(codes, weights=qty * is_buy, minlength=size)
+        values["sold"] += np.bincount(codes, weights=qty * ~is_buy, minlength=size)
+        values["buy_notional"] += np.bincount(codes, weights=notional * is_buy, minlength=size)
+        values["sell_notional"] += np.bincount(codes, weights=notional * ~is_buy, minlength=size)
+        fee = np.nan_to_num(batch["fee"].to_numpy(zero_copy_only=False))
+        slippage = np.nan_to_num(batch["slippage"].to_numpy(zero_copy_only=False))
+        values["fees"] += np.bincount(codes, weights=fee, minlength=size)
+        values["slippage"] += np.bincount(codes, weights=slippage, minlength=size)
+        price = batch["price"].to_numpy(zero_copy_only=False)
+        self.last_fill_price[codes] = price
+
+    def add_positions(self, batch: pa.RecordBatch) -> None:
+        """Record end-of-run holdings and marks (the last ``position`` event per symbol wins)."""
+        if batch.num_rows == 0:
+            return
+        codes = self._codes(batch["symbol"])
+        self.held[codes] = batch["qty"].to_numpy(zero_copy_only=False)
+        self.mark[codes] = batch["price"].to_numpy(zero_copy_only=False)
+
+    def table(self) -> pa.Table:
+        values = self._values
+        net_qty = values["bought"] - values["sold"]
+        mark = np.where(np.isfinite(self.mark), self.mark, self.last_fill_price)
+        open_qty = np.where(np.isfinite(self.mark), self.held, net_qty)
+        market_value = np.nan_to_num(open_qty * mark)
+        pnl = values["sell_notional"] - values["buy_notional"] - values["fees"] + market_value
+        table = pa.table(
+            {
+                "symbol": pa.array(self.symbols, type=pa.string()),
+                "fills": values["fills"].astype(np.int64),
+                "traded_notional": values["buy_notional"] + values["sell_notional"],
+                "fees": values["fees"],
+                "slippage": values["slippage"],
+                "open_qty": open_qty,
+                "market_value": market_value,
+                "pnl": pnl,
+            }
+        )
+        if table.num_rows == 0:
+            return table
+        return table.take(pc.sort_indices(table, sort_keys=[("pnl", "descending")]))
+
+
+def _fill_batches(run_dir: Path) -> Iterator[pa.RecordBatch]:
+    """Stream fills and end-of-run positions from the journal, or fills from trades.parquet."""
+    journal_dir = run_dir / JOURNAL_DIR
+    if segment_paths(journal_dir):
+        yield from iter_journal(
+            journal_dir, event_types=["fill", "position"], columns=_FILL_COLUMNS
+        )
+        return
+    trades = pq.ParquetFile(run_dir / TRADES_FILE)
+    for batch in trades.iter_batches(batch_size=65_536):
+        event_type = pa.array(np.full(batch.num_rows, "fill", dtype=object), pa.string())
+        yield pa.RecordBatch.from_arrays(
+            [event_type, *(batch[name] for name in _FILL_COLUMNS[1:])], names=_FILL_COLUMNS
+        )
+
+
+def max_drawdown_duration(drawdown: FloatArray) -> int:
+    """Longest run of consecutive bars below the running peak."""
+    underwater = drawdown < 0
+    if not underwater.any():
+        return 0
+    edges = np.diff(np.concatenate([[0], underwater.astype(np.int8), [0]]))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return int((ends - starts).max())
+
+
+@dataclass(frozen=True)
+class RunReport:
+    run_id: str
+    mode: str
+    base_currency: str
+    timestamps: npt.NDArray[np.datetime64]
+    equity: FloatArray
+    drawdown: FloatArray
+    metrics: dict[str, Any]
+    symbols: pa.Table
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "mode": self.mode,
+            "base_currency": self.base_currency,
+            "metrics": self.metrics,
+            "per_symbol": self.symbols.to_pylist(),
+        }
+
+
+def build_report(runs: RunStore, run_id: str) -> RunReport:
+    """Compute report metrics for a stored run, streaming fills batch by batch."""
+    manifest = runs.read_manifest(run_id)
+    run_dir = runs.run_dir(run_id)
+    config = manifest["inputs"]["config"]
+    timeframe = config["universe"]["timeframe"]
+    initial_cash = float(config["portfolio"]["initial_cash"])
+    costs = config["cost_model"]
+
+    equity_table = pq.read_table(run_dir / EQUITY_FILE, columns=["timestamp", "equity"])
+    timestamps = np.asarray(equity_table["timestamp"].to_numpy(), dtype="datetime64[us]")
+    equity = np.asarray(equity_table["equity"].to_numpy(), dtype=np.float64)
+    annualization = periods_per_year(timeframe)
+    returns = simple_returns(equity, initial_cash)
+    drawdown = drawdown_series(equity)
+
+    ledger = SymbolLedger()
+    with span("report.aggregate_fills", run_id=run_id) as timing:
+        timing.rows = 0
+        for batch in _fill_batches(run_dir):
+            is_fill = pc.equal(batch["event_type"], "fill")
+            ledger.add_fills(batch.filter(is_fill))
+            ledger.add_positions(batch.filter(pc.invert(is_fill)))
+            timing.rows += batch.num_rows
+        symbols = ledger.table()
+
+    traded = float(pc.sum(symbols["traded_notional"]).as_py() or 0.0)
+    fees = float(pc.sum(symbols["fees"]).as_py() or 0.0)
+    slippage = float(pc.sum(symbols["slippage"]).as_py() or 0.0)
+    average_equity = float(equity.mean()) if equity.size else initial_cash
+    turnover = traded / average_equity if average_equity > 0 else 0.0
+    years = equity.size / annualization
+
+    metrics: dict[str, Any] = dict(summary_metrics(equity, initial_cash, timeframe))
+    metrics.update(
+        {
+            "initial_cash": initial_cash,
+            "sortino": sortino_ratio(returns, annualization),
+            "max_drawdown_bars": max_drawdown_duration(drawdown),
+            "best_bar_return": float(returns.max()) if returns.size else 0.0,
+            "worst_bar_return": float(returns.min()) if returns.size else 0.0,
+            "fills": int(pc.sum(symbols["fills"]).as_py() or 0),
+            "traded_notional": traded,
+            "turnover": turnover,
+            "annualized_turnover": turnover / years if years > 0 else 0.0,
+            "costs": {
+                "fee_bps": float(costs["fee_bps"]),
+                "slippage_bps": float(costs["slippage_bps"]),
+                "fees": fees,
+                "slippage": slippage,
+                "total": fees + slippage,
+                "realized_fee_bps": fees / traded * 10_000.0 if traded else 0.0,
+                "realized_slippage_bps": slippage / traded * 10_000.0 if traded else 0.0,
+                "return_drag": (fees + slippage) / initial_cash if initial_cash else 0.0,
+            },
+            "symbol_pnl_total": float(pc.sum(symbols["pnl"]).as_py() or 0.0),
+        }
+    )
+    return RunReport(
+        run_id=run_id,
+        mode=str(manifest.get("mode", "")),
+        base_currency=str(config["portfolio"]["base_currency"]),
+        timestamps=timestamps,
+        equity=equity,
+        drawdown=drawdown,
+        metrics=metrics,
+        symbols=symbols,
+    )
+
+
+def _headline_rows(report: RunReport) -> list[tuple[str, str]]:
+    metrics, costs = report.metrics, report.metrics["costs"]
+    currency = report.base_currency
+    return [
+        ("Bars", f"{int(metrics['bars'])}"),
+        ("Final equity", f"{metrics['final_equity']:,.2f} {currency}"),
+        ("Total return", f"{metrics['total_return']:.2%}"),
+        ("Annualized return", f"{metrics['annualized_return']:.2%}"),
+        ("Annualized volatility", f"{metrics['annualized_volatility']:.2%}"),
+        ("Sharpe", f"{metrics['sharpe']:.2f}"),
+        ("Sortino", f"{metrics['sortino']:.2f}"),
+        ("Max drawdown", f"{metrics['max_drawdown']:.2%}"),
+        ("Longest drawdown (bars)", f"{metrics['max_drawdown_bars']}"),
+        ("Fills", f"{metrics['fills']}"),
+        ("Traded notional", f"{metrics['traded_notional']:,.2f} {currency}"),
+        ("Annualized turnover", f"{metrics['annualized_turnover']:.2f}x"),
+        ("Fees", f"{costs['fees']:,.2f} {currency} ({costs['realized_fee_bps']:.2f} bps)"),
+        (
+            "Slippage",
+            f"{costs['slippage']:,.2f} {currency} ({costs['realized_slippage_bps']:.2f} bps)",
+        ),
+        ("Cost drag", f"{costs['return_drag']:.2%} of initial cash"),
+    ]
+
+
+def _symbol_rows(report: RunReport) -> list[list[str]]:
+    table = report.symbols
+    if table.num_rows > 2 * _TABLE_ROWS:
+        table = pa.concat_tables(
+            [table.slice(0, _TABLE_ROWS), table.slice(table.num_rows - _TABLE_ROWS)]
+        )
+    return [
+        [
+            row["symbol"],
+            f"{row['fills']}",
+            f"{row['traded_notional']:,.2f}",
+            f"{row['fees']:,.2f}",
+            f"{row['slippage']:,.2f}",
+            f"{row['pnl']:,.2f}",
+        ]
+        for row in table.to_pylist()
+    ]
+
+
+_SYMBOL_HEADER = ["Symbol", "Fills", "Traded notional", "Fees", "Slippage", "PnL"]
+
+
+def _symbol_caption(report: RunReport) -> str:
+    if report.symbols.num_rows > 2 * _TABLE_ROWS:
+        return (
+            f"Top and bottom {_TABLE_ROWS} of {report.symbols.num_rows} symbols by PnL "
+            f"(full table in {REPORT_METRICS_FILE})."
+        )
+    return "All symbols by PnL."
+
+
+def render_markdown(report: RunReport) -> str:
+    lines = [
+        f"# Run report: {report.run_id}",
+        "",
+        f"Mode: `{report.mode}`. Amounts in {report.base_currency}.",
+        "",
+        "## Summary",
+        "",
+        "| Metric | Value |",
+        "| --- | --- |",
+        *(f"| {name} | {value} |" for name, value in _headline_rows(report)),
+        "",
+        "## Per-symbol PnL",
+        "",
+        _symbol_caption(report),
+        "",
+        "| " + " | ".join(_SYMBOL_HEADER) + " |",
+        "| " + " | ".join("---" for _ in _SYMBOL_HEADER) + " |",
+        *("| " + " | ".join(row) + " |" for row in _symbol_rows(report)),
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def _sparkline(values: FloatArray, width: int, height: int, color: str) -> str:
+    if values.size == 0:
+        return ""
+    step = max(1, math.ceil(values.size / _CHART_POINTS))
+    sampled = values[::step]
+    if sampled[-1] != values[-1]:
+        sampled = np.append(sampled, values[-1])
+    low, high = float(sampled.min()), float(sampled.max())
+    value_range = high - low or 1.0
+    xs = np.linspace(0, width, sampled.size)
+    ys = height - (sampled - low) / value_range * height
+    points = " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(xs, ys))
+    return (
+        f'<svg viewBox="0 0 {width} {height}" width="100%" height="{height}" '
+        f'preserveAspectRatio="none"><polyline fill="none" stroke="{color}" '
+        f'stroke-width="1.5" points="{points}"/></svg>'
+    )
+
+
+def render_html(report: RunReport) -> str:
+    escape = html.escape
+    summary = "".join(
+        f"<tr><th>{escape(name)}</th><td>{escape(value)}</td></tr>"
+        for name, value in _headline_rows(report)
+    )
+    header = "".join(f"<th>{escape(name)}</th>" for name in _SYMBOL_HEADER)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{escape(cell)}</td>" for cell in row) + "</tr>"
+        for row in _symbol_rows(report)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Run report: {escape(report.run_id)}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2rem; max-width: 60rem; }}
+table {{ border-collapse: collapse; margin-bottom: 1.5rem; }}
+th, td {{ border: 1px solid #ccc; padding: 0.25rem 0.5rem; text-align: right; }}
+th:first-child, td:first-child {{ text-align: left; }}
+</style>
+</head>
+<body>
+<h1>Run report: {escape(report.run_id)}</h1>
+<p>Mode: <code>{escape(report.mode)}</code>. Amounts in {escape(report.base_currency)}.</p>
+<h2>Equity</h2>
+{_sparkline(report.equity, 800, 160, "#1f77b4")}
+<h2>Drawdown</h2>
+{_sparkline(report.drawdown, 800, 80, "#d62728")}
+<h2>Summary</h2>
+<table>{summary}</table>
+<h2>Per-symbol PnL</h2>
+<p>{escape(_symbol_caption(report))}</p>
+<table><tr>{header}</tr>{body}</table>
+</body>
+</html>
+"""
+
+
+def write_report(runs: RunStore, run_id: str, fmt: str = "html") -> tuple[Path, Path]:
+    """Write ``report.html``/``report.md`` and ``report.json`` into the run directory."""
+    if fmt not in REPORT_FORMATS:
+        allowed = ", ".join(REPORT_FORMATS)
+        raise ValueError(f"Unsupported report format {fmt!r}. Expected one of: {allowed}")
+    report = build_report(runs, run_id)
+    run_dir = runs.run_dir(run_id)
+    document = run_dir / _REPORT_FILES[fmt]
+    rendered = render_html(report) if fmt == "html" else render_markdown(report)
+    document.write_text(rendered, encoding="utf-8")
+    metrics_path = run_dir / REPORT_METRICS_FILE
+    metrics_path.write_text(
+        json.dumps(report.to_json(), indent=2, sort_keys=True), encoding="utf-8"
+    )
+    return document, metrics_path
@@ -0,0 +1,5 @@
+"""Portfolio and order risk rules."""
+
+from longarc.risk.rules import clip_order_notional, clip_position_notional, daily_loss_breached
+
+__all__ = ["clip_order_notional", "clip_position_notional", "daily_loss_breached"]
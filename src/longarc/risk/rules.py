@@ -0,0 +1,23 @@
+"""Vectorized risk rules applied to whole-universe order arrays."""
+
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+FloatArray = npt.NDArray[np.float64]
+
+
+def clip_position_notional(target: FloatArray, max_position_notional: float) -> FloatArray:
+    """Clip signed target notionals to the per-symbol position limit."""
+    return np.clip(target, -max_position_notional, max_position_notional)
+
+
+def clip_order_notional(orders: FloatArray, max_order_notional: float) -> FloatArray:
+    """Clip signed order notionals to the per-order limit."""
+    return np.clip(orders, -max_order_notional, max_order_notional)
+
+
+def daily_loss_breached(equity: float, day_start_equity: float, max_daily_loss: float) -> bool:
+    """Return True when intraday loss reaches the configured daily limit."""
+    return day_start_equity - equity >= max_daily_loss
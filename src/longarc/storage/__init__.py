@@ -0,0 +1,6 @@
+"""Persistence for run artifacts."""
+
+from longarc.storage.journal import JournalWriter, read_journal
+from longarc.storage.runs import RunArtifacts, RunStore
+
+__all__ = ["JournalWriter", "RunArtifacts", "RunStore", "read_journal"]
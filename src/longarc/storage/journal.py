@@ -0,0 +1,343 @@
+"""Append-only audit journal of orders, fills and decisions as Arrow IPC record batches."""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator, Mapping, Sequence
+
+import numpy as np
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.compute as pc  # type: ignore[import-untyped]
+
+EVENT_SCHEMA = pa.schema(
+    [
+        ("ts", pa.timestamp("us", tz="UTC")),
+        ("run_id", pa.string()),
+        ("event_type", pa.string()),
+        ("symbol", pa.string()),
+        ("side", pa.string()),
+        ("qty", pa.float64()),
+        ("price", pa.float64()),
+        ("notional", pa.float64()),
+        ("fee", pa.float64()),
+        ("slippage", pa.float64()),
+        ("value", pa.float64()),
+        ("payload", pa.string()),
+    ]
+)
+EVENT_FIELDS: tuple[str, ...] = tuple(EVENT_SCHEMA.names)
+
+_SEGMENT_PREFIX = "journal-"
+_SEGMENT_SUFFIX = ".arrow"
+
+
+@dataclass(frozen=True)
+class FsyncPolicy:
+    """When buffered events are forced to stable storage.
+
+    ``cycle``: at every :meth:`JournalWriter.end_cycle`; ``events:N``: every N events;
+    ``shutdown``: only on close.
+    """
+
+    mode: str
+    every: int = 0
+
+    @classmethod
+    def parse(cls, value: str) -> FsyncPolicy:
+        normalized = value.strip().lower()
+        if normalized in {"cycle", "shutdown"}:
+            return cls(mode=normalized)
+        if normalized.startswith("events:"):
+            count = int(normalized.split(":", 1)[1])
+            if count < 1:
+                raise ValueError(f"Fsync event count must be positive, got {value!r}")
+            return cls(mode="events", every=count)
+        raise ValueError(
+            f"Invalid fsync policy {value!r}. Expected cycle, shutdown, or events:N."
+        )
+
+
+class JournalWriter:
+    """Buffer events in memory and append them to rolling Arrow IPC stream segments.
+
+    Events are buffered column-wise and written as one record batch per flush, so the
+    per-event cost is a few list appends. A segment rolls over once it exceeds
+    ``max_segment_bytes`` or has been open for ``max_segment_seconds``. Segments are
+    never rewritten; a crash loses at most the unflushed buffer.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        run_id: str,
+        *,
+        fsync: str | FsyncPolicy = "cycle",
+        batch_size: int = 65_536,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        max_segment_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._dir = Path(path)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._run_id = run_id
+        self._policy = fsync if isinstance(fsync, FsyncPolicy) else FsyncPolicy.parse(fsync)
+        self._batch_size = batch_size
+        self._max_bytes = max_segment_bytes
+        self._max_seconds = max_segment_seconds
+        self._clock = clock
+
+        self._columns: dict[str, list[Any]] = {field: [] for field in EVENT_FIELDS}
+        self._pending: list[pa.RecordBatch] = []
+        self._buffered = 0
+        self._since_fsync = 0
+        self._sink: BinaryIO | None = None
+        self._writer: pa.ipc.RecordBatchStreamWriter | None = None
+        self._segment_opened = 0.0
+        existing = segment_paths(self._dir)
+        self._next_segment = _segment_number(existing[-1]) + 1 if existing else 1
+        self.events_written = 0
+
+    @property
+    def path(self) -> Path:
+        return self._dir
+
+    def append(
+        self,
+        event_type: str,
+        ts: datetime,
+        *,
+        symbol: str | None = None,
+        side: str | None = None,
+        qty: float | None = None,
+        price: float | None = None,
+        notional: float | None = None,
+        fee: float | None = None,
+        slippage: float | None = None,
+        value: float | None = None,
+        payload: str | None = None,
+    ) -> None:
+        row = (
+            ts, self._run_id, event_type, symbol, side, qty, price, notional, fee, slippage,
+            value, payload,
+        )
+        for field, item in zip(EVENT_FIELDS, row):
+            self._columns[field].append(item)
+        self._on_buffered(1)
+
+    def append_columns(self, event_type: str, columns: Mapping[str, Any]) -> None:
+        """Append many events of one type from equal-length arrays (vectorized path)."""
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) != 1:
+            raise ValueError("Journal columns must have equal lengths.")
+        (length,) = lengths
+        if length == 0:
+            return
+        unknown = set(columns) - set(EVENT_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown journal fields: {sorted(unknown)}")
+
+        arrays = []
+        for field in EVENT_SCHEMA:
+            if field.name == "run_id":
+                arrays.append(pa.array(np.full(length, self._run_id, dtype=object), field.type))
+            elif field.name == "event_type":
+                arrays.append(pa.array(np.full(length, event_type, dtype=object), field.type))
+            elif field.name in columns:
+                values = columns[field.name]
+                if isinstance(values, pa.ChunkedArray):
+                    values = values.combine_chunks()
+                if isinstance(values, pa.Array):
+                    arrays.append(values.cast(field.type))
+                else:
+                    arrays.append(pa.array(values, type=field.type))
+            else:
+                arrays.append(pa.nulls(length, type=field.type))
+        self._flush_columns()
+        self._pending.append(pa.RecordBatch.from_arrays(arrays, schema=EVENT_SCHEMA))
+        self._on_buffered(length)
+
+    def _on_buffered(self, count: int) -> None:
+        self._buffered += count
+        self._since_fsync += count
+        if self._policy.mode == "events" and self._since_fsync >= self._policy.every:
+            self.flush(sync=True)
+        elif self._buffered >= self._batch_size:
+            self.flush(sync=False)
+
+    def _flush_columns(self) -> None:
+        if not self._columns["event_type"]:
+            return
+        batch = pa.RecordBatch.from_pydict(self._columns, schema=EVENT_SCHEMA)
+        self._pending.append(batch)
+        self._columns = {field: [] for field in EVENT_FIELDS}
+
+    def _open_segment(self) -> None:
+        path = self._dir / f"{_SEGMENT_PREFIX}{self._next_segment:06d}{_SEGMENT_SUFFIX}"
+        self._next_segment += 1
+        self._sink = path.open("ab")
+        self._writer = pa.ipc.new_stream(self._sink, EVENT_SCHEMA)
+        self._segment_opened = self._clock()
+
+    def _close_segment(self, sync: bool) -> None:
+        if self._writer is None or self._sink is None:
+            return
+        self._writer.close()
+        self._sink.flush()
+        if sync:
+            os.fsync(self._sink.fileno())
+        self._sink.close()
+        self._writer = None
+        self._sink = None
+
+    def flush(self, sync: bool = False) -> None:
+        """Write buffered events as record batches; ``sync`` also fsyncs the segment."""
+        self._flush_columns()
+        if self._pending:
+            if self._writer is not None and (
+                self._sink is not None
+                and (
+                    self._sink.tell() >= self._max_bytes
+                    or self._clock() - self._segment_opened >= self._max_seconds
+                )
+            ):
+                self._close_segment(sync=True)
+            if self._writer is None:
+                self._open_segment()
+            assert self._writer is not None
+            for batch in self._pending:
+                self._writer.write_batch(batch)
+                self.events_written += batch.num_rows
+            self._pending = []
+            self._buffered = 0
+        if self._sink is not None:
+            self._sink.flush()
+            if sync:
+                os.fsync(self._sink.fileno())
+        if sync:
+            self._since_fsync = 0
+
+    def end_cycle(self) -> None:
+        """Mark the end of an engine cycle (flushes and fsyncs under the ``cycle`` policy)."""
+        if self._policy.mode == "cycle":
+            self.flush(sync=True)
+
+    def close(self) -> None:
+        self.flush(sync=True)
+        self._close_segment(sync=True)
+
+    def __enter__(self) -> JournalWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def record_trades(writer: JournalWriter, trades: pa.Table) -> None:
+    """Journal each row of a trades table as an ``order`` followed by its ``fill``."""
+    if trades.num_rows == 0:
+        return
+    order = {name: trades[name] for name in ("symbol", "side", "qty")}
+    writer.append_columns("order", {"ts": trades["timestamp"], **order})
+    fill = {
+        name: trades[name]
+        for name in ("symbol", "side", "qty", "price", "notional", "fee", "slippage")
+    }
+    writer.append_columns("fill", {"ts": trades["timestamp"], **fill})
+
+
+def record_positions(writer: JournalWriter, positions: pa.Table) -> None:
+    """Journal end-of-run holdings (``timestamp``, ``symbol``, ``qty``, ``mark``)."""
+    if positions.num_rows == 0:
+        return
+    qty = positions["qty"].to_numpy()
+    mark = positions["mark"].to_numpy()
+    writer.append_columns(
+        "position",
+        {
+            "ts": positions["timestamp"],
+            "symbol": positions["symbol"],
+            "qty": qty,
+            "price": mark,
+            "notional": qty * mark,
+        },
+    )
+
+
+def _segment_number(path: Path) -> int:
+    return int(path.name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)])
+
+
+def segment_paths(path: str | Path) -> list[Path]:
+    base = Path(path)
+    if not base.exists():
+        return []
+    found = [
+        candidate
+        for candidate in base.glob(f"{_SEGMENT_PREFIX}*{_SEGMENT_SUFFIX}")
+        if candidate.name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)].isdigit()
+    ]
+    return sorted(found, key=_segment_number)
+
+
+def iter_journal(
+    path: str | Path,
+    *,
+    event_types: Sequence[str] | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    columns: Sequence[str] | None = None,
+) -> Iterator[pa.RecordBatch]:
+    """Stream memory-mapped journal batches filtered by event type and ``[start, end)``.
+
+    A torn trailing batch (e.g. after a crash mid-write) ends that segment's stream.
+    """
+    selected = list(columns) if columns is not None else list(EVENT_FIELDS)
+    types = pa.array(list(event_types), type=pa.string()) if event_types else None
+    ts_type = EVENT_SCHEMA.field("ts").type
+    for segment in segment_paths(path):
+        with pa.memory_map(str(segment), "r") as source:
+            try:
+                reader = pa.ipc.open_stream(source)
+            except pa.ArrowInvalid:
+                continue
+            while True:
+                try:
+                    batch = reader.read_next_batch()
+                except StopIteration:
+                    break
+                except (pa.ArrowInvalid, OSError):
+                    break
+                mask = None
+                if types is not None:
+                    mask = pc.is_in(batch["event_type"], value_set=types)
+                if start is not None:
+                    after = pc.greater_equal(batch["ts"], pa.scalar(start, ts_type))
+                    mask = after if mask is None else pc.and_(mask, after)
+                if end is not None:
+                    before = pc.less(batch["ts"], pa.scalar(end, ts_type))
+                    mask = before if mask is None else pc.and_(mask, before)
+                if mask is not None:
+                    batch = batch.filter(mask)
+                if batch.num_rows:
+                    yield batch.select(selected)
+
+
+def read_journal(
+    path: str | Path,
+    *,
+    event_types: Sequence[str] | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    columns: Sequence[str] | None = None,
+) -> pa.Table:
+    selected = list(columns) if columns is not None else list(EVENT_FIELDS)
+    batches = list(
+        iter_journal(path, event_types=event_types, start=start, end=end, columns=selected)
+    )
+    if not batches:
+        return EVENT_SCHEMA.empty_table().select(selected)
+    return pa.Table.from_batches(batches)
@@ -0,0 +1,145 @@
+"""Columnar run artifact storage (equity curve, trades, metrics, manifest)."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+from longarc.core.profiling import span
+from longarc.storage.journal import FsyncPolicy, JournalWriter
+
+EQUITY_FILE = "equity.parquet"
+TRADES_FILE = "trades.parquet"
+METRICS_FILE = "metrics.json"
+MANIFEST_FILE = "manifest.json"
+JOURNAL_DIR = "journal"
+
+
+@dataclass(frozen=True)
+class RunArtifacts:
+    run_id: str
+    path: Path
+    manifest: dict[str, Any]
+    equity: pa.Table
+    trades: pa.Table
+    metrics: dict[str, Any]
+
+
+class RunStore:
+    """Directory-per-run artifact store rooted at ``base_path``.
+
+    Runs are written to a temporary sibling directory and renamed into place, so a
+    run directory that exists is always complete. A journal opened with
+    :meth:`open_journal` is moved into the run directory by :meth:`save`.
+    """
+
+    def __init__(self, base_path: str | Path) -> None:
+        self._base = Path(base_path)
+
+    @property
+    def base_path(self) -> Path:
+        return self._base
+
+    def run_dir(self, run_id: str) -> Path:
+        if not run_id or any(sep in run_id for sep in ("/", "\\")) or run_id in {".", ".."}:
+            raise ValueError(f"Invalid run_id {run_id!r}.")
+        return self._base / run_id
+
+    def exists(self, run_id: str) -> bool:
+        return (self.run_dir(run_id) / MANIFEST_FILE).exists()
+
+    def read_manifest(self, run_id: str) -> dict[str, Any]:
+        path = self.run_dir(run_id) / MANIFEST_FILE
+        if not path.exists():
+            raise FileNotFoundError(f"Run {run_id!r} not found under {self._base}")
+        manifest: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        return manifest
+
+    def journal_path(self, run_id: str) -> Path:
+        return self.run_dir(run_id) / JOURNAL_DIR
+
+    def _pending_journal(self, run_id: str) -> Path:
+        return self._base / f".{self.run_dir(run_id).name}-journal"
+
+    def open_journal(self, run_id: str, fsync: str | FsyncPolicy = "cycle") -> JournalWriter:
+        """Start a fresh audit journal for a run that has not been saved yet."""
+        pending = self._pending_journal(run_id)
+        if pending.exists():
+            shutil.rmtree(pending)
+        return JournalWriter(pending, run_id, fsync=fsync)
+
+    def save(
+        self,
+        run_id: str,
+        manifest: dict[str, Any],
+        equity: pa.Table,
+        trades: pa.Table,
+        metrics: dict[str, Any],
+    ) -> Path:
+        with span("runs.save", run_id=run_id) as timing:
+            timing.rows = equity.num_rows
+            return self._save(run_id, manifest, equity, trades, metrics)
+
+    def _save(
+        self,
+        run_id: str,
+        manifest: dict[str, Any],
+        equity: pa.Table,
+        trades: pa.Table,
+        metrics: dict[str, Any],
+    ) -> Path:
+        target = self.run_dir(run_id)
+        self._base.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{run_id}-", dir=self._base))
+        try:
+            pq.write_table(equity, staging / EQUITY_FILE, compression="zstd")
+            pq.write_table(trades, staging / TRADES_FILE, compression="zstd")
+            (staging / METRICS_FILE).write_text(
+                json.dumps(metrics, indent=2, sort_keys=True), encoding="utf-8"
+            )
+            (staging / MANIFEST_FILE).write_text(
+                json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8"
+            )
+            pending_journal = self._pending_journal(run_id)
+            if pending_journal.exists():
+                os.replace(pending_journal, staging / JOURNAL_DIR)
+            if target.exists():
+                shutil.rmtree(target)
+            os.replace(staging, target)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return target
+
+    def write_table(self, run_id: str, name: str, table: pa.Table) -> Path:
+        """Add a Parquet artifact ``<name>.parquet`` to an existing run."""
+        path = self.run_dir(run_id) / f"{name}.parquet"
+        pq.write_table(table, path, compression="zstd")
+        return path
+
+    def write_json(self, run_id: str, name: str, payload: dict[str, Any]) -> Path:
+        """Add a JSON artifact ``<name>.json`` to an existing run."""
+        path = self.run_dir(run_id) / f"{name}.json"
+        path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+        return path
+
+    def load(self, run_id: str) -> RunArtifacts:
+        manifest = self.read_manifest(run_id)
+        path = self.run_dir(run_id)
+        metrics: dict[str, Any] = json.loads((path / METRICS_FILE).read_text(encoding="utf-8"))
+        return RunArtifacts(
+            run_id=run_id,
+            path=path,
+            manifest=manifest,
+            equity=pq.read_table(path / EQUITY_FILE),
+            trades=pq.read_table(path / TRADES_FILE),
+            metrics=metrics,
+        )
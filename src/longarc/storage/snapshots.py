@@ -0,0 +1,127 @@
+"""Versioned, checksummed engine state snapshots for warm restarts."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+_PREFIX = "snapshot-"
+_SUFFIX = ".json"
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Engine state at the end of a cycle.
+
+    ``payload`` holds JSON-compatible strategy, portfolio and per-symbol last-bar state;
+    ``sequence`` increases by one per saved snapshot.
+    """
+
+    sequence: int
+    payload: dict[str, Any]
+
+
+def encode_array(values: npt.NDArray[np.float64]) -> list[Any]:
+    """JSON-safe nested lists with NaN encoded as ``None``."""
+    as_objects = values.astype(object)
+    as_objects[np.isnan(values)] = None
+    encoded: list[Any] = as_objects.tolist()
+    return encoded
+
+
+def decode_array(values: list[Any]) -> npt.NDArray[np.float64]:
+    return np.array(values, dtype=np.float64)
+
+
+def _checksum(payload: dict[str, Any]) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), allow_nan=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SnapshotStore:
+    """Directory of ``snapshot-<sequence>.json`` files, newest wins.
+
+    Files are written atomically; loading skips snapshots with an unknown version or a
+    checksum mismatch and falls back to the next older one. Only the newest ``retain``
+    snapshots are kept.
+    """
+
+    def __init__(self, base_path: str | Path, retain: int = 5) -> None:
+        if retain < 1:
+            raise ValueError("retain must be >= 1")
+        self._base = Path(base_path)
+        self._retain = retain
+
+    @property
+    def base_path(self) -> Path:
+        return self._base
+
+    def _paths(self) -> list[tuple[int, Path]]:
+        if not self._base.exists():
+            return []
+        found: list[tuple[int, Path]] = []
+        for path in self._base.glob(f"{_PREFIX}*{_SUFFIX}"):
+            sequence_text = path.name[len(_PREFIX) : -len(_SUFFIX)]
+            if sequence_text.isdigit():
+                found.append((int(sequence_text), path))
+        return sorted(found)
+
+    def save(self, payload: dict[str, Any]) -> Snapshot:
+        existing = self._paths()
+        sequence = existing[-1][0] + 1 if existing else 1
+        document = {
+            "version": SNAPSHOT_VERSION,
+            "sequence": sequence,
+            "checksum": _checksum(payload),
+            "payload": payload,
+        }
+        self._base.mkdir(parents=True, exist_ok=True)
+        target = self._base / f"{_PREFIX}{sequence:010d}{_SUFFIX}"
+        fd, staging = tempfile.mkstemp(prefix=".snapshot-", dir=self._base)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(document, handle, sort_keys=True, allow_nan=False)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(staging, target)
+        except BaseException:
+            Path(staging).unlink(missing_ok=True)
+            raise
+
+        for _, stale in self._paths()[: -self._retain]:
+            stale.unlink(missing_ok=True)
+        return Snapshot(sequence=sequence, payload=payload)
+
+    def load_latest(self) -> Snapshot | None:
+        for sequence, path in reversed(self._paths()):
+            try:
+                document = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                LOGGER.warning("Skipping unreadable snapshot %s: %s", path, exc)
+                continue
+            if document.get("version") != SNAPSHOT_VERSION:
+                LOGGER.warning(
+                    "Skipping snapshot %s with version=%s (expected %s)",
+                    path,
+                    document.get("version"),
+                    SNAPSHOT_VERSION,
+                )
+                continue
+            payload = document.get("payload")
+            if not isinstance(payload, dict) or document.get("checksum") != _checksum(payload):
+                LOGGER.warning("Skipping snapshot %s with checksum mismatch", path)
+                continue
+            return Snapshot(sequence=sequence, payload=payload)
+        return None
@@ -0,0 +1,20 @@
+"""Trading strategies producing target portfolio weights."""
+
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+from longarc.strategy.indicators import IndicatorCache
+from longarc.strategy.sma_cross import SmaCross
+
+
+def get_strategy(name: str, params: Mapping[str, Any]) -> SmaCross:
+    normalized = name.strip().lower()
+    if normalized == "sma_cross":
+        return SmaCross.from_params(params)
+
+    supported = "sma_cross"
+    raise ValueError(f"Unsupported strategy {name!r}. Expected one of: {supported}")
+
+
+__all__ = ["IndicatorCache", "SmaCross", "get_strategy"]
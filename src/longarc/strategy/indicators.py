@@ -0,0 +1,88 @@
+"""Per-bar indicator cache shared by every strategy hosted over one universe."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from longarc.core.metrics import REGISTRY
+
+FloatArray = npt.NDArray[np.float64]
+IndicatorKey = tuple[str, int]
+
+_LOOKUPS = {
+    result: REGISTRY.counter(
+        "longarc_indicator_cache_lookups_total", "Shared indicator lookups.", result=result
+    )
+    for result in ("hit", "miss")
+}
+
+
+class IndicatorCache:
+    """Forward-filled close history of a universe plus indicators memoized per bar.
+
+    The ring buffer holds the last ``capacity`` bars once for all strategies (sized to the
+    longest lookback), and each distinct indicator, keyed like ``("sma", 20)``, is computed
+    at most once per bar however many strategies ask for it. Values equal computing the
+    indicator over each strategy's own window of the same bars.
+    """
+
+    def __init__(self, n_symbols: int, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self.window = np.full((capacity, n_symbols), np.nan, dtype=np.float64)
+        self.last_close = np.full(n_symbols, np.nan, dtype=np.float64)
+        self.bars_seen = 0
+        self._values: dict[IndicatorKey, FloatArray] = {}
+
+    @property
+    def capacity(self) -> int:
+        return int(self.window.shape[0])
+
+    def update(self, close: FloatArray) -> None:
+        """Consume one bar of closes (NaN = no bar) and invalidate the memoized values."""
+        self.last_close = np.where(np.isfinite(close), close, self.last_close)
+        self.window[self.bars_seen % self.capacity] = self.last_close
+        self.bars_seen += 1
+        self._values.clear()
+
+    def restore(self, window: FloatArray, last_close: FloatArray, bars_seen: int) -> None:
+        """Load ring-buffer state saved from a cache of the same shape."""
+        if window.shape != self.window.shape:
+            raise ValueError(f"Expected a window of shape {self.window.shape}, got {window.shape}")
+        self.window = window
+        self.last_close = last_close
+        self.bars_seen = bars_seen
+        self._values.clear()
+
+    def history(self, length: int) -> FloatArray:
+        """The last ``length`` forward-filled bars, oldest first (NaN before the first bar)."""
+        if not 1 <= length <= self.capacity:
+            raise ValueError(f"length must be between 1 and {self.capacity}, got {length}")
+        rows = np.arange(self.bars_seen - length, self.bars_seen) % self.capacity
+        return self.window[rows]
+
+    def get(self, key: IndicatorKey) -> FloatArray:
+        cached = self._values.get(key)
+        if cached is not None:
+            _LOOKUPS["hit"].inc()
+            return cached
+        _LOOKUPS["miss"].inc()
+        name, window = key
+        if name != "sma":
+            raise ValueError(f"Unsupported indicator {name!r}. Expected one of: sma")
+        values: FloatArray = self.history(window).mean(axis=0)
+        self._values[key] = values
+        return values
+
+    def sma(self, window: int) -> FloatArray:
+        """Mean of the last ``window`` closes; NaN until ``window`` bars have been seen."""
+        return self.get(("sma", window))
+
+    def prepare(self, keys: Iterable[IndicatorKey]) -> None:
+        """Compute ``keys`` up front, so concurrent readers afterwards only hit the cache."""
+        for key in dict.fromkeys(keys):
+            if key not in self._values:
+                self.get(key)
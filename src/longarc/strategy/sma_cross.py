@@ -0,0 +1,89 @@
+"""Simple moving average crossover strategy."""
+
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+import numpy as np
+import numpy.typing as npt
+
+from longarc.strategy.indicators import IndicatorCache, IndicatorKey
+
+FloatArray = npt.NDArray[np.float64]
+
+
+def rolling_mean(values: FloatArray, window: int) -> FloatArray:
+    """Trailing mean over ``window`` rows per column; NaN until a full window of valid values."""
+    if window < 1:
+        raise ValueError(f"window must be >= 1, got {window}")
+    valid = np.isfinite(values)
+    padding = np.zeros((1, *values.shape[1:]), dtype=np.float64)
+    sums = np.concatenate([padding, np.cumsum(np.where(valid, values, 0.0), axis=0)])
+    counts = np.concatenate([padding, np.cumsum(valid, axis=0, dtype=np.float64)])
+
+    out = np.full(values.shape, np.nan, dtype=np.float64)
+    if values.shape[0] < window:
+        return out
+    window_sums = sums[window:] - sums[:-window]
+    window_counts = counts[window:] - counts[:-window]
+    out[window - 1 :] = np.where(window_counts == window, window_sums / window, np.nan)
+    return out
+
+
+class SmaCross:
+    """Long-only equal-weight SMA crossover over a universe.
+
+    Each symbol receives ``1 / n_symbols`` of equity while its fast SMA is above its slow
+    SMA and is flat otherwise (including while either window is still warming up).
+    """
+
+    name = "sma_cross"
+
+    def __init__(self, fast_window: int = 20, slow_window: int = 100) -> None:
+        if fast_window < 1 or slow_window < 1:
+            raise ValueError("SMA windows must be positive.")
+        if fast_window >= slow_window:
+            raise ValueError(
+                f"fast_window ({fast_window}) must be smaller than slow_window ({slow_window})."
+            )
+        self.fast_window = fast_window
+        self.slow_window = slow_window
+
+    @classmethod
+    def from_params(cls, params: Mapping[str, Any]) -> SmaCross:
+        return cls(
+            fast_window=int(params.get("fast_window", 20)),
+            slow_window=int(params.get("slow_window", 100)),
+        )
+
+    def target_weights(self, close: FloatArray) -> FloatArray:
+        """Return target weights of shape [T, N] for a forward-filled close matrix."""
+        fast = rolling_mean(close, self.fast_window)
+        slow = rolling_mean(close, self.slow_window)
+        with np.errstate(invalid="ignore"):
+            signal = fast > slow
+        n_symbols = max(close.shape[1], 1)
+        weights: FloatArray = signal.astype(np.float64) / n_symbols
+        return weights
+
+    @property
+    def lookback(self) -> int:
+        """Bars of close history :meth:`latest_weights` needs."""
+        return self.slow_window
+
+    @property
+    def indicators(self) -> tuple[IndicatorKey, ...]:
+        return (("sma", self.fast_window), ("sma", self.slow_window))
+
+    def latest_weights(self, indicators: IndicatorCache) -> FloatArray:
+        """Target weights for the newest bar in ``indicators``.
+
+        Produces the same weights as :meth:`target_weights` over the same bars.
+        """
+        fast = indicators.sma(self.fast_window)
+        slow = indicators.sma(self.slow_window)
+        with np.errstate(invalid="ignore"):
+            signal = fast > slow
+        n_symbols = max(fast.size, 1)
+        weights: FloatArray = signal.astype(np.float64) / n_symbols
+        return weights
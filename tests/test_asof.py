@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pyarrow as pa  # type: ignore[import-untyped]
+
+from longarc.data.asof import AsOfJoiner, AsOfSource, asof_join, bar_close_times, read_asof
+from longarc.data.providers.local_parquet import download_symbol
+from longarc.data.store import BAR_SCHEMA, read_bars_table
+
+_TS = BAR_SCHEMA.field("timestamp").type
+
+
+def _bars(stamps: list[datetime], closes: list[float]) -> pa.Table:
+    return pa.table({"timestamp": pa.array(stamps, _TS), "close": closes})
+
+
+def _utc(*args: int) -> datetime:
+    return datetime(*args, tzinfo=UTC)
+
+
+def test_daily_bars_are_visible_only_after_the_session_close() -> None:
+    daily = _bars([_utc(2024, 7, 1), _utc(2024, 7, 2)], [10.0, 20.0])
+    minutes = _bars(
+        [
+            _utc(2024, 7, 1, 13, 30),  # 09:30 New York, before any daily bar completes
+            _utc(2024, 7, 2, 13, 30),  # next session opens: yesterday's bar only
+            _utc(2024, 7, 2, 19, 58),
+            _utc(2024, 7, 2, 19, 59),  # completes at 16:00, with today's daily bar
+        ],
+        [1.0, 2.0, 3.0, 4.0],
+    )
+    joined = asof_join(minutes, daily, "1m", "1d", prefix="d_")
+    assert joined.column_names == ["timestamp", "close", "d_timestamp", "d_close"]
+    assert joined["d_close"].to_pylist() == [None, 10.0, 10.0, 20.0]
+    assert joined["d_timestamp"].to_pylist()[1] == _utc(2024, 7, 1)
+
+    # The 15:30 hourly bar is partial and completes at the 16:00 close, not 16:30.
+    hourly = pa.array([_utc(2024, 7, 2, 19, 30), _utc(2024, 1, 2, 20, 30)], _TS)
+    closes = bar_close_times(hourly, "1h").astype("datetime64[us]")
+    assert closes.tolist() == [datetime(2024, 7, 2, 20), datetime(2024, 1, 2, 21)]
+    # In winter the session closes at 21:00 UTC.
+    winter = bar_close_times(pa.array([_utc(2024, 1, 2)], _TS), "1d")
+    assert winter.astype("datetime64[us]").tolist() == [datetime(2024, 1, 2, 21)]
+    crypto = bar_close_times(pa.array([_utc(2024, 1, 2)], _TS), "1d", "UTC", "24x7")
+    assert crypto.astype("datetime64[us]").tolist() == [datetime(2024, 1, 3)]
+
+
+def test_read_asof_joins_other_symbols_without_lookahead(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    download_symbol(data_path, "AAPL", "1h", "2024-03-01", "2024-03-05")
+    download_symbol(data_path, "MSFT", "1d", "2024-01-01", "2024-03-31")
+    start = _utc(2024, 3, 2)
+    end = _utc(2024, 3, 5)
+
+    table = read_asof(
+        data_path, "AAPL", "1h", [AsOfSource("MSFT", "1d")], start=start, end=end
+    )
+    assert table.column_names[-2:] == ["msft_1d_timestamp", "msft_1d_close"]
+    assert table.num_rows == 72
+    daily = read_bars_table(data_path, "MSFT", "1d", columns=["close"])
+    by_day = dict(zip(daily["timestamp"].to_pylist(), daily["close"].to_pylist(), strict=True))
+    for stamp, day, close in zip(
+        table["timestamp"].to_pylist(),
+        table["msft_1d_timestamp"].to_pylist(),
+        table["msft_1d_close"].to_pylist(),
+        strict=True,
+    ):
+        # EST before March 10: the session closes at 21:00 UTC.
+        completed = stamp + timedelta(hours=1) >= stamp.replace(hour=21, minute=0)
+        expected_day = stamp.replace(hour=0) - timedelta(days=0 if completed else 1)
+        assert day == expected_day and close == by_day[expected_day]
+    assert table["msft_1d_timestamp"][0].as_py() == _utc(2024, 3, 1)
+
+
+def test_incremental_joiner_matches_batch_join_and_trims_history(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    download_symbol(data_path, "AAPL", "1h", "2024-03-01", "2024-03-06")
+    download_symbol(data_path, "AAPL", "1d", "2024-02-20", "2024-03-06")
+    hourly = read_bars_table(data_path, "AAPL", "1h", columns=["close"])
+    daily = read_bars_table(data_path, "AAPL", "1d", columns=["close"])
+    expected = asof_join(hourly, daily, "1h", "1d", prefix="d_")
+
+    joiner = AsOfJoiner("1d", prefix="d_")
+    before = joiner.lookup(hourly["timestamp"].slice(0, 2), "1h")
+    assert before.column_names == ["d_timestamp", "d_close"]
+    assert before["d_close"].null_count == 2
+
+    stamps = np.asarray(daily["timestamp"].to_numpy(), dtype="datetime64[us]")
+    parts = []
+    for offset in range(0, hourly.num_rows, 24):
+        batch = hourly.slice(offset, 24)
+        last = np.datetime64(batch["timestamp"][-1].as_py().replace(tzinfo=None), "us")
+        # Re-send an overlapping window of daily bars, as a paper poll would.
+        visible = int(np.searchsorted(stamps, last, side="right"))
+        joiner.extend(daily.slice(max(visible - 5, 0), 5))
+        parts.append(joiner.lookup(batch["timestamp"], "1h"))
+        assert len(joiner) <= 2
+    incremental = pa.concat_tables(parts)
+    assert incremental.equals(expected.select(["d_timestamp", "d_close"]))
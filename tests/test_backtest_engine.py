@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import numpy as np
+
+from longarc.cli import main
+from longarc.core.config import AppConfig
+from longarc.data.providers.local_parquet import download_symbol
+from longarc.data.store import write_bars
+from longarc.engine.backtest import forward_fill, run_backtest, run_backtest_cached
+from longarc.storage.runs import RunStore
+from longarc.strategy.sma_cross import rolling_mean
+
+
+def _config(data_path: str) -> AppConfig:
+    return AppConfig.model_validate(
+        {
+            "universe": {"symbols": ["AAPL", "MSFT"], "timeframe": "1d"},
+            "data": {"path": data_path},
+            "strategy": {"name": "sma_cross", "params": {"fast_window": 2, "slow_window": 5}},
+        }
+    )
+
+
+def _seed(data_path: str) -> None:
+    for symbol in ("AAPL", "MSFT"):
+        download_symbol(data_path, symbol, "1d", "2024-01-01", "2024-02-15")
+
+
+def test_rolling_mean_and_forward_fill() -> None:
+    values = np.array([[1.0], [np.nan], [3.0], [5.0]])
+    np.testing.assert_allclose(forward_fill(values)[:, 0], [1.0, 1.0, 3.0, 5.0])
+    means = rolling_mean(forward_fill(values), 2)
+    np.testing.assert_allclose(means[:, 0], [np.nan, 1.0, 2.0, 4.0])
+    assert np.isnan(forward_fill(np.array([[np.nan], [2.0]]))[0, 0])
+
+
+def test_signals_trade_on_the_following_bar(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    closes = [10.0, 10.0, 10.0, 10.0, 20.0, 20.0, 20.0, 10.0]
+    write_bars(
+        data_path,
+        "AAPL",
+        "1d",
+        [
+            {
+                "timestamp": f"2024-01-{day + 1:02d}T00:00:00+00:00",
+                "open": close,
+                "high": close,
+                "low": close,
+                "close": close,
+                "volume": 1.0,
+            }
+            for day, close in enumerate(closes)
+        ],
+    )
+    config = AppConfig.model_validate(
+        {
+            "universe": {"symbols": ["AAPL"], "timeframe": "1d"},
+            "data": {"path": data_path},
+            "strategy": {"name": "sma_cross", "params": {"fast_window": 1, "slow_window": 2}},
+            "cost_model": {"fee_bps": 0.0, "slippage_bps": 0.0},
+        }
+    )
+    # The jump to 20 on Jan 5 turns the signal on at that close; it can only be bought on
+    # Jan 6, and the signal turning off on Jan 6 sells on Jan 7.
+    trades = run_backtest(config).trades
+    assert trades["side"].to_pylist() == ["buy", "sell"]
+    days = [stamp.day for stamp in trades["timestamp"].to_pylist()]
+    assert days == [6, 7]
+    assert trades["price"].to_pylist() == [20.0, 20.0]
+
+
+def test_backtest_cache_hits_on_identical_inputs(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    _seed(data_path)
+    runs = RunStore(tmp_path / "runs")
+    config = _config(data_path)
+
+    first, first_hit = run_backtest_cached(config, runs)
+    second, second_hit = run_backtest_cached(config, runs)
+
+    assert not first_hit
+    assert second_hit
+    assert first.run_id == second.run_id
+    assert first.equity.equals(second.equity)
+    assert first.trades.num_rows > 0
+    assert second.metrics == first.metrics
+    assert second.metrics["base_currency"] == "USD"
+
+
+def test_backtest_cache_misses_when_stored_data_changes(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    _seed(data_path)
+    runs = RunStore(tmp_path / "runs")
+    config = _config(data_path)
+
+    first, _ = run_backtest_cached(config, runs)
+    write_bars(
+        data_path,
+        "AAPL",
+        "1d",
+        [
+            {
+                "timestamp": "2024-02-16T00:00:00+00:00",
+                "open": 1.0,
+                "high": 1.0,
+                "low": 1.0,
+                "close": 1.0,
+                "volume": 1.0,
+            }
+        ],
+    )
+    second, hit = run_backtest_cached(config, runs)
+    changed_params, params_hit = run_backtest_cached(
+        config.model_copy(update={"risk": config.risk.model_copy(update={"kill_switch": False})}),
+        runs,
+    )
+
+    assert not hit
+    assert not params_hit
+    assert len({first.run_id, second.run_id, changed_params.run_id}) == 3
+
+
+def test_backtest_and_report_cli(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    _seed(data_path)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "universe:\n  symbols: [AAPL, MSFT]\n  timeframe: 1d\n"
+        f"data:\n  path: {data_path}\n"
+        "strategy:\n  name: sma_cross\n  params:\n    fast_window: 2\n    slow_window: 5\n",
+        encoding="utf-8",
+    )
+    runs_path = str(tmp_path / "runs")
+
+    assert main(["backtest", "--config", str(config_path), "--runs-path", runs_path]) == 0
+    (run_dir,) = [path for path in (tmp_path / "runs").iterdir() if not path.name.startswith(".")]
+    assert (run_dir / "equity.parquet").exists()
+    assert main(["report", "--run-id", run_dir.name, "--runs-path", runs_path]) == 0
+    assert main(["report", "--run-id", "missing-run", "--runs-path", runs_path]) == 1
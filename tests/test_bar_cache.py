@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pyarrow as pa  # type: ignore[import-untyped]
+import pytest
+
+from longarc.cli import main
+from longarc.core.metrics import REGISTRY
+from longarc.data.providers.local_parquet import download_symbol
+from longarc.data.store import (
+    BAR_CACHE_ENV,
+    BarCache,
+    bar_path,
+    compact_bars,
+    read_bars_table,
+    write_bars,
+)
+
+
+def _entries(cache_path: Path) -> list[Path]:
+    return sorted(cache_path.rglob("*.arrow"))
+
+
+def _cached_read(data_path: str, cache_path: str) -> tuple[int, float]:
+    hits = REGISTRY.counter(
+        "longarc_bar_cache_lookups_total", "Shared bar cache lookups.", result="hit"
+    )
+    before = hits.value
+    table = read_bars_table(data_path, "AAPL", "1d", cache=BarCache(cache_path))
+    return table.num_rows, hits.value - before
+
+
+def test_cached_reads_are_zero_copy_and_match_parquet(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    download_symbol(data_path, "AAPL", "1d", "2024-01-01", "2024-03-31")
+    cache = BarCache(tmp_path / "cache")
+    start = datetime(2024, 2, 1, tzinfo=UTC)
+    end = datetime(2024, 3, 1, tzinfo=UTC)
+
+    expected = read_bars_table(data_path, "AAPL", "1d", columns=["close"], start=start, end=end)
+    read_bars_table(data_path, "AAPL", "1d", cache=cache)
+    allocated = pa.total_allocated_bytes()
+    cached = read_bars_table(
+        data_path, "AAPL", "1d", columns=["close"], start=start, end=end, cache=cache
+    )
+    assert pa.total_allocated_bytes() == allocated
+    assert cached.equals(expected)
+    assert cached.num_rows == 29
+    assert len(_entries(tmp_path / "cache")) == 1
+    with pytest.raises(ValueError, match="missing required fields"):
+        read_bars_table(data_path, "AAPL", "1d", columns=["vwap"], cache=cache)
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        rows, hits = pool.submit(_cached_read, data_path, str(tmp_path / "cache")).result()
+    assert (rows, hits) == (91, 1.0)
+
+
+def test_writers_invalidate_and_rewrites_rematerialize(tmp_path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    cache_path = tmp_path / "cache"
+    monkeypatch.setenv(BAR_CACHE_ENV, str(cache_path))
+    download_symbol(data_path, "AAPL", "1d", "2024-01-01", "2024-01-10")
+
+    assert read_bars_table(data_path, "AAPL", "1d").num_rows == 10
+    (entry,) = _entries(cache_path)
+    write_bars(
+        data_path,
+        "AAPL",
+        "1d",
+        [
+            {
+                "timestamp": datetime(2024, 1, 11, tzinfo=UTC),
+                "open": 1.0,
+                "high": 2.0,
+                "low": 0.5,
+                "close": 1.5,
+                "volume": 10.0,
+            }
+        ],
+    )
+    assert _entries(cache_path) == []
+    assert read_bars_table(data_path, "AAPL", "1d")["close"].to_pylist()[-1] == 1.5
+    (rebuilt,) = _entries(cache_path)
+    assert rebuilt != entry
+
+    compact_bars(data_path, "AAPL", "1d", scan_repeat=1)
+    assert _entries(cache_path) == []
+    assert read_bars_table(data_path, "AAPL", "1d").num_rows == 11
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    for symbol in ("AAPL", "MSFT", "NVDA"):
+        download_symbol(data_path, symbol, "1d", "2024-01-01", "2024-03-31")
+    probe = BarCache(tmp_path / "probe")
+    probe.table(data_path, "AAPL", "1d")
+    entry_size = probe.size_bytes()
+
+    cache = BarCache(tmp_path / "cache", max_bytes=2 * entry_size)
+    cache.table(data_path, "AAPL", "1d")
+    cache.table(data_path, "MSFT", "1d")
+    (aapl,) = [path for path in _entries(tmp_path / "cache") if "AAPL" in path.parts]
+    os.utime(aapl, ns=(1, 1))
+    cache.table(data_path, "NVDA", "1d")
+
+    remaining = {path.parts[-3] for path in _entries(tmp_path / "cache")}
+    assert remaining == {"MSFT", "NVDA"}
+    assert cache.size_bytes() <= cache.max_bytes
+    with pytest.raises(ValueError, match="must be positive"):
+        BarCache(tmp_path / "cache", max_bytes=0)
+
+
+def test_concurrent_materialize_keeps_and_survives_losing_the_entry(tmp_path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    download_symbol(data_path, "AAPL", "1d", "2024-01-01", "2024-03-31")
+    cache = BarCache(tmp_path / "cache")
+    cache.table(data_path, "AAPL", "1d")
+    (entry,) = _entries(tmp_path / "cache")
+    stale = entry.with_name("0-0-0.arrow")
+    stale.write_bytes(b"")
+
+    # Another process materializing the same fingerprint must not delete our entry.
+    unlinked: list[str] = []
+    original_unlink = Path.unlink
+
+    def recording_unlink(self: Path, missing_ok: bool = False) -> None:
+        unlinked.append(self.name)
+        original_unlink(self, missing_ok=missing_ok)
+
+    monkeypatch.setattr(Path, "unlink", recording_unlink)
+    cache._materialize(bar_path(data_path, "AAPL", "1d"), entry)
+    monkeypatch.undo()
+    assert stale.name in unlinked and entry.name not in unlinked
+    assert _entries(tmp_path / "cache") == [entry]
+
+    # An eviction elsewhere between writing and reopening falls back to the decoded table.
+    original_materialize = BarCache._materialize
+
+    def evicted(self: BarCache, source: Path, target: Path) -> pa.Table:
+        table = original_materialize(self, source, target)
+        target.unlink()
+        return table
+
+    cache.invalidate(data_path, "AAPL", "1d")
+    monkeypatch.setattr(BarCache, "_materialize", evicted)
+    table = cache.table(data_path, "AAPL", "1d")
+    assert table.equals(read_bars_table(data_path, "AAPL", "1d", columns=table.column_names[1:]))
+
+
+def test_cli_bar_cache_flag_is_scoped_to_the_command(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    download_symbol(data_path, "AAPL", "1d", "2024-01-01", "2024-03-31")
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "universe:\n  symbols: [AAPL]\n  timeframe: 1d\n"
+        f"data:\n  path: {data_path}\n"
+        "strategy:\n  name: sma_cross\n  params:\n    fast_window: 2\n    slow_window: 5\n",
+        encoding="utf-8",
+    )
+    cache_path = tmp_path / "shm"
+
+    args = ["--bar-cache", str(cache_path), "--bar-cache-max-mb", "64", "backtest"]
+    assert main([*args, "--config", str(config_path), "--runs-path", str(tmp_path / "runs")]) == 0
+    assert len(_entries(cache_path)) == 1
+    assert BAR_CACHE_ENV not in os.environ
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from longarc.bench.cases import default_cases, parse_size, parse_sizes, size_label
+from longarc.bench.runner import compare, run_suite, select_cases
+from longarc.cli import main
+
+FIXTURES = Path(__file__).resolve().parents[1] / "benchmarks" / "fixtures"
+
+
+def test_parse_size_and_label() -> None:
+    assert parse_size("1k") == 1_000
+    assert parse_size("100K") == 100_000
+    assert parse_size("10m") == 10_000_000
+    assert parse_size("250") == 250
+    assert size_label(10_000_000) == "10m"
+    assert size_label(1_500) == "1500"
+    with pytest.raises(ValueError, match="Invalid benchmark size"):
+        parse_size("lots")
+    assert parse_sizes("quick") == [1_000, 100_000]
+    assert parse_sizes("Full") == [1_000, 100_000, 10_000_000]
+    assert parse_sizes("1k, 10m,") == [1_000, 10_000_000]
+
+
+def test_suite_records_results_and_detects_regressions() -> None:
+    cases = select_cases(
+        default_cases([1_000], FIXTURES), ["store.read_bars_table*", "polygon.decode*"]
+    )
+    assert [case.name for case in cases] == ["store.read_bars_table[1k]", "polygon.decode[50k]"]
+    names = [case.name for case in default_cases([1_000], FIXTURES)]
+    assert "robustness.block_bootstrap[10k]" in names
+
+    document = run_suite(cases, repeat=2)
+    result = document["results"]["polygon.decode[50k]"]
+    assert result["repeat"] == 2 and result["median_s"] > 0
+    assert document["machine"]["id"] and "sha" in document["commit"]
+
+    faster = json.loads(json.dumps(document))
+    for entry in faster["results"].values():
+        entry["median_s"] /= 10.0
+    assert not any(item.regressed for item in compare(document, document, threshold=0.1))
+    regressed = compare(document, faster, threshold=0.1)
+    assert {item.name for item in regressed if item.regressed} == set(document["results"])
+
+
+def test_bench_cli_writes_results_and_fails_on_regression(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    baseline = tmp_path / "baseline.json"
+    args = [
+        "bench",
+        "--sizes",
+        "1k",
+        "--case",
+        "store.read_bars_table*",
+        "--repeat",
+        "1",
+        "--fixtures",
+        str(FIXTURES),
+        "--output",
+        str(tmp_path / "results"),
+        "--baseline",
+        str(baseline),
+    ]
+
+    assert main([*args, "--update-baseline"]) == 0
+    assert len(list((tmp_path / "results").glob("*/*.json"))) == 1
+    assert main([*args, "--threshold", "1000"]) == 0
+
+    document = json.loads(baseline.read_text(encoding="utf-8"))
+    document["results"]["store.read_bars_table[1k]"]["median_s"] = 1e-9
+    baseline.write_text(json.dumps(document), encoding="utf-8")
+    assert main(args) == 1
@@ -58,7 +58,9 @@ def test_data_download_and_show_latest(tmp_path) -> None:  # type: ignore[no-unt
 def test_data_download_polygon_provider_with_api_key(tmp_path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
     data_path = str(tmp_path / "data")
 
-    def fake_fetch_json(_: str) -> dict[str, object]:
+    def fake_fetch_json(url: str) -> dict[str, object]:
+        if "/v3/reference/" in url:
+            return {"status": "OK", "results": []}
         return {
             "status": "OK",
             "results": [
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+
+from longarc.cli import main
+from longarc.data.providers.local_parquet import download_symbol
+from longarc.data.quality import (
+    CALENDARS,
+    QualityChecks,
+    check_table,
+    session_ordinals,
+    us_equity_holidays,
+)
+from longarc.data.store import BAR_SCHEMA, bar_path
+
+
+def _bars(days: list[str], closes: list[float], **overrides: list[float]) -> pa.Table:
+    columns: dict[str, object] = {
+        "timestamp": [datetime.fromisoformat(day).replace(tzinfo=UTC) for day in days],
+        "open": closes,
+        "high": [close + 1.0 for close in closes],
+        "low": [close - 1.0 for close in closes],
+        "close": closes,
+        "volume": [1_000.0] * len(days),
+    }
+    columns.update(overrides)
+    return pa.table(columns, schema=BAR_SCHEMA)
+
+
+def test_check_table_flags_each_problem_class() -> None:
+    # Fri 5th -> Mon 8th skips only the weekend; Wed 10th is missing.
+    days = ["2024-01-04", "2024-01-05", "2024-01-08", "2024-01-09", "2024-01-11", "2024-01-11"]
+    table = _bars(
+        days,
+        [10.0, 11.0, 12.0, -1.0, 13.0, 13.0],
+        high=[11.0, 12.0, 9.0, 0.0, 14.0, 14.0],
+        volume=[100.0, 100.0, 100.0, 100.0, 100.0, 50_000.0],
+    )
+
+    result = check_table(table, "AAPL", "1d", QualityChecks(stale_bars=2))
+    assert result.rows == 6
+    assert result.duplicates == 1 and result.unsorted == 0
+    assert result.ohlc_errors == 1
+    assert result.non_positive == 1
+    assert (result.gaps, result.missing_bars, result.max_gap_bars) == (1, 1, 1)
+    assert result.volume_spikes == 1
+    assert result.stale_bars == 2
+    assert result.status == "fail"
+
+    holiday = QualityChecks(holidays=("2024-01-10",), stale_bars=2)
+    assert check_table(table, "AAPL", "1d", holiday).missing_bars == 0
+    always_open = QualityChecks(calendar="24x7", stale_bars=2)
+    assert check_table(table, "AAPL", "1d", always_open).missing_bars == 3
+
+
+def test_us_equity_calendar_skips_exchange_holidays() -> None:
+    days = ["2024-07-01", "2024-07-02", "2024-07-03", "2024-07-05", "2024-07-08"]
+    table = _bars(days, [10.0, 11.0, 12.0, 13.0, 14.0])
+    result = check_table(table, "AAPL", "1d", QualityChecks())
+    assert (result.gaps, result.missing_bars, result.off_session) == (0, 0, 0)
+    # Extra --holidays merge with the built-in list rather than replacing it.
+    extra = QualityChecks(holidays=("2024-07-02",))
+    assert check_table(table, "AAPL", "1d", extra).off_session == 1
+    assert check_table(table, "AAPL", "1d", extra).missing_bars == 0
+
+    hourly = pa.array(
+        [
+            datetime(2024, 7, 3, 19, 30, tzinfo=UTC),  # 15:30 New York, last slot
+            datetime(2024, 7, 5, 13, 30, tzinfo=UTC),  # next session opens
+        ],
+        type=BAR_SCHEMA.field("timestamp").type,
+    )
+    ordinal, in_session = session_ordinals(
+        hourly, "1h", CALENDARS["us_equity"], "America/New_York"
+    )
+    assert in_session.all() and int(ordinal[1] - ordinal[0]) == 1
+
+    holidays = us_equity_holidays(2024, 2024)
+    assert {"2024-03-29", "2024-06-19", "2024-11-28", "2024-12-25"} <= set(holidays)
+    assert "2021-12-31" not in us_equity_holidays(2021, 2022)  # 2022 New Year's is a Saturday
+    assert "2001-09-11" in us_equity_holidays(2001, 2001)
+
+
+def test_intraday_gaps_follow_the_session_window() -> None:
+    stamps = pa.array(
+        [
+            datetime(2024, 1, 5, 19, 30, tzinfo=UTC),  # 14:30 New York, Friday
+            datetime(2024, 1, 5, 20, 30, tzinfo=UTC),  # last hourly slot of the session
+            datetime(2024, 1, 6, 15, 30, tzinfo=UTC),  # Saturday: off session
+            datetime(2024, 1, 8, 14, 30, tzinfo=UTC),  # Monday open
+            datetime(2024, 1, 8, 16, 30, tzinfo=UTC),  # 11:30, one hourly bar missing
+        ],
+        type=BAR_SCHEMA.field("timestamp").type,
+    )
+    ordinal, in_session = session_ordinals(
+        stamps, "1h", CALENDARS["us_equity"], "America/New_York"
+    )
+    assert in_session.tolist() == [True, True, False, True, True]
+    sessions = ordinal[in_session]
+    assert (sessions[1:] - sessions[:-1]).tolist() == [1, 1, 2]
+
+
+def test_data_verify_cli_reports_per_dataset_and_fails_on_errors(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = tmp_path / "data"
+    for symbol in ("AAPL", "MSFT"):
+        download_symbol(data_path, symbol, "1d", "2024-01-01", "2024-01-31")
+    bad = _bars(["2024-01-03", "2024-01-02"], [10.0, 11.0])
+    path = bar_path(data_path, "BAD", "1d")
+    path.parent.mkdir(parents=True)
+    pq.write_table(bad, path)
+    broken = bar_path(data_path, "BROKEN", "1d")
+    broken.parent.mkdir(parents=True)
+    broken.write_bytes(b"not parquet")
+
+    output = tmp_path / "quality"
+    args = ["data", "verify", "--data-path", str(data_path), "--workers", "2"]
+    assert main([*args, "--output", str(output)]) == 1
+    assert main([*args, "--symbols", "aapl", "msft"]) == 0
+
+    rows = {row["symbol"]: row for row in pq.read_table(output / "quality.parquet").to_pylist()}
+    assert list(rows) == ["AAPL", "BAD", "BROKEN", "MSFT"]
+    assert rows["AAPL"]["status"] == "ok" and rows["AAPL"]["rows"] == 31
+    # 8 weekend days plus New Year's Day and Martin Luther King Jr. Day.
+    assert rows["AAPL"]["off_session"] == 10
+    assert rows["BAD"]["unsorted"] == 1 and rows["BAD"]["status"] == "fail"
+    assert rows["BROKEN"]["error"] and rows["BROKEN"]["status"] == "fail"
+    summary = json.loads((output / "quality.json").read_text(encoding="utf-8"))
+    assert summary["datasets"] == 4
+    assert summary["status"] == {"ok": 2, "warn": 0, "fail": 2}
+    assert summary["failed"] == ["BAD/1d", "BROKEN/1d"]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import csv
+import io
+from datetime import UTC, datetime
+
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.compute as pc  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+import pytest
+
+from longarc.cli import main
+from longarc.data.providers.local_parquet import download_symbol
+from longarc.data.query import BarQuery, parse_aggregation, query_bars
+from longarc.data.store import read_bars_table, write_actions
+
+
+def _store(tmp_path) -> str:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    for symbol in ("AAPL", "MSFT"):
+        download_symbol(data_path, symbol, "1d", "2024-01-01", "2024-03-31")
+        download_symbol(data_path, symbol, "1h", "2024-03-01", "2024-03-05")
+    write_actions(data_path, "AAPL", [{"ex_date": "2024-02-01", "kind": "split", "ratio": 2}])
+    return data_path
+
+
+def test_query_streams_projected_filtered_adjusted_batches(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = _store(tmp_path)
+    query = BarQuery(
+        timeframes=("1d",),
+        columns=("symbol", "timestamp", "close"),
+        start=datetime(2024, 1, 30, tzinfo=UTC),
+        end=datetime(2024, 2, 3, tzinfo=UTC),
+        batch_size=2,
+    )
+    batches = list(query_bars(data_path, query))
+    assert len(batches) > 2
+    table = pa.Table.from_batches(batches)
+    assert table.column_names == ["symbol", "timestamp", "close"]
+    assert table["symbol"].to_pylist() == ["AAPL"] * 4 + ["MSFT"] * 4
+
+    for symbol in ("AAPL", "MSFT"):
+        expected = read_bars_table(
+            data_path, symbol, "1d", columns=["close"], start=query.start, end=query.end
+        )
+        rows = table.filter(pc.equal(table["symbol"], symbol))
+        assert rows.select(["timestamp", "close"]).equals(expected)
+
+    raw = query_bars(data_path, BarQuery(symbols=("aapl",), timeframes=("1d",), adjust="none"))
+    assert raw.read_all()["close"][0].as_py() == 111.0
+    with pytest.raises(ValueError, match="Unknown query columns"):
+        BarQuery(columns=("vwap",))
+
+
+def test_aggregations_fold_partials_across_many_batches(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = _store(tmp_path)
+    specs = ("close:mean", "close:first", "close:last", "volume:sum", "high:max", "close:count")
+    aggregations = tuple(parse_aggregation(spec) for spec in specs)
+    result = query_bars(data_path, BarQuery(aggregations=aggregations, batch_size=1)).read_all()
+
+    full = query_bars(data_path, BarQuery()).read_all()
+    expected = full.group_by(["symbol", "timeframe"], use_threads=False).aggregate(
+        [(column, func) for column, func in aggregations]
+    )
+    expected = expected.sort_by([("symbol", "ascending"), ("timeframe", "ascending")])
+    assert result.column_names == ["symbol", "timeframe", *(s.replace(":", "_") for s in specs)]
+    for name in result.column_names:
+        assert result[name].to_pylist() == pytest.approx(expected[name].to_pylist())
+
+    daily = query_bars(
+        data_path,
+        BarQuery(
+            timeframes=("1h",),
+            group_by=("symbol",),
+            every="1d",
+            aggregations=(("volume", "sum"),),
+        ),
+    ).read_all()
+    assert daily.column_names == ["symbol", "timestamp", "volume_sum"]
+    assert daily.num_rows == 10
+    assert sum(daily["volume_sum"].to_pylist()) == sum(
+        full.filter(pc.equal(full["timeframe"], "1h"))["volume"].to_pylist()
+    )
+    with pytest.raises(ValueError, match="Unsupported aggregation"):
+        BarQuery(aggregations=(parse_aggregation("close:median"),))
+    with pytest.raises(ValueError, match="require at least one aggregation"):
+        BarQuery(every="1d")
+
+
+def test_data_query_cli_writes_each_format(tmp_path, capsysbinary) -> None:  # type: ignore[no-untyped-def]
+    data_path = _store(tmp_path)
+    args = ["data", "query", "--data-path", data_path, "--symbols", "MSFT", "--timeframes", "1d"]
+
+    assert main([*args, "--columns", "timestamp", "close", "--end", "2024-01-05"]) == 0
+    streamed = pa.ipc.open_stream(capsysbinary.readouterr().out).read_all()
+    assert streamed.column_names == ["timestamp", "close"] and streamed.num_rows == 5
+
+    output = tmp_path / "out" / "msft.parquet"
+    assert main([*args, "--format", "parquet", "--output", str(output)]) == 0
+    assert pq.read_table(output).num_rows == 91
+
+    assert main([*args, "--agg", "volume:sum", "--group-by", "--format", "csv"]) == 0
+    rows = list(csv.DictReader(io.StringIO(capsysbinary.readouterr().out.decode("utf-8"))))
+    assert len(rows) == 1 and float(rows[0]["volume_sum"]) > 0
@@ -2,9 +2,31 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
+import numpy as np
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
 import pytest
 
-from longarc.data.store import read_bars, write_bars
+from longarc.cli import main
+from longarc.data.store import (
+    ACTIONS_SCHEMA,
+    BAR_SCHEMA,
+    BarCache,
+    WriteOptions,
+    adjustment_factors,
+    bar_path,
+    bars_fingerprint,
+    compact_bars,
+    map_datasets,
+    mark_raw,
+    migrate_bars,
+    read_actions,
+    read_bars,
+    read_bars_table,
+    select_datasets,
+    write_actions,
+    write_bars,
+)
 
 
 def _bar(ts: str, close: float) -> dict[str, object]:
@@ -66,3 +88,191 @@ def test_write_bars_rejects_missing_required_fields(tmp_path) -> None:  # type:
                 }
             ],
         )
+
+
+def test_write_options_pick_float_encodings_per_column() -> None:
+    rows = 1_000
+    table = pa.table(
+        {
+            "timestamp": pa.array(np.arange(rows), type=pa.timestamp("us", tz="UTC")),
+            "close": np.round(np.linspace(100.0, 101.0, rows), 1),
+            "volume": np.random.default_rng(0).normal(1_000.0, 50.0, rows),
+        }
+    )
+
+    kwargs = WriteOptions().parquet_kwargs(table)
+    assert kwargs["compression"] == "zstd" and kwargs["compression_level"] == 3
+    assert kwargs["use_byte_stream_split"] == ["volume"]
+    assert kwargs["use_dictionary"] == ["timestamp", "close"]
+    assert kwargs["sorting_columns"] == [pq.SortingColumn(0)]
+    forced = WriteOptions(float_encoding="byte_stream_split", sorting_metadata=False)
+    assert forced.parquet_kwargs(table)["use_byte_stream_split"] == ["close", "volume"]
+    assert "sorting_columns" not in forced.parquet_kwargs(table)
+    assert "compression_level" not in WriteOptions(compression="snappy").parquet_kwargs(table)
+    with pytest.raises(ValueError, match="Unsupported compression 'brotli'"):
+        WriteOptions(compression="brotli")
+    with pytest.raises(ValueError, match="does not take a level"):
+        WriteOptions(compression="snappy", compression_level=1)
+
+
+def test_compact_bars_rewrites_sorted_with_new_layout(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    rows = 5_000
+    stamps = np.datetime64("2024-01-01T00:00", "us") + np.arange(rows)[::-1] * np.timedelta64(
+        1, "m"
+    )
+    close = 100.0 + np.random.default_rng(1).normal(0.0, 1.0, rows)
+    table = pa.table(
+        {
+            "timestamp": pa.array(stamps, type=BAR_SCHEMA.field("timestamp").type),
+            "open": close,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": np.full(rows, 10.0),
+        },
+        schema=BAR_SCHEMA,
+    )
+    path = bar_path(tmp_path, "AAPL", "1m")
+    path.parent.mkdir(parents=True)
+    pq.write_table(mark_raw(table), path, compression="none", row_group_size=500)
+
+    result = compact_bars(tmp_path, "aapl", "1m", WriteOptions(row_group_size=2_000), 1)
+    assert result.symbol == "AAPL" and result.rows == rows
+    assert (result.row_groups_before, result.row_groups_after) == (10, 3)
+    assert result.bytes_after < result.bytes_before
+    assert result.scan_ms_before > 0 and result.scan_ms_after > 0
+    metadata = pq.ParquetFile(path).metadata
+    assert metadata.row_group(0).column(0).statistics.max < metadata.row_group(1).column(
+        0
+    ).statistics.min
+    assert metadata.row_group(0).sorting_columns == (pq.SortingColumn(0),)
+    stored = read_bars_table(tmp_path, "AAPL", "1m")
+    assert stored.num_rows == rows
+    assert stored["close"].to_pylist() == table.sort_by("timestamp")["close"].to_pylist()
+    assert [item.name for item in path.parent.iterdir()] == ["bars.parquet"]
+
+
+def test_data_compact_cli_runs_across_workers(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    for symbol in ("AAPL", "MSFT", "NVDA"):
+        write_bars(tmp_path, symbol, "1d", [_bar("2024-01-01T00:00:00", 100.0)])
+    assert select_datasets(tmp_path, ["msft", "nvda"]) == [("MSFT", "1d"), ("NVDA", "1d")]
+    assert map_datasets(bar_path, tmp_path, [("MSFT", "1d"), ("AAPL", "1d")], workers=1) == [
+        bar_path(tmp_path, "MSFT", "1d"),
+        bar_path(tmp_path, "AAPL", "1d"),
+    ]
+
+    args = ["data", "compact", "--data-path", str(tmp_path), "--workers", "2"]
+    assert main([*args, "--compression", "lz4", "--float-encoding", "dictionary"]) == 0
+    for symbol in ("AAPL", "MSFT", "NVDA"):
+        column = pq.ParquetFile(bar_path(tmp_path, symbol, "1d")).metadata.row_group(0).column(1)
+        assert column.compression == "LZ4"
+    assert read_bars(tmp_path, "MSFT", "1d")[0]["close"] == 100.0
+
+
+
+def test_adjustment_factors_compound_backwards_from_each_ex_date() -> None:
+    actions = pa.table(
+        {
+            "ex_date": [datetime(2024, 1, day, tzinfo=UTC) for day in (4, 2, 3)],
+            "kind": ["split", "split", "dividend"],
+            "ratio": [0.5, 4.0, 1.0],
+            "cash": [0.0, 0.0, 2.0],
+        },
+        schema=ACTIONS_SCHEMA,
+    )
+    days = np.arange("2024-01-01", "2024-01-06", dtype="datetime64[D]")
+    stamps = days.astype("datetime64[us]").astype(np.int64)
+    closes = np.array([400.0, 100.0, 100.0, 50.0, 50.0])
+
+    price, volume = adjustment_factors(stamps, actions, "splits")
+    assert price.tolist() == [0.5, 2.0, 2.0, 1.0, 1.0]
+    assert volume.tolist() == [2.0, 0.5, 0.5, 1.0, 1.0]
+    price, _ = adjustment_factors(stamps, actions, "all", (stamps, closes))
+    assert price.tolist() == [0.49, 1.96, 2.0, 1.0, 1.0]
+    price, volume = adjustment_factors(stamps, actions, "none")
+    assert price.tolist() == volume.tolist() == [1.0] * 5
+    with pytest.raises(ValueError, match="Unsupported adjustment"):
+        adjustment_factors(stamps, actions, "dividends")
+
+
+def test_actions_adjust_reads_without_rewriting_bars(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    write_bars(tmp_path, "AAPL", "1d", [_bar(f"2024-01-0{day}", 100.0) for day in range(1, 6)])
+    path = bar_path(tmp_path, "AAPL", "1d")
+    stat = path.stat()
+    fingerprint = bars_fingerprint(tmp_path, "AAPL", "1d")
+    cache = BarCache(tmp_path / "cache")
+    read_bars_table(tmp_path, "AAPL", "1d", cache=cache)
+
+    split = {"ex_date": "2024-01-03", "kind": "split", "ratio": 2}
+    result = write_actions(tmp_path, "aapl", [split])
+    assert (result.input_rows, result.total_rows) == (1, 1)
+    write_actions(tmp_path, "AAPL", [split])
+    assert read_actions(tmp_path, "AAPL").num_rows == 1
+    assert path.stat().st_mtime_ns == stat.st_mtime_ns
+    assert bars_fingerprint(tmp_path, "AAPL", "1d") != fingerprint
+    with pytest.raises(ValueError, match="Unsupported corporate action"):
+        write_actions(tmp_path, "AAPL", [{"ex_date": "2024-01-03", "kind": "merger"}])
+
+    for reader_cache in (None, cache):
+        table = read_bars_table(
+            tmp_path, "AAPL", "1d", columns=["close", "volume"], cache=reader_cache
+        )
+        assert table["close"].to_pylist() == [50.0, 50.0, 100.0, 100.0, 100.0]
+        assert table["volume"].to_pylist() == [2000.0, 2000.0, 1000.0, 1000.0, 1000.0]
+    assert len(list((tmp_path / "cache").rglob("*.arrow"))) == 1
+    assert read_bars(tmp_path, "AAPL", "1d", adjust="none")[0]["close"] == 100.0
+
+    write_bars(tmp_path, "AAPL", "1d", [_bar("2024-01-06T00:00:00", 101.0)])
+    raw = read_bars_table(tmp_path, "AAPL", "1d", adjust="none")
+    assert raw["close"].to_pylist() == [100.0] * 5 + [101.0]
+
+
+def test_legacy_adjusted_store_is_refused_until_migrated(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    # A store written before raw bars: Polygon prices already halved by the 2024-01-03 split.
+    legacy = pa.Table.from_pylist(
+        [_bar(f"2024-01-0{day}", 50.0) for day in range(1, 5)], schema=BAR_SCHEMA
+    )
+    path = bar_path(tmp_path, "AAPL", "1d")
+    path.parent.mkdir(parents=True)
+    pq.write_table(legacy, path)
+    write_actions(tmp_path, "AAPL", [{"ex_date": "2024-01-03", "kind": "split", "ratio": 2}])
+
+    with pytest.raises(ValueError, match="predate the raw store format"):
+        write_bars(tmp_path, "AAPL", "1d", [_bar("2024-01-05", 52.0)])
+    for cache in (None, BarCache(tmp_path / "cache")):
+        with pytest.raises(ValueError, match="re-download them or run"):
+            read_bars_table(tmp_path, "AAPL", "1d", cache=cache)
+    with pytest.raises(ValueError, match="predate the raw store format"):
+        read_bars(tmp_path, "AAPL", "1d")
+    assert read_bars_table(tmp_path, "AAPL", "1d", adjust="none").num_rows == 4
+    query = ["data", "query", "--data-path", str(tmp_path), "--output", str(tmp_path / "q")]
+    with pytest.raises(ValueError, match="predate the raw store format"):
+        main(query)
+    with pytest.raises(ValueError, match="Unsupported price basis"):
+        migrate_bars(tmp_path, "AAPL", "1d", "all")
+
+    args = ["data", "migrate", "--data-path", str(tmp_path), "--basis", "splits"]
+    assert main(args) == 0
+    assert main(args) == 0
+    raw = read_bars_table(tmp_path, "AAPL", "1d", columns=["close", "volume"], adjust="none")
+    assert raw["close"].to_pylist() == [100.0, 100.0, 50.0, 50.0]
+    assert raw["volume"].to_pylist() == [500.0, 500.0, 1000.0, 1000.0]
+    write_bars(tmp_path, "AAPL", "1d", [_bar("2024-01-05", 52.0)])
+    adjusted = read_bars_table(tmp_path, "AAPL", "1d", columns=["close"])
+    assert adjusted["close"].to_pylist() == [50.0, 50.0, 50.0, 50.0, 52.0]
+
+
+def test_data_add_action_cli_records_actions(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    args = ["data", "add-action", "--symbol", "msft", "--data-path", str(tmp_path)]
+    assert main([*args, "--ex-date", "2024-02-01", "--split", "3"]) == 0
+    assert main([*args, "--ex-date", "2024-03-01", "--dividend", "0.75"]) == 0
+    actions = read_actions(tmp_path, "MSFT")
+    assert actions["ex_date"].to_pylist() == [
+        datetime(2024, 2, 1, tzinfo=UTC),
+        datetime(2024, 3, 1, tzinfo=UTC),
+    ]
+    assert actions["kind"].to_pylist() == ["split", "dividend"]
+    assert actions["ratio"].to_pylist() == [3.0, 1.0]
+    assert actions["cash"].to_pylist() == [0.0, 0.75]
+    with pytest.raises(ValueError, match="Split ratio must be positive"):
+        main([*args, "--ex-date", "2024-04-01", "--split", "0"])
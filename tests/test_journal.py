@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from longarc.cli import main
+from longarc.core.config import AppConfig
+from longarc.data.providers.local_parquet import download_symbol
+from longarc.engine.backtest import run_backtest_cached
+from longarc.storage.journal import FsyncPolicy, JournalWriter, read_journal, segment_paths
+from longarc.storage.runs import RunStore
+
+T0 = datetime(2024, 1, 2, 14, 30, tzinfo=UTC)
+
+
+def _config(data_path: str) -> AppConfig:
+    return AppConfig.model_validate(
+        {
+            "universe": {"symbols": ["AAPL", "MSFT"], "timeframe": "1d"},
+            "data": {"path": data_path},
+            "strategy": {"name": "sma_cross", "params": {"fast_window": 2, "slow_window": 5}},
+        }
+    )
+
+
+def test_fsync_policy_parsing() -> None:
+    assert FsyncPolicy.parse("cycle") == FsyncPolicy(mode="cycle")
+    assert FsyncPolicy.parse("events:100") == FsyncPolicy(mode="events", every=100)
+    with pytest.raises(ValueError, match="Invalid fsync policy"):
+        FsyncPolicy.parse("sometimes")
+
+
+def test_journal_round_trip_with_filters(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    with JournalWriter(tmp_path, "run-1") as journal:
+        for minute in range(10):
+            journal.append("decision", T0 + timedelta(minutes=minute), symbol="AAPL", value=0.5)
+            journal.append(
+                "fill",
+                T0 + timedelta(minutes=minute),
+                symbol="AAPL",
+                side="buy",
+                qty=1.0,
+                price=100.0 + minute,
+            )
+            journal.end_cycle()
+
+    assert read_journal(tmp_path).num_rows == 20
+    fills = read_journal(
+        tmp_path,
+        event_types=["fill"],
+        start=T0 + timedelta(minutes=2),
+        end=T0 + timedelta(minutes=5),
+        columns=["ts", "price"],
+    )
+    assert fills.column_names == ["ts", "price"]
+    assert fills["price"].to_pylist() == [102.0, 103.0, 104.0]
+    assert read_journal(tmp_path / "missing", event_types=["fill"]).num_rows == 0
+
+
+def test_journal_buffers_until_policy_flush(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    journal = JournalWriter(tmp_path, "run-1", fsync="events:3")
+    journal.append("order", T0, symbol="AAPL")
+    journal.append("order", T0, symbol="MSFT")
+    assert read_journal(tmp_path).num_rows == 0
+    journal.append("order", T0, symbol="NVDA")
+    assert read_journal(tmp_path).num_rows == 3
+
+    journal.append_columns(
+        "fill",
+        {
+            "ts": np.full(4, np.datetime64("2024-01-02T14:30", "us")),
+            "symbol": np.array(["A", "B", "C", "D"], dtype=object),
+            "qty": np.ones(4),
+        },
+    )
+    journal.close()
+    assert read_journal(tmp_path, event_types=["fill"])["symbol"].to_pylist() == list("ABCD")
+
+
+def test_journal_rolls_segments_and_tolerates_torn_tail(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    now = [0.0]
+    journal = JournalWriter(tmp_path, "run-1", max_segment_bytes=1, clock=lambda: now[0])
+    for cycle in range(3):
+        journal.append("decision", T0 + timedelta(minutes=cycle), value=float(cycle))
+        journal.end_cycle()
+    journal.close()
+    assert len(segment_paths(tmp_path)) == 3
+
+    timed = tmp_path / "timed"
+    journal = JournalWriter(timed, "run-1", max_segment_seconds=60.0, clock=lambda: now[0])
+    journal.append("decision", T0)
+    journal.end_cycle()
+    now[0] = 30.0
+    journal.append("decision", T0)
+    journal.end_cycle()
+    now[0] = 90.0
+    journal.append("decision", T0)
+    journal.end_cycle()
+    assert len(segment_paths(timed)) == 2
+
+    last = segment_paths(timed)[-1]
+    last.write_bytes(last.read_bytes()[:-20])
+    assert read_journal(timed).num_rows == 2
+
+    with JournalWriter(timed, "run-2") as reopened:
+        reopened.append("decision", T0)
+    assert len(segment_paths(timed)) == 3
+    assert read_journal(timed)["run_id"].to_pylist()[-1] == "run-2"
+
+
+def test_backtest_and_paper_sim_runs_carry_journal(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    for symbol in ("AAPL", "MSFT"):
+        download_symbol(data_path, symbol, "1d", "2024-01-01", "2024-02-29")
+    runs = RunStore(tmp_path / "runs")
+
+    artifacts, _ = run_backtest_cached(_config(data_path), runs)
+    fills = read_journal(runs.journal_path(artifacts.run_id), event_types=["fill"])
+    assert fills.num_rows == artifacts.trades.num_rows > 0
+    np.testing.assert_allclose(fills["fee"].to_numpy(), artifacts.trades["fee"].to_numpy())
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "universe:\n  symbols: [AAPL, MSFT]\n  timeframe: 1d\n"
+        f"data:\n  path: {data_path}\n"
+        "strategy:\n  name: sma_cross\n  params:\n    fast_window: 2\n    slow_window: 5\n",
+        encoding="utf-8",
+    )
+    args = ["paper-sim", "run", "--config", str(config_path), "--runs-path", str(runs.base_path)]
+    assert main([*args, "--run-id", "ps-journal", "--journal-fsync", "events:10"]) == 0
+
+    paper_sim = runs.load("ps-journal")
+    journal = read_journal(runs.journal_path("ps-journal"))
+    event_counts = {
+        event: journal["event_type"].to_pylist().count(event)
+        for event in ("decision", "order", "fill")
+    }
+    assert event_counts["fill"] == paper_sim.trades.num_rows
+    assert event_counts["order"] == event_counts["fill"]
+    assert event_counts["decision"] > 0
+    np.testing.assert_allclose(
+        read_journal(runs.journal_path("ps-journal"), event_types=["fill"])["qty"].to_numpy(),
+        fills["qty"].to_numpy(),
+    )
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import io
+import json
+import logging
+import sys
+import threading
+from logging.handlers import QueueHandler
+
+from longarc.core.logging import (
+    DebugRateLimiter,
+    JsonFormatter,
+    configure_logging,
+    shutdown_logging,
+)
+
+
+def _record(message: str, level: int = logging.DEBUG, **extra: object) -> logging.LogRecord:
+    record = logging.LogRecord("longarc.test", level, __file__, 1, message, None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_escapes_messages_and_keeps_extras() -> None:
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        record = logging.LogRecord(
+            "longarc.test", logging.ERROR, __file__, 1, 'said "hi"\n%s', ("ok",), None
+        )
+        record.exc_info = sys.exc_info()
+    record.__dict__.update({"symbol": "AAPL", "duration_ms": 1.5, "path": object()})
+
+    payload = json.loads(JsonFormatter().format(record))
+    assert payload["message"] == 'said "hi"\nok'
+    assert payload["level"] == "ERROR" and payload["logger"] == "longarc.test"
+    assert payload["ts"].endswith("+00:00")
+    assert payload["symbol"] == "AAPL" and payload["duration_ms"] == 1.5
+    assert payload["path"].startswith("<object object")
+    assert "RuntimeError: boom" in payload["exc"]
+
+
+def test_configure_logging_formats_on_listener_thread() -> None:
+    stream = io.StringIO()
+    root = logging.getLogger()
+    previous_level = root.level
+    formatting_threads: list[str] = []
+
+    class RecordingFormatter(JsonFormatter):
+        def format(self, record: logging.LogRecord) -> str:
+            formatting_threads.append(threading.current_thread().name)
+            return super().format(record)
+
+    try:
+        listener = configure_logging("DEBUG", stream=stream)
+        listener.handlers[0].setFormatter(RecordingFormatter())
+        configured = [handler for handler in root.handlers if isinstance(handler, QueueHandler)]
+        assert len(configured) == 1
+        logger = logging.getLogger("longarc.test")
+        logger.info("run %s done", "bt-1", extra={"run_id": "bt-1", "rows": 3})
+        try:
+            raise ValueError("bad bar")
+        except ValueError:
+            logger.exception("failed")
+    finally:
+        shutdown_logging()
+        root.setLevel(previous_level)
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert lines[0]["message"] == "run bt-1 done"
+    assert lines[0]["run_id"] == "bt-1" and lines[0]["rows"] == 3
+    assert "ValueError: bad bar" in lines[1]["exc"]
+    assert formatting_threads and threading.main_thread().name not in formatting_threads
+    assert not any(isinstance(handler, QueueHandler) for handler in root.handlers)
+
+
+def test_debug_rate_limiter_throttles_per_template() -> None:
+    now = [0.0]
+    limiter = DebugRateLimiter(rate=1.0, burst=2, clock=lambda: now[0])
+
+    passed = [limiter.filter(_record("span %s")) for _ in range(5)]
+    assert passed == [True, True, False, False, False]
+    assert limiter.filter(_record("other template"))
+    assert limiter.filter(_record("span %s", level=logging.INFO))
+
+    now[0] = 1.0
+    record = _record("span %s")
+    assert limiter.filter(record)
+    assert record.__dict__["suppressed"] == 3
+    assert not limiter.filter(_record("span %s"))
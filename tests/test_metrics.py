@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from longarc.cli import main
+from longarc.core.config import AppConfig
+from longarc.core.metrics import REGISTRY, MetricsRegistry
+from longarc.data.providers.polygon import PolygonProvider
+from longarc.engine.backtest import run_backtest_cached
+from longarc.engine.trading_engine import run_paper_sim
+from longarc.storage.runs import RunStore
+
+
+def test_registry_renders_prometheus_text(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    registry = MetricsRegistry()
+    rows = registry.counter("rows_total", "Rows seen.", provider='po"ly')
+    rows.inc(3)
+    assert registry.counter("rows_total", "Rows seen.", provider='po"ly') is rows
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 7.0):
+        latency.observe(value)
+
+    text = registry.render()
+    assert "# TYPE rows_total counter" in text
+    assert 'rows_total{provider="po\\"ly"} 3.0' in text
+    assert 'latency_seconds_bucket{le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{le="1.0"} 3' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+    assert "latency_seconds_count 4" in text
+    assert latency.count == 4 and latency.sum == pytest.approx(7.65)
+    with pytest.raises(ValueError, match="already registered as a counter"):
+        registry.histogram("rows_total", "Rows seen.")
+
+    path = registry.write_textfile(tmp_path / "metrics" / "longarc.prom")
+    assert path.read_text(encoding="utf-8") == text
+    assert [item.name for item in path.parent.iterdir()] == ["longarc.prom"]
+
+
+def test_http_endpoint_serves_metrics() -> None:
+    registry = MetricsRegistry()
+    registry.counter("served_total", "Served.").inc()
+    server = registry.serve(port=0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        with urlopen(f"{url}/metrics", timeout=5) as response:  # noqa: S310
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert "served_total 1.0" in response.read().decode("utf-8")
+        with pytest.raises(HTTPError):
+            urlopen(f"{url}/other", timeout=5)  # noqa: S310
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_hot_path_updates_stay_under_a_microsecond() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("hot_total", "Hot.")
+    histogram = registry.histogram("hot_seconds", "Hot.")
+    ops = 20_000
+    best_inc = best_observe = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(ops):
+            counter.inc()
+        best_inc = min(best_inc, (time.perf_counter() - started) / ops)
+        started = time.perf_counter()
+        for _ in range(ops):
+            histogram.observe(0.002)
+        best_observe = min(best_observe, (time.perf_counter() - started) / ops)
+    assert counter.value == 5 * ops and histogram.count == 5 * ops
+    assert best_inc < 1e-6
+    assert best_observe < 1e-6
+
+
+def test_polygon_retries_transient_errors_and_counts_them() -> None:
+    retries = REGISTRY.counter(
+        "longarc_provider_retries_total", "Provider requests retried.", provider="polygon"
+    )
+    latency = REGISTRY.histogram(
+        "longarc_provider_request_seconds", "Provider HTTP request latency.", provider="polygon"
+    )
+    before_retries, before_requests = retries.value, latency.count
+    failures = [HTTPError("url", 429, "Too Many Requests", {}, None)]  # type: ignore[arg-type]
+    sleeps: list[float] = []
+
+    def flaky_fetch(_: str) -> dict[str, object]:
+        if failures:
+            raise failures.pop()
+        return {"status": "OK", "results": []}
+
+    provider = PolygonProvider(
+        api_key="demo", fetch_json=flaky_fetch, retry_backoff=0.5, sleep=sleeps.append
+    )
+    assert provider._request("url") == {"status": "OK", "results": []}
+    assert sleeps == [0.5]
+    assert retries.value == before_retries + 1
+    assert latency.count == before_requests + 2
+
+    def rejected(_: str) -> dict[str, object]:
+        raise HTTPError("url", 403, "Forbidden", {}, None)  # type: ignore[arg-type]
+
+    with pytest.raises(HTTPError):
+        PolygonProvider(api_key="demo", fetch_json=rejected, sleep=sleeps.append)._request("url")
+    assert sleeps == [0.5]
+
+
+def test_pipeline_updates_default_registry(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    metrics_path = tmp_path / "longarc.prom"
+    assert (
+        main(
+            [
+                "--metrics-file",
+                str(metrics_path),
+                "data",
+                "download",
+                "--symbols",
+                "AAPL",
+                "MSFT",
+                "--timeframe",
+                "1d",
+                "--start",
+                "2024-01-01",
+                "--end",
+                "2024-03-31",
+                "--data-path",
+                data_path,
+            ]
+        )
+        == 0
+    )
+    text = metrics_path.read_text(encoding="utf-8")
+    assert 'longarc_provider_rows_ingested_total{provider="local_parquet"}' in text
+    assert 'longarc_store_write_seconds_count{timeframe="1d"}' in text
+
+    config = AppConfig.model_validate(
+        {
+            "universe": {"symbols": ["AAPL", "MSFT"], "timeframe": "1d"},
+            "data": {"path": data_path},
+            "strategy": {"name": "sma_cross", "params": {"fast_window": 2, "slow_window": 5}},
+        }
+    )
+    cycles = REGISTRY.counter("longarc_engine_cycles_total", "Trading cycles completed.")
+    before_cycles = cycles.value
+    result = asyncio.run(run_paper_sim(config))
+    assert cycles.value == before_cycles + len(result.cycles)
+
+    lookups = {
+        outcome: REGISTRY.counter(
+            "longarc_backtest_cache_lookups_total", "Backtest run-cache lookups.", result=outcome
+        )
+        for outcome in ("hit", "miss")
+    }
+    before = {outcome: counter.value for outcome, counter in lookups.items()}
+    runs = RunStore(tmp_path / "runs")
+    run_backtest_cached(config, runs)
+    run_backtest_cached(config, runs)
+    assert {outcome: lookups[outcome].value - before[outcome] for outcome in lookups} == {
+        "hit": 1.0,
+        "miss": 1.0,
+    }
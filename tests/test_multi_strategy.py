@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import numpy as np
+import pytest
+
+import longarc.engine.trading_engine as trading_engine
+from longarc.cli import main
+from longarc.core.config import AppConfig
+from longarc.core.metrics import REGISTRY
+from longarc.data.providers.local_parquet import download_symbol
+from longarc.engine.trading_engine import ReplayFeed, TradingEngine, run_paper, run_paper_sim
+from longarc.storage.journal import read_journal
+from longarc.storage.snapshots import SnapshotStore
+
+SYMBOLS = ["AAPL", "MSFT", "NVDA"]
+STRATEGIES: list[dict[str, Any]] = [
+    {"id": "fast", "name": "sma_cross", "params": {"fast_window": 2, "slow_window": 5}},
+    {
+        "id": "slow",
+        "name": "sma_cross",
+        "params": {"fast_window": 3, "slow_window": 10},
+        "risk": {"max_position_notional": 8000.0},
+    },
+    {
+        "id": "fast-small",
+        "name": "sma_cross",
+        "params": {"fast_window": 2, "slow_window": 5},
+        "portfolio": {"initial_cash": 20000.0},
+    },
+]
+
+
+def _config(data_path: str, strategies: list[dict[str, Any]] = STRATEGIES) -> AppConfig:
+    return AppConfig.model_validate(
+        {
+            "universe": {"symbols": SYMBOLS, "timeframe": "1d"},
+            "data": {"path": data_path},
+            "strategies": strategies,
+        }
+    )
+
+
+def _seed(data_path: str, start: str = "2024-01-01", end: str = "2024-02-29") -> None:
+    for symbol in SYMBOLS:
+        download_symbol(data_path, symbol, "1d", start, end)
+
+
+def _lookups(result: str) -> float:
+    return REGISTRY.counter(
+        "longarc_indicator_cache_lookups_total", "Shared indicator lookups.", result=result
+    ).value
+
+
+def test_strategies_share_fetches_and_indicators_but_not_books(tmp_path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    _seed(data_path)
+    config = _config(data_path)
+    reads: list[str] = []
+    original = trading_engine.read_bars_table
+
+    def counting_read(*args, **kwargs):  # type: ignore[no-untyped-def]
+        reads.append(args[1])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(trading_engine, "read_bars_table", counting_read)
+    misses, hits = _lookups("miss"), _lookups("hit")
+    hosted = asyncio.run(run_paper_sim(config, strategy_workers=2))
+    monkeypatch.undo()
+
+    cycles = len(hosted.cycles)
+    assert sorted(reads) == SYMBOLS
+    # sma(2), sma(3), sma(5) and sma(10) once per cycle; every strategy lookup then hits.
+    assert _lookups("miss") - misses == 4 * cycles
+    assert _lookups("hit") - hits == 6 * cycles
+    assert list(hosted.summaries) == ["fast", "slow", "fast-small"]
+    with pytest.raises(ValueError, match="hosts 3 strategies"):
+        hosted.summary
+
+    for strategy_id, alone in config.strategy_configs().items():
+        single = asyncio.run(run_paper_sim(alone)).summary
+        summary = hosted.summaries[strategy_id]
+        np.testing.assert_array_equal(
+            summary.equity["equity"].to_numpy(), single.equity["equity"].to_numpy()
+        )
+        assert summary.trades.equals(single.trades)
+    capped = hosted.summaries["slow"].positions
+    values = np.asarray(capped["qty"]) * np.asarray(capped["mark"])
+    assert 0 < values.max() <= 8000.0 + 1e-6
+    assert hosted.summaries["fast-small"].metrics != hosted.summaries["fast"].metrics
+
+    with pytest.raises(ValueError, match="Duplicate strategy ids"):
+        _config(data_path, [STRATEGIES[0], STRATEGIES[0]])
+
+
+def test_paper_run_snapshots_every_book_and_restores_legacy_layout(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    _seed(data_path, end="2024-01-31")
+    config = _config(data_path)
+    snapshots = SnapshotStore(tmp_path / "state")
+    asyncio.run(run_paper(config, snapshots))
+    _seed(data_path, start="2024-02-01", end="2024-02-10")
+    warm = asyncio.run(run_paper(config, snapshots))
+    assert len(warm.cycles) == 10 and len(warm.summaries) == 3
+
+    async def full_replay(app: AppConfig) -> TradingEngine:
+        feed = await ReplayFeed.load(data_path, SYMBOLS, "1d")
+        engine = TradingEngine(app, feed, warmup=30)
+        await engine.run()
+        return engine
+
+    reference = asyncio.run(full_replay(config)).snapshot_payload()
+    latest = snapshots.load_latest()
+    assert latest is not None
+    for strategy_id in ("fast", "slow", "fast-small"):
+        portfolio = latest.payload["strategies"][strategy_id]["portfolio"]
+        expected = reference["strategies"][strategy_id]["portfolio"]
+        np.testing.assert_allclose(portfolio["positions"], expected["positions"])
+
+    single = _config(data_path, [STRATEGIES[0]])
+    payload = asyncio.run(full_replay(single)).snapshot_payload()
+    legacy = {
+        "symbols": payload["symbols"],
+        "strategy": {**payload["indicators"], **payload["strategies"]["fast"]},
+        "portfolio": payload["strategies"]["fast"]["portfolio"],
+        "last_bar": payload["last_bar"],
+    }
+    del legacy["strategy"]["portfolio"]
+    feed = ReplayFeed(SYMBOLS, [])
+    restored = TradingEngine(single, feed)
+    restored.restore(legacy)
+    assert restored.snapshot_payload()["strategies"] == payload["strategies"]
+    with pytest.raises(ValueError, match="strategies do not match"):
+        TradingEngine(config, feed).restore(payload)
+
+
+def test_paper_sim_cli_writes_one_run_per_strategy(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    _seed(data_path)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        f"universe:\n  symbols: [AAPL, MSFT]\n  timeframe: 1d\ndata:\n  path: {data_path}\n"
+        "strategies:\n"
+        "  - id: a\n    name: sma_cross\n    params: {fast_window: 2, slow_window: 5}\n"
+        "  - id: b\n    name: sma_cross\n    params: {fast_window: 3, slow_window: 8}\n",
+        encoding="utf-8",
+    )
+    runs_path = tmp_path / "runs"
+    args = ["paper-sim", "run", "--config", str(config_path), "--runs-path", str(runs_path)]
+
+    assert main([*args, "--steps", "20", "--run-id", "ps", "--strategy-workers", "2"]) == 0
+    for run_id in ("ps-a", "ps-b"):
+        assert (runs_path / run_id / "cycles.parquet").exists()
+        assert main(["report", "--run-id", run_id, "--runs-path", str(runs_path)]) == 0
+    decisions = read_journal(runs_path / "ps-b" / "journal", event_types=["decision"])
+    assert set(decisions["run_id"].to_pylist()) == {"ps-b"}
+
+    paper = ["paper", "run", "--config", str(config_path), "--state-path", str(tmp_path / "s")]
+    assert main(paper) == 0
+    assert (tmp_path / "s" / "journal" / "a").is_dir()
+    assert (tmp_path / "s" / "journal" / "b").is_dir()
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import numpy as np
+
+import longarc.engine.trading_engine as trading_engine
+from longarc.cli import main
+from longarc.core.config import AppConfig
+from longarc.data.providers.local_parquet import download_symbol
+from longarc.engine.trading_engine import ReplayFeed, TradingEngine, run_paper
+from longarc.storage.snapshots import SnapshotStore
+
+SYMBOLS = ("AAPL", "MSFT")
+
+
+def _config(data_path: str, **runtime: object) -> AppConfig:
+    return AppConfig.model_validate(
+        {
+            "universe": {"symbols": list(SYMBOLS), "timeframe": "1d"},
+            "data": {"path": data_path},
+            "strategy": {"name": "sma_cross", "params": {"fast_window": 2, "slow_window": 5}},
+            "runtime": runtime,
+        }
+    )
+
+
+def _download(data_path: str, start: str, end: str) -> None:
+    for symbol in SYMBOLS:
+        download_symbol(data_path, symbol, "1d", start, end)
+
+
+def test_warm_start_reads_only_new_bars_and_matches_full_replay(tmp_path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    config = _config(data_path)
+    snapshots = SnapshotStore(tmp_path / "state")
+    _download(data_path, "2024-01-01", "2024-01-31")
+
+    cold = asyncio.run(run_paper(config, snapshots))
+    assert len(cold.cycles) == 1
+    assert snapshots.load_latest() is not None
+
+    _download(data_path, "2024-02-01", "2024-02-10")
+    rows_read: list[int] = []
+    original = trading_engine.read_bars_table
+
+    def counting_read(*args, **kwargs):  # type: ignore[no-untyped-def]
+        table = original(*args, **kwargs)
+        rows_read.append(table.num_rows)
+        return table
+
+    monkeypatch.setattr(trading_engine, "read_bars_table", counting_read)
+    warm = asyncio.run(run_paper(config, snapshots))
+    monkeypatch.undo()
+
+    assert len(warm.cycles) == 10
+    assert rows_read == [10, 10]
+
+    async def full_replay() -> TradingEngine:
+        feed = await ReplayFeed.load(data_path, list(SYMBOLS), "1d")
+        engine = TradingEngine(config, feed, warmup=30)
+        await engine.run()
+        return engine
+
+    reference = asyncio.run(full_replay()).snapshot_payload()
+    latest = snapshots.load_latest()
+    assert latest is not None
+    assert latest.payload["last_bar"] == reference["last_bar"]
+    portfolio = latest.payload["strategies"]["sma_cross"]["portfolio"]
+    expected = reference["strategies"]["sma_cross"]["portfolio"]
+    np.testing.assert_allclose(portfolio["positions"], expected["positions"])
+    assert np.isclose(portfolio["cash"], expected["cash"])
+
+
+def test_cold_start_warms_up_on_scheduled_cycles_only(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    # Midnight-UTC daily bars fall on the previous New York day, so the weekday schedule
+    # keeps 22 of the 31 bars. Warming up on all 30 older timestamps would leave none.
+    config = _config(data_path, schedule="0 9 * * 1-5")
+    snapshots = SnapshotStore(tmp_path / "state")
+    _download(data_path, "2024-01-01", "2024-01-31")
+
+    cold = asyncio.run(run_paper(config, snapshots))
+    assert len(cold.cycles) == 1
+    assert cold.cycles[0].timestamp.date().isoformat() == "2024-01-31"
+    latest = snapshots.load_latest()
+    assert latest is not None
+    assert latest.payload["indicators"]["bars_seen"] == 22
+
+
+def test_snapshot_store_skips_corrupt_and_unknown_versions(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    store = SnapshotStore(tmp_path, retain=3)
+    store.save({"value": 1})
+    store.save({"value": 2})
+    newest = store.save({"value": 3})
+    store.save({"value": 4})
+
+    paths = sorted(Path(tmp_path).glob("snapshot-*.json"))
+    assert len(paths) == 3
+
+    document = json.loads(paths[-1].read_text(encoding="utf-8"))
+    document["payload"]["value"] = 99
+    paths[-1].write_text(json.dumps(document), encoding="utf-8")
+    loaded = store.load_latest()
+    assert loaded is not None and loaded.payload == newest.payload
+
+    document = json.loads(paths[-2].read_text(encoding="utf-8"))
+    document["version"] = 999
+    paths[-2].write_text(json.dumps(document), encoding="utf-8")
+    loaded = store.load_latest()
+    assert loaded is not None and loaded.payload == {"value": 2}
+
+
+def test_paper_run_cli_cold_then_warm(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    _download(data_path, "2024-01-01", "2024-01-20")
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "universe:\n  symbols: [AAPL, MSFT]\n  timeframe: 1d\n"
+        f"data:\n  path: {data_path}\n"
+        "strategy:\n  name: sma_cross\n  params:\n    fast_window: 2\n    slow_window: 5\n",
+        encoding="utf-8",
+    )
+    args = ["paper", "run", "--config", str(config_path), "--state-path", str(tmp_path / "s")]
+
+    assert main(args) == 0
+    assert main(args) == 0
+    assert len(list((tmp_path / "s").glob("snapshot-*.json"))) == 1
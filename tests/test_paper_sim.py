@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from datetime import UTC, datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from longarc.cli import main
+from longarc.core.config import AppConfig
+from longarc.core.schedule import CronSchedule
+from longarc.data.providers.local_parquet import download_symbol
+from longarc.engine.backtest import run_backtest
+from longarc.engine.trading_engine import ReplayFeed, TradingEngine, parse_speed, run_paper_sim
+
+
+def _config(data_path: str, **runtime: object) -> AppConfig:
+    return AppConfig.model_validate(
+        {
+            "universe": {"symbols": ["AAPL", "MSFT", "NVDA"], "timeframe": "1d"},
+            "data": {"path": data_path},
+            "strategy": {"name": "sma_cross", "params": {"fast_window": 2, "slow_window": 5}},
+            "runtime": runtime,
+        }
+    )
+
+
+def _seed(data_path: str) -> None:
+    for symbol in ("AAPL", "MSFT", "NVDA"):
+        download_symbol(data_path, symbol, "1d", "2024-01-01", "2024-02-29")
+
+
+def test_parse_speed() -> None:
+    assert parse_speed("realtime") == 1.0
+    assert parse_speed("max") == math.inf
+    assert parse_speed("60x") == 60.0
+    with pytest.raises(ValueError, match="Invalid speed"):
+        parse_speed("fast")
+
+
+def test_paper_sim_replay_matches_backtest(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    _seed(data_path)
+    config = _config(data_path)
+
+    replay = asyncio.run(run_paper_sim(config, concurrency=2))
+    backtest = run_backtest(config)
+
+    np.testing.assert_allclose(
+        replay.summary.equity["equity"].to_numpy(), backtest.equity["equity"].to_numpy()
+    )
+    assert replay.summary.trades.num_rows == backtest.trades.num_rows
+    assert len(replay.cycles) == backtest.equity.num_rows
+    assert replay.latency["cycles"] == len(replay.cycles)
+    assert replay.latency["max_fraction_of_interval"] < 1.0
+
+
+def test_replay_feed_advances_all_cursors_in_one_search() -> None:
+    day = np.timedelta64(1, "D")
+    start = np.datetime64("2024-01-01", "us")
+    feed = ReplayFeed(
+        ["aapl", "msft"],
+        [
+            (start + np.array([0, 1, 2, 4]) * day, np.array([1.0, 2.0, 3.0, 5.0])),
+            (start + np.array([1, 3]) * day, np.array([20.0, 40.0])),
+        ],
+    )
+    both = np.arange(2)
+    np.testing.assert_array_equal(feed.fetch(both, start), [1.0, np.nan])
+    np.testing.assert_array_equal(feed.fetch(both, start + 2 * day), [3.0, 20.0])
+    assert np.isnan(feed.fetch(both, start + 2 * day)).all()
+    np.testing.assert_array_equal(feed.fetch(np.array([1]), start + 9 * day), [40.0])
+    np.testing.assert_array_equal(feed.fetch(both, start + 9 * day), [5.0, np.nan])
+    assert feed.last_seen() == {
+        "AAPL": datetime(2024, 1, 5, tzinfo=UTC),
+        "MSFT": datetime(2024, 1, 4, tzinfo=UTC),
+    }
+
+
+class _SlowFeed(ReplayFeed):
+    """A feed whose fetch blocks like a network round trip."""
+
+    blocking = True
+    calls = 0
+
+    def fetch(self, indices, timestamp):  # type: ignore[no-untyped-def]
+        self.calls += 1
+        time.sleep(0.05)
+        return super().fetch(indices, timestamp)
+
+
+def test_blocking_feed_chunks_are_fetched_concurrently(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    symbols = ["AAPL", "MSFT", "NVDA", "AMZN"]
+    stamps = np.array(["2024-01-02", "2024-01-03"], dtype="datetime64[us]")
+    feed = _SlowFeed(symbols, [(stamps, np.array([10.0, 11.0]))] * len(symbols))
+    engine = TradingEngine(_config(str(tmp_path)), feed, concurrency=4)
+
+    started = time.perf_counter()
+    result = asyncio.run(engine.run())
+    elapsed = time.perf_counter() - started
+    # Two cycles of four 50 ms chunk fetches: 400 ms if the chunks ran one after another.
+    assert len(result.cycles) == 2 and feed.calls == 8
+    assert elapsed < 0.3
+    assert all(report.symbols_with_bars == 4 for report in result.cycles)
+
+
+def test_paper_sim_paces_by_speed_and_honours_dry_run(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    _seed(data_path)
+    config = _config(data_path, dry_run=True)
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    async def scenario() -> None:
+        feed = await ReplayFeed.load(data_path, config.universe.symbols, "1d")
+        engine = TradingEngine(
+            config, feed, speed=86_400.0, steps=10, clock=lambda: 0.0, sleep=fake_sleep
+        )
+        result = await engine.run()
+        assert len(result.cycles) == 10
+        assert result.summary.trades.num_rows == 0
+        assert any(report.orders for report in result.cycles)
+
+    asyncio.run(scenario())
+    assert sleeps == pytest.approx([float(day) for day in range(1, 10)])
+
+
+def test_schedule_filters_replay_cycles(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    _seed(data_path)
+    config = _config(data_path, schedule="0 9 * * 1-5")
+
+    result = asyncio.run(run_paper_sim(config))
+    unscheduled = asyncio.run(run_paper_sim(_config(data_path)))
+
+    zone = ZoneInfo(config.timezone)
+    weekdays = {report.timestamp.astimezone(zone).weekday() for report in result.cycles}
+    assert weekdays == {0, 1, 2, 3, 4}
+    assert len(result.cycles) < len(unscheduled.cycles)
+
+
+def test_cron_schedule_matching() -> None:
+    schedule = CronSchedule("*/15 9-16 * * 1-5")
+    assert schedule.matches(datetime(2024, 1, 2, 9, 45))
+    assert not schedule.matches(datetime(2024, 1, 2, 9, 50))
+    assert not schedule.matches(datetime(2024, 1, 6, 10, 0))
+    assert CronSchedule("0 0 * * 7").matches_date(datetime(2024, 1, 7))
+    with pytest.raises(ValueError, match="5 fields"):
+        CronSchedule("0 9 * *")
+
+
+def test_paper_sim_cli_writes_run(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    _seed(data_path)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "universe:\n  symbols: [AAPL, MSFT]\n  timeframe: 1d\n"
+        f"data:\n  path: {data_path}\n"
+        "strategy:\n  name: sma_cross\n  params:\n    fast_window: 2\n    slow_window: 5\n",
+        encoding="utf-8",
+    )
+    runs_path = tmp_path / "runs"
+    args = ["paper-sim", "run", "--config", str(config_path), "--runs-path", str(runs_path)]
+
+    assert main([*args, "--steps", "20", "--run-id", "ps-test"]) == 0
+    assert (runs_path / "ps-test" / "cycles.parquet").exists()
+    assert main(["report", "--run-id", "ps-test", "--runs-path", str(runs_path)]) == 0
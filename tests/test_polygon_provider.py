@@ -1,12 +1,33 @@
 from __future__ import annotations
 
-from longarc.data.providers.polygon import PolygonProvider
+import pytest
+
+from longarc.data.providers.polygon import PolygonProvider, _actions_from_payloads
 from longarc.data.providers.registry import get_provider
-from longarc.data.store import read_bars
+from longarc.data.store import read_actions, read_bars
 
 
 def test_polygon_provider_downloads_and_persists(tmp_path) -> None:  # type: ignore[no-untyped-def]
-    def fake_fetch(_: str) -> dict[str, object]:
+    urls: list[str] = []
+
+    def fake_fetch(url: str) -> dict[str, object]:
+        urls.append(url)
+        if "/v3/reference/splits" in url and "cursor" not in url:
+            return {
+                "status": "OK",
+                "results": [],
+                "next_url": "https://api.polygon.io/v3/reference/splits?cursor=abc",
+            }
+        if "/v3/reference/splits" in url:
+            return {
+                "status": "OK",
+                "results": [{"execution_date": "2024-01-02", "split_from": 1, "split_to": 2}],
+            }
+        if "/v3/reference/dividends" in url:
+            return {
+                "status": "OK",
+                "results": [{"ex_dividend_date": "2024-01-02", "cash_amount": 0.5}],
+            }
         return {
             "status": "OK",
             "results": [
@@ -46,6 +67,33 @@ def test_polygon_provider_downloads_and_persists(tmp_path) -> None:  # type: ign
         "2024-01-02T00:00:00+00:00",
     ]
     assert stored[-1]["close"] == 101.8
+    assert "adjusted=false" in urls[0]
+    assert urls[2] == "https://api.polygon.io/v3/reference/splits?cursor=abc&apiKey=demo-key"
+    assert [row["close"] for row in stored] == [50.25, 101.8]
+    assert stored[0]["volume"] == 24690.0
+    raw = read_bars(base_path=tmp_path, symbol="AAPL", timeframe="1d", adjust="none")
+    assert raw[0]["close"] == 100.5
+    total = read_bars(base_path=tmp_path, symbol="AAPL", timeframe="1d", adjust="all")
+    assert total[0]["close"] == 50.25 * (1 - 0.5 / 100.5)
+    assert read_actions(tmp_path, "AAPL")["kind"].to_pylist() == ["dividend", "split"]
+
+
+def test_corporate_actions_without_dates_are_rejected() -> None:
+    split = {"split_from": 1, "split_to": 4}
+    with pytest.raises(ValueError, match="execution_date must be a YYYY-MM-DD date, got None"):
+        _actions_from_payloads([split], [])
+    with pytest.raises(ValueError, match="execution_date must be a YYYY-MM-DD date"):
+        _actions_from_payloads([{**split, "execution_date": "soon"}], [])
+    with pytest.raises(ValueError, match="ex_dividend_date must be a YYYY-MM-DD date"):
+        _actions_from_payloads([], [{"cash_amount": 0.5}])
+    actions = _actions_from_payloads(
+        [{**split, "execution_date": "2024-06-10"}],
+        [{"cash_amount": 0.0}, {"ex_dividend_date": "2024-05-10", "cash_amount": 0.25}],
+    )
+    assert [(row["ex_date"], row["kind"]) for row in actions] == [
+        ("2024-06-10", "split"),
+        ("2024-05-10", "dividend"),
+    ]
 
 
 def test_registry_requires_api_key_for_polygon() -> None:
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from longarc.core.config import CostModelConfig, PortfolioConfig, RiskConfig
+from longarc.engine.portfolio import PortfolioSimulator
+
+
+def _reference_run(
+    prices: np.ndarray,
+    weights: np.ndarray,
+    days: np.ndarray,
+    portfolio: PortfolioConfig,
+    risk: RiskConfig,
+    cost: CostModelConfig,
+) -> dict[str, list[float]]:
+    n_steps, n_symbols = prices.shape
+    cash = portfolio.initial_cash
+    positions = [0.0] * n_symbols
+    last = [math.nan] * n_symbols
+    day = None
+    day_start = cash
+    halted = False
+    out: dict[str, list[float]] = {"equity": [], "cash": [], "fees": []}
+
+    for t in range(n_steps):
+        tradable = []
+        for i in range(n_symbols):
+            price = float(prices[t, i])
+            ok = math.isfinite(price) and price > 0
+            tradable.append(ok)
+            if ok:
+                last[i] = price
+        marks = [0.0 if math.isnan(p) else p for p in last]
+        equity = cash + sum(q * p for q, p in zip(positions, marks))
+        if day != days[t]:
+            day = days[t]
+            day_start = equity
+        if risk.kill_switch and not halted and day_start - equity >= risk.max_daily_loss:
+            halted = True
+
+        step_fees = 0.0
+        for i in range(n_symbols):
+            if not tradable[i]:
+                continue
+            current = positions[i] * marks[i]
+            weight = float(weights[t, i])
+            if halted:
+                target = 0.0
+            elif math.isnan(weight):
+                target = current
+            else:
+                target = weight * equity
+            target = max(-risk.max_position_notional, min(risk.max_position_notional, target))
+            order = target - current
+            order = max(-risk.max_order_notional, min(risk.max_order_notional, order))
+            qty = order / marks[i]
+            if qty == 0:
+                continue
+            side = 1.0 if qty > 0 else -1.0
+            fill = marks[i] * (1.0 + side * cost.slippage_bps / 10_000.0)
+            fee = abs(qty * fill) * cost.fee_bps / 10_000.0
+            positions[i] += qty
+            cash -= qty * fill + fee
+            step_fees += fee
+
+        out["equity"].append(cash + sum(q * p for q, p in zip(positions, marks)))
+        out["cash"].append(cash)
+        out["fees"].append(step_fees)
+    return out
+
+
+def _random_inputs(seed: int, n_steps: int, n_symbols: int) -> tuple[np.ndarray, ...]:
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0, 0.02, size=(n_steps, n_symbols))
+    prices = 50.0 * np.exp(np.cumsum(returns, axis=0))
+    prices[rng.random(prices.shape) < 0.05] = np.nan
+    prices[:3, 0] = np.nan
+    weights = rng.uniform(-0.2, 0.3, size=(n_steps, n_symbols))
+    weights[rng.random(weights.shape) < 0.1] = np.nan
+    days = np.arange(n_steps, dtype=np.int64) // 4
+    return prices, weights, days
+
+
+def test_vectorized_simulation_matches_reference_loop() -> None:
+    portfolio = PortfolioConfig(initial_cash=100_000.0)
+    risk = RiskConfig(
+        max_position_notional=15_000.0,
+        max_order_notional=4_000.0,
+        max_daily_loss=1e12,
+        kill_switch=True,
+    )
+    cost = CostModelConfig(fee_bps=1.5, slippage_bps=3.0)
+    prices, weights, days = _random_inputs(seed=7, n_steps=60, n_symbols=12)
+
+    result = PortfolioSimulator(portfolio, risk, cost).run(prices, weights, days)
+    expected = _reference_run(prices, weights, days, portfolio, risk, cost)
+
+    np.testing.assert_allclose(result.equity, expected["equity"], rtol=1e-10)
+    np.testing.assert_allclose(result.cash, expected["cash"], rtol=1e-10)
+    np.testing.assert_allclose(result.fees.sum(axis=1), expected["fees"], rtol=1e-9, atol=1e-12)
+    assert result.base_currency == "USD"
+    assert np.isclose(result.pnl.sum(), result.equity[-1] - portfolio.initial_cash)
+
+
+def test_kill_switch_matches_reference_and_flattens_book() -> None:
+    portfolio = PortfolioConfig(initial_cash=100_000.0)
+    risk = RiskConfig(
+        max_position_notional=50_000.0,
+        max_order_notional=50_000.0,
+        max_daily_loss=500.0,
+        kill_switch=True,
+    )
+    cost = CostModelConfig(fee_bps=0.0, slippage_bps=0.0)
+    prices = np.array([[100.0, 50.0], [95.0, 48.0], [90.0, 45.0], [95.0, 50.0]])
+    weights = np.full_like(prices, 0.4)
+    days = np.zeros(4, dtype=np.int64)
+
+    result = PortfolioSimulator(portfolio, risk, cost).run(prices, weights, days)
+    expected = _reference_run(prices, weights, days, portfolio, risk, cost)
+
+    np.testing.assert_allclose(result.equity, expected["equity"])
+    assert result.halted.tolist() == [False, True, True, True]
+    np.testing.assert_allclose(result.positions[1], [0.0, 0.0], atol=1e-9)
+    assert np.all(result.order_qty[2:] == 0.0)
+
+
+def test_orders_and_positions_are_clipped_to_risk_notionals() -> None:
+    portfolio = PortfolioConfig(initial_cash=1_000_000.0)
+    risk = RiskConfig(
+        max_position_notional=20_000.0,
+        max_order_notional=5_000.0,
+        max_daily_loss=1e12,
+        kill_switch=False,
+    )
+    cost = CostModelConfig(fee_bps=0.0, slippage_bps=0.0)
+    prices = np.full((6, 3), 100.0)
+    weights = np.tile([0.5, -0.5, 0.001], (6, 1))
+    days = np.zeros(6, dtype=np.int64)
+
+    result = PortfolioSimulator(portfolio, risk, cost).run(prices, weights, days)
+    notionals = result.order_qty * prices
+
+    assert np.all(np.abs(notionals) <= 5_000.0 + 1e-9)
+    np.testing.assert_allclose(result.positions[-1] * 100.0, [20_000.0, -20_000.0, 1_000.0])
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import logging
+import pstats
+import time
+
+import pytest
+
+from longarc.cli import main
+from longarc.core.profiling import SPAN_LOGGER, Profiler, SpanRecorder, span
+
+
+def test_spans_aggregate_self_time_into_collapsed_stacks(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    with Profiler(collapsed_path=tmp_path / "run.collapsed") as profiler:
+        with span("outer") as outer:
+            outer.rows = 3
+            for _ in range(2):
+                with span("inner") as inner:
+                    inner.bytes = 10
+                    time.sleep(0.002)
+
+    summary = {row["span"]: row for row in profiler.recorder.summary()}
+    assert summary["outer;inner"]["count"] == 2
+    assert summary["outer;inner"]["bytes"] == 20
+    assert summary["outer"]["rows"] == 3
+    assert summary["outer"]["self_ms"] < summary["outer"]["total_ms"]
+    lines = (tmp_path / "run.collapsed").read_text(encoding="utf-8").splitlines()
+    assert {line.rsplit(" ", 1)[0] for line in lines} <= {"outer", "outer;inner"}
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines)
+    assert SpanRecorder().collapsed() == ""
+
+
+def test_span_logs_extras_only_when_enabled(caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.INFO, logger=SPAN_LOGGER.name):
+        with span("quiet"):
+            pass
+    assert not caplog.records
+
+    with caplog.at_level(logging.DEBUG, logger=SPAN_LOGGER.name):
+        with span("store.read", symbol="AAPL") as timing:
+            timing.rows = 5
+    (record,) = caplog.records
+    assert record.__dict__["span"] == "store.read"
+    assert record.__dict__["symbol"] == "AAPL"
+    assert record.__dict__["rows"] == 5
+    assert record.__dict__["duration_ms"] >= 0
+
+
+def test_cli_profile_writes_pstats_and_collapsed(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    stats_path = tmp_path / "download.pstats"
+    collapsed_path = tmp_path / "download.collapsed"
+    args = [
+        "--profile-pstats",
+        str(stats_path),
+        "--profile-collapsed",
+        str(collapsed_path),
+        "data",
+        "download",
+        "--symbols",
+        "AAPL",
+        "--start",
+        "2024-01-01",
+        "--end",
+        "2024-02-01",
+        "--data-path",
+        str(tmp_path / "data"),
+    ]
+
+    assert main(args) == 0
+    assert pstats.Stats(str(stats_path)).total_calls > 0
+    stacks = collapsed_path.read_text(encoding="utf-8")
+    assert "cli.data.download;provider.download;store.write_bars;store.parquet_write " in stacks
+    assert SPAN_LOGGER.level == logging.NOTSET
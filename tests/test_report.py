@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+import shutil
+
+import numpy as np
+import pyarrow as pa  # type: ignore[import-untyped]
+import pytest
+
+from longarc.cli import main
+from longarc.core.config import AppConfig
+from longarc.data.providers.local_parquet import download_symbol
+from longarc.engine.backtest import run_backtest_cached
+from longarc.report.performance import sortino_ratio
+from longarc.report.run_report import (
+    SymbolLedger,
+    build_report,
+    max_drawdown_duration,
+    write_report,
+)
+from longarc.storage.runs import RunStore
+
+
+def _backtest(tmp_path) -> tuple[RunStore, str]:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    for symbol in ("AAPL", "MSFT", "NVDA"):
+        download_symbol(data_path, symbol, "1d", "2024-01-01", "2024-04-30")
+    config = AppConfig.model_validate(
+        {
+            "universe": {"symbols": ["AAPL", "MSFT", "NVDA"], "timeframe": "1d"},
+            "data": {"path": data_path},
+            "strategy": {"name": "sma_cross", "params": {"fast_window": 2, "slow_window": 5}},
+        }
+    )
+    runs = RunStore(tmp_path / "runs")
+    artifacts, _ = run_backtest_cached(config, runs)
+    return runs, artifacts.run_id
+
+
+def test_sortino_and_drawdown_duration() -> None:
+    returns = np.array([0.02, -0.01, 0.03, -0.02])
+    downside = np.sqrt(np.mean(np.array([0.0, 0.01, 0.0, 0.02]) ** 2))
+    assert sortino_ratio(returns, 252.0) == pytest.approx(returns.mean() / downside * np.sqrt(252))
+    assert sortino_ratio(np.array([0.01, 0.02]), 252.0) == 0.0
+    assert max_drawdown_duration(np.array([0.0, -0.1, -0.05, 0.0, -0.01, 0.0])) == 2
+    assert max_drawdown_duration(np.zeros(3)) == 0
+
+
+def test_symbol_ledger_is_batch_size_independent() -> None:
+    batch = pa.record_batch(
+        {
+            "symbol": ["A", "B", "A", "C", "B", "A"],
+            "side": ["buy", "buy", "sell", "buy", "sell", "buy"],
+            "qty": [10.0, 5.0, 4.0, 2.0, 5.0, 1.0],
+            "price": [10.0, 20.0, 12.0, 50.0, 22.0, 11.0],
+            "notional": [100.0, 100.0, 48.0, 100.0, 110.0, 11.0],
+            "fee": [0.1, 0.1, 0.05, 0.1, 0.1, 0.01],
+            "slippage": [0.2, 0.2, 0.1, 0.2, 0.2, 0.02],
+        }
+    )
+    whole = SymbolLedger()
+    whole.add_fills(batch)
+    streamed = SymbolLedger()
+    for offset in range(batch.num_rows):
+        streamed.add_fills(batch.slice(offset, 1))
+
+    assert whole.table().equals(streamed.table())
+    pnl = {row["symbol"]: row["pnl"] for row in whole.table().to_pylist()}
+    assert pnl["B"] == pytest.approx(110.0 - 100.0 - 0.2)
+    assert pnl["A"] == pytest.approx(48.0 - 111.0 - 0.16 + 7.0 * 11.0)
+
+
+def test_report_reconciles_with_run_and_streams_journal(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    runs, run_id = _backtest(tmp_path)
+    stored = runs.load(run_id)
+    report = build_report(runs, run_id)
+
+    metrics = report.metrics
+    assert metrics["fills"] == stored.trades.num_rows > 0
+    assert metrics["total_return"] == pytest.approx(stored.metrics["total_return"])
+    assert metrics["costs"]["fees"] == pytest.approx(stored.metrics["total_fees"])
+    assert metrics["costs"]["slippage"] == pytest.approx(stored.metrics["total_slippage"])
+    assert metrics["costs"]["realized_slippage_bps"] == pytest.approx(2.0, rel=1e-3)
+    assert metrics["symbol_pnl_total"] == pytest.approx(
+        metrics["final_equity"] - metrics["initial_cash"]
+    )
+    assert metrics["turnover"] > 0
+
+    shutil.rmtree(runs.journal_path(run_id))
+    from_trades = build_report(runs, run_id)
+    assert from_trades.metrics["fills"] == metrics["fills"]
+    assert from_trades.metrics["costs"] == metrics["costs"]
+
+
+def test_report_cli_writes_documents_and_metrics(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    runs, run_id = _backtest(tmp_path)
+    runs_path = str(runs.base_path)
+
+    assert main(["report", "--run-id", run_id, "--runs-path", runs_path]) == 0
+    run_dir = runs.run_dir(run_id)
+    html_report = (run_dir / "report.html").read_text(encoding="utf-8")
+    assert "<svg" in html_report and "Sortino" in html_report
+    payload = json.loads((run_dir / "report.json").read_text(encoding="utf-8"))
+    assert {row["symbol"] for row in payload["per_symbol"]} == {"AAPL", "MSFT", "NVDA"}
+
+    args = ["report", "--run-id", run_id, "--runs-path", runs_path, "--format", "markdown"]
+    assert main(args) == 0
+    assert (run_dir / "report.md").read_text(encoding="utf-8").startswith("# Run report")
+    with pytest.raises(ValueError, match="Unsupported report format"):
+        write_report(runs, run_id, fmt="pdf")
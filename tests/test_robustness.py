@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from longarc.cli import main
+from longarc.core.config import AppConfig
+from longarc.data.providers.local_parquet import download_symbol
+from longarc.engine.backtest import run_backtest_cached
+from longarc.engine.robustness import RobustnessSpec, run_robustness
+from longarc.storage.runs import RunArtifacts, RunStore
+
+
+def _run(tmp_path) -> tuple[RunStore, RunArtifacts]:  # type: ignore[no-untyped-def]
+    data_path = str(tmp_path / "data")
+    for symbol in ("AAPL", "MSFT"):
+        download_symbol(data_path, symbol, "1d", "2024-01-01", "2024-03-31")
+    config = AppConfig.model_validate(
+        {
+            "universe": {"symbols": ["AAPL", "MSFT"], "timeframe": "1d"},
+            "data": {"path": data_path},
+            "strategy": {"name": "sma_cross", "params": {"fast_window": 3, "slow_window": 8}},
+        }
+    )
+    runs = RunStore(tmp_path / "runs")
+    artifacts, _ = run_backtest_cached(config, runs)
+    return runs, artifacts
+
+
+def test_robustness_is_seeded_and_independent_of_worker_count(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    _, artifacts = _run(tmp_path)
+    spec = RobustnessSpec(paths=250, block_size=5, slippage_sigma=0.5, seed=42, batch_size=100)
+
+    serial = run_robustness(artifacts, spec, workers=1)
+    parallel = run_robustness(artifacts, spec, workers=2)
+    reseeded = run_robustness(artifacts, RobustnessSpec(paths=250, seed=43), workers=1)
+
+    assert serial.terminal_equity.shape == (250,)
+    np.testing.assert_array_equal(serial.terminal_equity, parallel.terminal_equity)
+    np.testing.assert_array_equal(serial.max_drawdown, parallel.max_drawdown)
+    assert not np.array_equal(serial.terminal_equity, reseeded.terminal_equity)
+    assert np.all(serial.max_drawdown <= 0.0)
+
+
+def test_shuffle_without_slippage_preserves_terminal_equity(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    _, artifacts = _run(tmp_path)
+    result = run_robustness(artifacts, RobustnessSpec(paths=50, method="shuffle"), workers=1)
+
+    final_equity = artifacts.metrics["final_equity"]
+    np.testing.assert_allclose(result.terminal_equity, final_equity, rtol=1e-9)
+    assert result.summary()["max_drawdown"]["p5"] <= artifacts.metrics["max_drawdown"] + 1e-12
+
+
+def test_robustness_spec_rejects_unknown_method() -> None:
+    with pytest.raises(ValueError, match="Unsupported method"):
+        RobustnessSpec(method="unknown")
+
+
+def test_robustness_cli_writes_artifacts(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    runs, artifacts = _run(tmp_path)
+    args = ["robustness", "--run-id", artifacts.run_id, "--runs-path", str(runs.base_path)]
+
+    assert main([*args, "--paths", "100", "--workers", "1"]) == 0
+    assert (artifacts.path / "robustness.parquet").exists()
+    assert (artifacts.path / "robustness.json").exists()